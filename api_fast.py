@@ -6,6 +6,7 @@ Usage::
 """
 
 import asyncio
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 import time
@@ -35,6 +36,12 @@ from src.geocoder.geocoder import Geocoder, POS_CD_SUCCESS
 from src.geocoder.hash.BldAddress import BldAddress
 from src.geocoder.reverse_geocoder import ReverseGeocoder
 from src.geocoder.file.file_geocoder import FileGeocoder
+from src.geocoder.value_layout import (
+    decode_value,
+    encode_value,
+    is_internal_key,
+    is_split,
+)
 from src.pro.updater.daily_updater import DailyUpdater
 from src.pro.updater.entrc_updater import EntrcUpdater
 from src.pro.updater.h1_addr_updater import H1AddrUpdater
@@ -274,6 +281,7 @@ async def geocode(
 김제 온천길 37
 강원 춘천시 남산면 서천리 산111""",
     token: str = "",
+    deadline_ms: Optional[int] = None,
     token_stats: dict = Depends(get_token_stats),
 ):
     """
@@ -283,6 +291,7 @@ async def geocode(
     ### Args:
     * q (str): 하나 이상의 주소를 포함하는 문자열이며, 각 주소는 줄바꿈으로 구분됩니다.
     * token (str): API 토큰 값.
+    * deadline_ms (int, optional): 주소 하나의 검색 제한 시간(ms). 지나면 "검색 시간 초과" 실패.
 
     ### Returns:
     * GeocodeSummary: 지오코딩 결과를 포함하는 요약 정보입니다.
@@ -293,12 +302,13 @@ async def geocode(
     ### Args:
     * q (str): A string containing one or more addresses, separated by newlines.
     * token (str): API Token value.
+    * deadline_ms (int, optional): Search time limit per address (ms). Fails with "검색 시간 초과" when exceeded.
 
     ### Returns:
     * GeocodeSummary: Geocoding results summary.
     """
     addrs = q.split("\n")
-    summary = await ApiHandler().geocode(addrs)
+    summary = await ApiHandler().geocode(addrs, search_deadline_ms(deadline_ms))
 
     if token_stats:
         asyncio.create_task(
@@ -359,6 +369,7 @@ async def batch_geocode(
     request: Request,
     data: Batch_Geocode_Item,
     token: str = "",
+    deadline_ms: Optional[int] = None,
     token_stats: dict = Depends(get_token_stats),
 ):
     """
@@ -368,6 +379,7 @@ async def batch_geocode(
     ### Args:
     * data (Batch_Geocode_Item): 지오코딩할 주소 목록을 포함하는 객체입니다.
     * token (str): API 토큰 값.
+    * deadline_ms (int, optional): 주소 하나의 검색 제한 시간(ms). 지나면 "검색 시간 초과" 실패.
 
     ### Returns:
     * 지오코딩 결과 요약입니다.
@@ -380,6 +392,7 @@ async def batch_geocode(
     ### Args:
     * data (Batch_Geocode_Item): An object containing a list of addresses to geocode.
     * token (str): API Token value.
+    * deadline_ms (int, optional): Search time limit per address (ms). Fails with "검색 시간 초과" when exceeded.
 
     ### Returns:
     * A summary of the geocoding results.
@@ -406,7 +419,7 @@ async def batch_geocode(
     if "quarter" in token_stats:
         addrs = addrs[: token_stats["quarter"]]
 
-    summary = await ApiHandler().geocode(addrs)
+    summary = await ApiHandler().geocode(addrs, search_deadline_ms(deadline_ms))
 
     # # profiler *************************
     # profiler.disable()
@@ -618,6 +631,7 @@ async def geocode_file(
     request: Request,
     data: GeocodeFileItem,
     token: str = "",
+    deadline_ms: Optional[int] = None,
     token_stats: dict = Depends(get_token_stats),
 ):
     """
@@ -628,6 +642,7 @@ async def geocode_file(
     * uploaded_filename(optional): 업로드한 원시 파일의 이름
     * download_dir: 지오코딩된 파일을 저장할 디렉토리입니다.
     * token (str): API 토큰 값.
+    * deadline_ms (int, optional): 주소 하나의 검색 제한 시간(ms). 지나면 "검색 시간 초과" 실패.
 
     ### Returns:
     * 지오코딩 요약 정보입니다.
@@ -639,6 +654,7 @@ async def geocode_file(
     * uploaded_filename(optional): The name of the originally uploaded file
     * download_dir: The directory to save the geocoded file.
     * token (str): API Token value.
+    * deadline_ms (int, optional): Search time limit per address (ms). Fails with "검색 시간 초과" when exceeded.
 
     ### Returns:
     * Geocoding summary information.
@@ -653,6 +669,7 @@ async def geocode_file(
         geocoder=ApiHandler.geocoder,
         reverse_geocoder=ApiHandler.reverse_geocoder,
         address_hint=data.address_hint,
+        deadline_ms=search_deadline_ms(deadline_ms),
     )
     await file_geocoder.prepare(data.filepath, data.uploaded_filename)
     if file_geocoder.address_col == -1:
@@ -695,6 +712,19 @@ async def process_token_stats_and_log(token_stats, summary, request):
     # print(f"Token stats: {token_stats}")
 
 
+def search_deadline_ms(deadline_ms: Optional[int]) -> Optional[int]:
+    """
+    요청의 deadline_ms를 SEARCH_DEADLINE_MAX_MS로 제한합니다.
+    None이면 None (Geocoder가 SEARCH_DEADLINE_MS 사용)
+    """
+    if deadline_ms is None:
+        return None
+    max_ms = config.SEARCH_DEADLINE_MAX_MS
+    if max_ms > 0 and (deadline_ms <= 0 or deadline_ms > max_ms):
+        return max_ms
+    return deadline_ms
+
+
 def calculate_quarter_limit(data, token_stats):
     # DEMO USER의 경우 할당량을 제한합니다.
     quarter = min(token_stats.get("remaining_daily_quota"), data.quarter)
@@ -1821,14 +1851,16 @@ async def delete_jibun_in_pnu():
     k, v = next(iter)
     while k:
         try:
-            jj = json.loads(v.decode())
+            # 레코드 키, 인덱스 키와 조각 목록은 건너뜀 (주소 키, 조각 키에서 레코드를 지움)
+            skip = is_internal_key(k) or is_split(v)
+            jj = [] if skip else decode_value(v, ApiHandler.geocoder.db)
             for j in jj:
                 if "extras" in j:
                     if len(jj) == 1:
                         ApiHandler.geocoder.db._db.delete(k)
                     else:
                         jj.remove(j)
-                        ApiHandler.geocoder.db._db.put(k, json.dumps(jj).encode())
+                        ApiHandler.geocoder.db._db.put(k, encode_value(jj))
 
         except Exception as e:
             print(e, k.decode(), v)
@@ -2319,9 +2351,9 @@ class ApiHandler:
 
         return val
 
-    def _geocode_worker(self, addr: str):
+    def _geocode_worker(self, addr: str, deadline_ms: int = None):
         """개별 주소를 지오코딩하는 작업자 함수"""
-        val = ApiHandler.geocoder.search(addr)
+        val = ApiHandler.geocoder.search(addr, deadline_ms=deadline_ms)
         if not val:
             val = {}
         elif val.get("success") and val.get("x"):
@@ -2337,20 +2369,22 @@ class ApiHandler:
         val["inputaddr"] = addr
         return val
 
-    async def geocode(self, addrs: List[str]):
-        """주소 목록을 병렬로 지오코딩합니다."""
+    async def geocode(self, addrs: List[str], deadline_ms: int = None):
+        """
+        주소 목록을 병렬로 지오코딩합니다.
+        deadline_ms는 주소 하나의 검색 제한 시간입니다. (Geocoder.search)
+        """
         start_time = time.time()
 
         limited_addrs = addrs[:LINES_LIMIT]
+        worker = partial(self._geocode_worker, deadline_ms=deadline_ms)
 
         if self.executor:
             # 스레드 풀을 사용하여 병렬로 지오코딩 작업 수행
-            execute_results = self.executor.map(
-                self._geocode_worker, (addr for addr in limited_addrs)
-            )
+            execute_results = self.executor.map(worker, (addr for addr in limited_addrs))
         else:
             # 스레드 풀이 없으면 동기적으로 실행
-            execute_results = map(self._geocode_worker, limited_addrs)
+            execute_results = map(worker, limited_addrs)
 
         success_count = 0
         hd_success_count = 0
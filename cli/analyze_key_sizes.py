@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+# python cli/analyze_key_sizes.py \
+# --db=/disk/nvme1t/geocoder-api-db/rocks \
+# --top=50 --output=key_sizes.json
+
+import argparse
+import heapq
+import json
+import logging
+import os
+import sys
+import time
+from array import array
+
+# Add the parent directory of 'src' to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import config
+from src.geocoder.db.gimi9_rocks import Gimi9RocksDB
+from src.geocoder.near_index import is_near_index_key
+from src.geocoder.value_layout import (
+    is_record_key,
+    is_shard_key,
+    is_split,
+    record_counts,
+)
+
+"""
+GEOCODE_DB 키별 값 크기(bytes)와 후보 수 분포를 출력합니다.
+
+조회마다 값 전체를 읽고 디코딩하므로 후보가 많은 키가 모호한 주소의 응답 시간을 좌우합니다.
+--min-records 이상인 키를 큰 키로 보고, h1_nm별 조각 키로 나눌 수 있는 키(h1_nm이 둘 이상)와
+나눴을 때 한 번에 읽는 크기(가장 큰 h1_nm 조각 기준)를 추정합니다. (SPLIT_VALUE_MIN_RECORDS)
+
+레코드 키(DEDUP_RECORDS)와 인근 번호 인덱스 키는 분포에서 제외하고 개수만 셉니다.
+조각 목록 키는 개수만 세고, 조각 키는 한 번에 읽는 값이므로 분포에 포함합니다.
+"""
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# 후보 수 구간의 시작 값
+BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+
+
+def bucket_label(i):
+    start = BUCKETS[i]
+    if i + 1 == len(BUCKETS):
+        return f"{start}+"
+    end = BUCKETS[i + 1] - 1
+    return str(start) if start == end else f"{start}-{end}"
+
+
+def bucket_index(records):
+    i = 0
+    while i + 1 < len(BUCKETS) and records >= BUCKETS[i + 1]:
+        i += 1
+    return i
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def analyze(db, min_records=100, top=50):
+    """
+    DB의 모든 값을 읽어 크기 분포를 구합니다. 레코드 id와 조각 키는 조회하지 않습니다.
+
+    Returns:
+        dict: 분석 결과
+    """
+    sizes = array("L")
+    buckets = [[0, 0, 0] for _ in BUCKETS]  # [키 수, bytes, 후보 수]
+    largest = []  # (bytes, 키, 후보 수, h1_nm 수, 가장 큰 h1_nm 조각 후보 수)
+    report = {
+        "keys": 0,
+        "record_keys": 0,
+        "index_keys": 0,
+        "split_keys": 0,
+        "shard_keys": 0,
+        "other_keys": 0,
+        "bytes": 0,
+    }
+    oversized = {"keys": 0, "bytes": 0, "splittable_keys": 0, "split_fetch_bytes": 0}
+
+    for key, value in db:
+        report["keys"] += 1
+        size = len(value.encode("utf-8"))
+
+        if is_record_key(key):
+            report["record_keys"] += 1
+            continue
+        if is_near_index_key(key):
+            report["index_keys"] += 1
+            continue
+        if is_split(value):
+            report["split_keys"] += 1
+            continue
+        if is_shard_key(key):
+            report["shard_keys"] += 1
+
+        try:
+            counts = record_counts(value)
+        except Exception:
+            counts = {}
+        records = sum(counts.values())
+        if not records:
+            report["other_keys"] += 1
+            continue
+
+        report["bytes"] += size
+        sizes.append(size)
+        bucket = buckets[bucket_index(records)]
+        bucket[0] += 1
+        bucket[1] += size
+        bucket[2] += records
+
+        max_part = max(counts.values())
+        if records >= min_records:
+            oversized["keys"] += 1
+            oversized["bytes"] += size
+            if len(counts) > 1:
+                oversized["splittable_keys"] += 1
+            # 나누면 가장 큰 h1_nm 조각만큼 읽음 (후보 크기가 비슷하다고 가정)
+            oversized["split_fetch_bytes"] += size * max_part // records
+
+        if not isinstance(key, str):
+            key = bytes(key).decode("utf-8", errors="replace")
+        item = (size, key, records, len(counts), max_part)
+        if len(largest) < top:
+            heapq.heappush(largest, item)
+        elif item > largest[0]:
+            heapq.heapreplace(largest, item)
+
+        if report["keys"] % 1000000 == 0:
+            logger.info(f"{report['keys']:,} keys")
+
+    sorted_sizes = sorted(sizes)
+    report["value_bytes"] = {
+        "p50": percentile(sorted_sizes, 0.5),
+        "p90": percentile(sorted_sizes, 0.9),
+        "p99": percentile(sorted_sizes, 0.99),
+        "p999": percentile(sorted_sizes, 0.999),
+        "max": sorted_sizes[-1] if sorted_sizes else 0,
+    }
+    report["distribution"] = [
+        {"records": bucket_label(i), "keys": n, "bytes": b, "candidates": c}
+        for i, (n, b, c) in enumerate(buckets)
+        if n
+    ]
+    oversized["min_records"] = min_records
+    report["oversized"] = oversized
+    report["largest"] = [
+        {
+            "key": key,
+            "bytes": size,
+            "records": records,
+            "h1_nms": h1_count,
+            "max_h1_records": max_part,
+        }
+        for size, key, records, h1_count, max_part in sorted(largest, reverse=True)
+    ]
+    return report
+
+
+def print_report(report):
+    total_keys = sum(b["keys"] for b in report["distribution"]) or 1
+    total_bytes = report["bytes"] or 1
+
+    logger.info(
+        f"keys: {report['keys']:,} (record keys {report['record_keys']:,}, "
+        f"index keys {report['index_keys']:,}, "
+        f"split keys {report['split_keys']:,}, shard keys {report['shard_keys']:,}, "
+        f"other {report['other_keys']:,})"
+    )
+    logger.info(f"value bytes: {json.dumps(report['value_bytes'])}")
+
+    logger.info(f"{'records':>9} {'keys':>12} {'keys%':>7} {'bytes%':>7}")
+    for b in report["distribution"]:
+        logger.info(
+            f"{b['records']:>9} {b['keys']:>12,} {b['keys'] / total_keys:>7.2%} "
+            f"{b['bytes'] / total_bytes:>7.2%}"
+        )
+
+    o = report["oversized"]
+    logger.info(
+        f"oversized (>= {o['min_records']} records): {o['keys']:,} keys, "
+        f"{o['bytes']:,} bytes, splittable by h1_nm {o['splittable_keys']:,} keys, "
+        f"bytes per probe after split ~{o['split_fetch_bytes'] / (o['bytes'] or 1):.1%}"
+    )
+
+    logger.info(f"largest {len(report['largest'])} keys:")
+    for item in report["largest"]:
+        logger.info(
+            f"{item['bytes']:>10,} bytes {item['records']:>6,} records "
+            f"{item['h1_nms']:>3} h1_nm (max {item['max_h1_records']:,}) {item['key']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEOCODE_DB 키 크기 분포 분석")
+    parser.add_argument(
+        "--db", default=config.GEOCODE_DB, help="RocksDB 경로 (default: GEOCODE_DB)"
+    )
+    parser.add_argument(
+        "--min-records",
+        type=int,
+        default=config.SPLIT_VALUE_MIN_RECORDS or 100,
+        help="큰 키로 볼 후보 수 (default: SPLIT_VALUE_MIN_RECORDS)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=50, help="출력할 큰 키 개수 (default: 50)"
+    )
+    parser.add_argument("--output", default=None, help="분석 결과 JSON 파일 경로")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"Error: Database {args.db} does not exist")
+        return 1
+
+    try:
+        start_time = time.time()
+        db = Gimi9RocksDB(args.db, read_only=True)
+
+        logger.info(f"Analyzing key sizes: {args.db}")
+        report = analyze(db, min_records=args.min_records, top=args.top)
+        db.close()
+
+        report["elapsed_time"] = time.time() - start_time
+        print_report(report)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            logger.info(f"Report saved to {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
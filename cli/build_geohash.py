@@ -24,6 +24,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.geocoder.db.gimi9_rocks import Gimi9RocksDB
+from src.geocoder.db.value_codec import decode
 from shapely.geometry import box, MultiPolygon
 from shapely.validation import make_valid
 from tqdm import tqdm
@@ -188,7 +189,7 @@ def process_region_to_rocksdb(shp_file, db_path, yyyymm, batch_size=1000):
 
             attr_dict["wkt"] = geom.wkt
             attr_dict["yyyymm"] = yyyymm
-            db.put(key.encode(), json.dumps(attr_dict).encode())
+            db.put_obj(key.encode(), attr_dict)
 
             # stats["total_geohashes"] += 1
             batch_count += 1
@@ -285,14 +286,14 @@ def process_shapefile_to_rocksdb(shp_file, db_path, depth, key_prefix, batch_siz
                 # 기존 값이 있는지 확인
                 existing_value = db.get(key.encode())
                 if existing_value:
-                    existing_data = json.loads(existing_value)
+                    existing_data = decode(existing_value)
                     if isinstance(existing_data, list):
                         existing_data.append(attr_dict)
                     else:
                         existing_data = [existing_data, attr_dict]
-                    db.put(key.encode(), json.dumps(existing_data).encode())
+                    db.put_obj(key.encode(), existing_data)
                 else:
-                    db.put(key.encode(), json.dumps(attr_dict).encode())
+                    db.put_obj(key.encode(), attr_dict)
 
                 stats["total_geohashes"] += 1
                 batch_count += 1
@@ -331,7 +332,7 @@ def process_shapefile_to_rocksdb(shp_file, db_path, depth, key_prefix, batch_siz
                     # 기존 값이 있는지 확인
                     existing_value = db.get(key.encode())
                     if existing_value:
-                        existing_data = json.loads(existing_value)
+                        existing_data = decode(existing_value)
 
                         # 기존 값과 병합
                         equal_data = get_equal_data(existing_data, attr_dict)
@@ -345,9 +346,9 @@ def process_shapefile_to_rocksdb(shp_file, db_path, depth, key_prefix, batch_siz
                         else:
                             existing_data = [existing_data, attr_dict]
 
-                        db.put(key.encode(), json.dumps(existing_data).encode())
+                        db.put_obj(key.encode(), existing_data)
                     else:
-                        db.put(key.encode(), json.dumps([attr_dict]).encode())
+                        db.put_obj(key.encode(), [attr_dict])
 
                     stats["total_geohashes"] += 1
                     batch_count += 1
@@ -371,7 +372,7 @@ def process_shapefile_to_rocksdb(shp_file, db_path, depth, key_prefix, batch_siz
         }
 
         # 메타데이터 저장
-        db.put(b"__metadata__", json.dumps(metadata).encode())
+        db.put_obj(b"__metadata__", metadata)
 
         logger.info(f"Processed {stats['processed_features']} features")
         logger.info(f"Generated {stats['total_geohashes']} geohashes")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# python cli/build_key_bloom.py \
+# --db=/disk/nvme1t/geocoder-api-db/rocks \
+# --output=/disk/nvme1t/geocoder-api-db/rocks.bloom \
+# --fpr=0.01
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the parent directory of 'src' to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import config
+from src.geocoder.db.gimi9_rocks import Gimi9RocksDB
+from src.geocoder.db.key_bloom import build_key_bloom
+
+"""
+GEOCODE_DB 전체 키로 bloom filter를 만듭니다.
+
+키 개수를 세는 순회와 비트를 설정하는 순회, 두 번 DB를 읽습니다.
+필터에는 빌드 시점의 DB sequence number가 기록되며,
+서버는 DB와 sequence number가 같을 때만 필터를 사용합니다.
+DB를 교체하거나 업데이트한 뒤에는 다시 빌드해야 합니다.
+"""
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEOCODE_DB 키 bloom filter 생성")
+    parser.add_argument(
+        "--db", default=config.GEOCODE_DB, help="RocksDB 경로 (default: GEOCODE_DB)"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="bloom filter 파일 경로 (default: GEOCODE_BLOOM_FILTER 또는 {db}.bloom)",
+    )
+    parser.add_argument(
+        "--fpr",
+        type=float,
+        default=config.GEOCODE_BLOOM_FPR,
+        help="목표 false positive rate (default: GEOCODE_BLOOM_FPR)",
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"Error: Database {args.db} does not exist")
+        return 1
+
+    output = args.output
+    if not output:
+        if args.db == config.GEOCODE_DB:
+            output = config.GEOCODE_BLOOM_FILTER
+        else:
+            output = f"{args.db}.bloom"
+
+    try:
+        start_time = time.time()
+        db = Gimi9RocksDB(args.db, read_only=True)
+        db_sequence = db.latest_sequence_number()
+
+        logger.info(f"Counting keys: {args.db}")
+        num_keys = sum(1 for _ in db.iter_keys())
+        logger.info(f"{num_keys:,} keys")
+
+        stats = build_key_bloom(
+            db.iter_keys(), num_keys, output, fpr=args.fpr, db_sequence=db_sequence
+        )
+        db.close()
+
+        stats["db_sequence"] = db_sequence
+        stats["elapsed_time"] = time.time() - start_time
+        logger.info(json.dumps(stats, ensure_ascii=False))
+        logger.info(f"Bloom filter saved to {output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+# python cli/build_near_index.py \
+# --db=/disk/nvme1t/geocoder-api-db/rocks [--drop]
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the parent directory of 'src' to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import config
+from src.geocoder.db.gimi9_rocks import Gimi9RocksDB, WriteBatch
+from src.geocoder.near_index import (
+    NEAR_INDEX_MARKER,
+    is_near_index_key,
+    near_index_key,
+)
+from src.geocoder.value_layout import is_internal_key, is_shard_key
+
+"""
+GEOCODE_DB 주소 키로 인근 번호 인덱스를 만듭니다. (src/geocoder/near_index.py)
+
+번호로 끝나는 주소 키마다 인덱스 키를 저장하고, 마지막에 NEAR_INDEX_MARKER 키에 빌드 통계를 저장합니다.
+서버는 NEAR_INDEX_MARKER가 있는 DB에서만 인덱스를 사용하므로 빌드 중인 DB는 기존 방식으로 조회합니다.
+--drop이면 인덱스 키와 NEAR_INDEX_MARKER를 모두 삭제합니다.
+(주소 키를 지운 뒤 남은 인덱스 키는 조회 실패 hash가 될 뿐이지만, 정리하려면 --drop 후 다시 빌드)
+
+DB sequence number가 바뀌므로 빌드 후 cli/build_key_bloom.py로 bloom filter를 다시 만들어야 합니다.
+"""
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def build(db, batch_size=10000):
+    """
+    DB의 모든 주소 키로 인덱스 키를 저장합니다.
+
+    Returns:
+        dict: 빌드 통계
+    """
+    stats = {"keys": 0, "indexed": 0, "skipped": 0}
+
+    batch = WriteBatch()
+    pending = 0
+    try:
+        for key in db.iter_keys():
+            stats["keys"] += 1
+            if is_internal_key(key) or is_shard_key(key):
+                continue
+
+            index_key = near_index_key(key)
+            if index_key is None:
+                stats["skipped"] += 1
+                continue
+
+            batch.put(index_key, b"")
+            stats["indexed"] += 1
+            pending += 1
+            if pending >= batch_size:
+                db.write_batch(batch)
+                batch.clear()
+                pending = 0
+
+            if stats["keys"] % 1000000 == 0:
+                logger.info(f"{stats['keys']:,} keys, {stats['indexed']:,} indexed")
+
+        if pending:
+            db.write_batch(batch)
+    finally:
+        batch.destroy()
+
+    stats["built_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    db.put(NEAR_INDEX_MARKER, json.dumps(stats))
+    return stats
+
+
+def drop(db, batch_size=10000):
+    """
+    인덱스 키와 NEAR_INDEX_MARKER를 삭제합니다.
+
+    Returns:
+        dict: 삭제 통계
+    """
+    stats = {"deleted": 0}
+
+    # 서버가 인덱스를 먼저 쓰지 않도록 표시부터 삭제
+    db.delete(NEAR_INDEX_MARKER)
+
+    batch = WriteBatch()
+    pending = 0
+    try:
+        for key in db.iter_keys():
+            if not is_near_index_key(key):
+                continue
+            batch.delete(key)
+            stats["deleted"] += 1
+            pending += 1
+            if pending >= batch_size:
+                db.write_batch(batch)
+                batch.clear()
+                pending = 0
+
+        if pending:
+            db.write_batch(batch)
+    finally:
+        batch.destroy()
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEOCODE_DB 인근 번호 인덱스 생성")
+    parser.add_argument(
+        "--db", default=config.GEOCODE_DB, help="RocksDB 경로 (default: GEOCODE_DB)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10000, help="WriteBatch 크기 (default: 10000)"
+    )
+    parser.add_argument(
+        "--drop", action="store_true", help="인덱스 키와 NEAR_INDEX_MARKER 삭제"
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"Error: Database {args.db} does not exist")
+        return 1
+
+    try:
+        start_time = time.time()
+        db = Gimi9RocksDB(args.db, read_only=False, create_if_missing=False)
+
+        if args.drop:
+            logger.info(f"Dropping near number index: {args.db}")
+            stats = drop(db, batch_size=args.batch_size)
+        else:
+            logger.info(f"Building near number index: {args.db}")
+            stats = build(db, batch_size=args.batch_size)
+        db.flush()
+        db.close()
+
+        stats["elapsed_time"] = time.time() - start_time
+        logger.info(json.dumps(stats, ensure_ascii=False))
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.geocoder.db.gimi9_rocks import Gimi9RocksDB
+from src.geocoder.db.value_codec import decode
 
 from tqdm import tqdm
 import sys
@@ -186,7 +187,7 @@ def merge_geohash_dbs(base_db_path, input_db_paths):
             # it = input_db.iterkeys()
             # it.seek_to_first()
             # key_count = sum(1 for _ in it)
-            key_count = json.loads(input_db.get(b"__metadata__").decode()).get(
+            key_count = input_db.get_obj(b"__metadata__").get(
                 "count", 0
             )
 
@@ -215,7 +216,7 @@ def merge_geohash_dbs(base_db_path, input_db_paths):
                 if not value_bytes:
                     continue
 
-                new_data = json.loads(value_bytes)
+                new_data = decode(value_bytes)
                 input_yyyymm = input_path.split("/")[-4]  # 예: 202305
                 update_yyymm(new_data, input_yyyymm)
 
@@ -224,13 +225,13 @@ def merge_geohash_dbs(base_db_path, input_db_paths):
 
                 if not base_value_bytes:
                     # 기본 DB에 해당 키가 없으면 그대로 추가
-                    base_db.put(key_bytes, json.dumps(new_data).encode())
+                    base_db.put_obj(key_bytes, new_data)
                     stats["new_keys_added"] += 1
                 else:
                     # 기존 데이터와 병합
-                    existing_data = json.loads(base_value_bytes)
+                    existing_data = decode(base_value_bytes)
                     merged_data = merge_data(existing_data, new_data)
-                    base_db.put(key_bytes, json.dumps(merged_data).encode())
+                    base_db.put_obj(key_bytes, merged_data)
                     stats["updated_keys"] += 1
 
                 # batch_count += 1
@@ -325,8 +326,8 @@ def update_metadata(base_db: Gimi9RocksDB, input_db):
         input_metadata_bytes = input_db.get(b"__metadata__")
 
         if base_metadata_bytes and input_metadata_bytes:
-            base_metadata = json.loads(base_metadata_bytes)
-            input_metadata = json.loads(input_metadata_bytes)
+            base_metadata = decode(base_metadata_bytes)
+            input_metadata = decode(input_metadata_bytes)
 
             # 메타데이터 병합
             merged_metadata = base_metadata.copy()
@@ -360,7 +361,7 @@ def update_metadata(base_db: Gimi9RocksDB, input_db):
             #     merged_metadata["source_dbs"].append(input_path)
 
             # 메타데이터 저장
-            base_db.put(b"__metadata__", json.dumps(merged_metadata).encode())
+            base_db.put_obj(b"__metadata__", merged_metadata)
 
         elif input_metadata_bytes:
             # 기본 DB에 메타데이터가 없는 경우 입력 DB의 메타데이터 사용
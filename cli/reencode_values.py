@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+# python cli/reencode_values.py \
+# --db=/disk/nvme1t/geocoder-api-db/rocks \
+# --codec=compact --layout [--dedup]
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the parent directory of 'src' to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import config
+from src.geocoder.db.gimi9_rocks import Gimi9RocksDB, WriteBatch
+from src.geocoder.db.value_codec import CODECS, decode, get_codec
+from src.geocoder.value_layout import (
+    RecordWriter,
+    SplitValue,
+    decode_value,
+    encode_values,
+    is_shard_key,
+    is_split,
+)
+
+"""
+DB의 JSON 값을 다른 codec으로 다시 인코딩합니다. (db/value_codec.py)
+
+서버는 값의 format byte로 codec을 구분하므로 변환 중이거나 변환 전인 DB도 읽을 수 있습니다.
+JSON이 아닌 값(WKT 문자열 등)과 리스트, dict가 아닌 값은 그대로 둡니다.
+--layout이면 GEOCODE_DB 후보 리스트를 value_layout 형식(h1_nm별로 나누고 정렬)으로 다시 저장합니다.
+--layout --dedup이면 레코드는 레코드 키에 한 번만 저장하고 후보 리스트에는 레코드 id를 저장합니다. (DEDUP_RECORDS)
+--dedup 없이 --layout이면 레코드 id를 레코드로 바꿔 저장합니다. (기존 레코드 키는 남음)
+--layout이면 큰 후보 리스트는 SPLIT_VALUE_MIN_RECORDS에 따라 h1_nm별 조각 키로 나누거나 다시 합칩니다.
+
+DB sequence number가 바뀌므로 GEOCODE_DB는 변환 후 cli/build_key_bloom.py로 bloom filter를 다시 만들어야 합니다.
+"""
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+class _DryRunDb:
+    """--dry-run에서 레코드를 저장하지 않음"""
+
+    def put(self, key, value):
+        pass
+
+
+def reencode(db, codec, layout=False, batch_size=10000, dry_run=False, dedup=False):
+    """
+    DB의 모든 값을 codec으로 다시 인코딩합니다.
+
+    Returns:
+        dict: 변환 통계
+    """
+    stats = {
+        "keys": 0,
+        "changed": 0,
+        "skipped": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+
+    batch = WriteBatch()
+    pending = 0
+
+    put_record = None
+    if layout and dedup:
+        writer = RecordWriter(_DryRunDb() if dry_run else db, codec)
+        put_record = lambda record: writer.put(record, None if dry_run else batch)
+    try:
+        for key, value in db:
+            stats["keys"] += 1
+            old = value.encode("utf-8")
+            stats["bytes_before"] += len(old)
+
+            if layout and is_shard_key(key):
+                # 조각 키는 조각 목록 키에서 다시 저장
+                continue
+
+            try:
+                obj = decode_value(value, db) if layout else decode(value)
+            except Exception:
+                obj = None
+
+            if not isinstance(obj, (list, dict)):
+                stats["skipped"] += 1
+                stats["bytes_after"] += len(old)
+                continue
+
+            if layout and isinstance(obj, list):
+                items = encode_values(key, obj, codec, put_record)
+            else:
+                items = [(key, codec.encode(obj))]
+            stats["bytes_after"] += sum(len(new) for _, new in items)
+
+            # 더 이상 쓰지 않는 조각 키
+            stale = []
+            if layout and is_split(value):
+                new_keys = {put_key for put_key, _ in items}
+                stale = [k for k in SplitValue(value).shard_keys() if k not in new_keys]
+
+            if len(items) == 1 and items[0][1] == old and not stale:
+                continue
+            stats["changed"] += 1
+            if dry_run:
+                continue
+
+            for put_key, new in items:
+                batch.put(put_key, new)
+            for stale_key in stale:
+                batch.delete(stale_key)
+            pending += 1
+            if pending >= batch_size:
+                db.write_batch(batch)
+                batch.clear()
+                pending = 0
+
+            if stats["keys"] % 1000000 == 0:
+                logger.info(f"{stats['keys']:,} keys, {stats['changed']:,} changed")
+
+        if pending:
+            db.write_batch(batch)
+    finally:
+        batch.destroy()
+
+    if put_record is not None:
+        stats["records"] = writer.written
+        stats["bytes_after"] += writer.written_bytes
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 값 codec 변환")
+    parser.add_argument(
+        "--db", default=config.GEOCODE_DB, help="RocksDB 경로 (default: GEOCODE_DB)"
+    )
+    parser.add_argument(
+        "--codec",
+        default=config.VALUE_CODEC,
+        choices=list(CODECS),
+        help="변환할 codec (default: VALUE_CODEC)",
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="후보 리스트를 value_layout 형식으로 저장 (GEOCODE_DB)",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="--layout에서 레코드를 레코드 키에 한 번만 저장 (DEDUP_RECORDS)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10000, help="WriteBatch 크기 (default: 10000)"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="저장하지 않고 크기 변화만 출력"
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        logger.error(f"Error: Database {args.db} does not exist")
+        return 1
+
+    try:
+        start_time = time.time()
+        codec = get_codec(args.codec)
+        db = Gimi9RocksDB(
+            args.db, read_only=args.dry_run, create_if_missing=False, codec=args.codec
+        )
+
+        logger.info(f"Re-encoding values: {args.db} ({args.codec})")
+        stats = reencode(
+            db,
+            codec,
+            layout=args.layout,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            dedup=args.dedup,
+        )
+        if not args.dry_run:
+            db.flush()
+        db.close()
+
+        stats["elapsed_time"] = time.time() - start_time
+        logger.info(json.dumps(stats, ensure_ascii=False))
+        if stats["bytes_before"]:
+            ratio = stats["bytes_after"] / stats["bytes_before"]
+            logger.info(f"Value size: {ratio:.1%} of original")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
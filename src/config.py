@@ -19,6 +19,88 @@ FULL_HISTORY_LIST = env.bool("FULL_HISTORY_LIST", False)
 HD_HISTORY_START_YYYYMM = env("HD_HISTORY_START_YYYYMM", "202305")
 HD_HISTORY_END_YYYYMM = env("HD_HISTORY_END_YYYYMM", "202504")
 USE_HASH_CACHE = env.bool("USE_HASH_CACHE", True)
+# Hasher.addressHash 캐시 (주소 문자열 -> hash, 토큰). 항목 수, shard(락) 개수
+HASH_CACHE_SIZE = env.int("HASH_CACHE_SIZE", 100000)
+HASH_CACHE_SHARDS = env.int("HASH_CACHE_SHARDS", 16)
+# GEOCODE_DB 키 bloom filter (cli/build_key_bloom.py로 생성). READONLY 모드에서만 사용
+USE_KEY_BLOOM_FILTER = env.bool("USE_KEY_BLOOM_FILTER", True)
+GEOCODE_BLOOM_FILTER = env("GEOCODE_BLOOM_FILTER", f"{GEOCODE_DB}.bloom")
+GEOCODE_BLOOM_FPR = env.float("GEOCODE_BLOOM_FPR", 0.01)
+# Geocoder.search 결과 캐시 (입력 주소 캐시, 정규화 hash 캐시). 크기는 각각 bytes
+USE_RESULT_CACHE = env.bool("USE_RESULT_CACHE", True)
+RESULT_CACHE_MAX_BYTES = env.int("RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+HASH_RESULT_CACHE_MAX_BYTES = env.int("HASH_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+RESULT_CACHE_TTL = env.int("RESULT_CACHE_TTL", 24 * 60 * 60)
+# DB 키별 디코딩한 후보 리스트 캐시 크기 (원본 JSON bytes 기준)
+DECODED_VALUE_CACHE_MAX_BYTES = env.int(
+    "DECODED_VALUE_CACHE_MAX_BYTES", 128 * 1024 * 1024
+)
+# DB 빌드(updater) 시 후보 리스트를 h1_nm별로 나누고 정렬해서 저장 (value_layout v2). False이면 기존 JSON 리스트
+PARTITIONED_VALUES = env.bool("PARTITIONED_VALUES", True)
+# DB에 JSON 값을 저장할 때 사용하는 codec: compact(기본, 공백 없는 UTF-8 JSON), json(기존 형식)
+# 읽을 때는 값의 format byte로 구분하므로 기존 값도 읽음 (cli/reencode_values.py로 변환)
+VALUE_CODEC = env("VALUE_CODEC", "compact")
+# DB 빌드(updater) 시 레코드는 레코드 키에 한 번만 저장하고 주소 키에는 레코드 id를 저장 (value_layout 레코드 참조)
+# 조회마다 레코드 키를 한 번 더 multi_get하므로 기본값은 False. 읽을 때는 두 형식 모두 읽음
+DEDUP_RECORDS = env.bool("DEDUP_RECORDS", False)
+# DB 빌드(updater) 시 후보가 이 개수 이상이고 h1_nm이 둘 이상인 키는 h1_nm별 조각 키로 나눠 저장. 0이면 나누지 않음
+# 조회할 때는 입력 주소의 h1_nm 조각만 읽음 (키 크기 분포는 cli/analyze_key_sizes.py)
+SPLIT_VALUE_MIN_RECORDS = env.int("SPLIT_VALUE_MIN_RECORDS", 100)
+# DB 빌드(updater) 시 별칭 키 추가. 지하 도로명 주소는 "지하"를 뺀 키(같은 키에 지상 주소가 없을 때만),
+# 여러 건물명을 합친 건물은 건물명마다 건물명 키. 같은 레코드를 저장하므로 DEDUP_RECORDS이면 레코드 id만 추가됨
+ALIAS_KEYS = env.bool("ALIAS_KEYS", True)
+# 인근 지번, 건물번호를 번호를 추정한 hash 대신 인근 번호 인덱스(cli/build_near_index.py)에서 찾음. 인덱스가 없는 DB는 기존 방식
+NEAR_INDEX = env.bool("NEAR_INDEX", True)
+# 인근 번호 인덱스에서 찾을 인근 번호 개수
+NEAR_INDEX_LIMIT = env.int("NEAR_INDEX_LIMIT", 6)
+# Geocoder.search에서 한 번의 multi_get으로 조회할 후보 hash 개수 (1 이하이면 하나씩 조회)
+SEARCH_PROBE_BATCH_SIZE = env.int("SEARCH_PROBE_BATCH_SIZE", 8)
+# possible_hashs 후보 종류별 성공률을 기록하고, 같은 요청에서 이미 조회한 후보는 다시 조회하지 않음 (probe_planner)
+PROBE_PLANNER = env.bool("PROBE_PLANNER", True)
+# 조회가 PROBE_PRUNE_MIN_ATTEMPTS 이상이고 성공률이 이 값 미만인 후보 종류는 건너뜀. 0이면 건너뛰지 않음 (기본)
+# 건너뛴 후보에서만 찾을 수 있는 주소는 검색에 실패할 수 있으므로 통계를 확인한 뒤 설정 (예: 0.0005)
+PROBE_PRUNE_MIN_HIT_RATE = env.float("PROBE_PRUNE_MIN_HIT_RATE", 0)
+PROBE_PRUNE_MIN_ATTEMPTS = env.int("PROBE_PRUNE_MIN_ATTEMPTS", 10000)
+# 건너뛰는 후보 종류도 이 횟수마다 한 번은 조회해 성공률을 갱신
+PROBE_EXPLORE_INTERVAL = env.int("PROBE_EXPLORE_INTERVAL", 100)
+# 후보 종류별 통계 파일. 시작할 때 읽고 PROBE_STATS_SAVE_INTERVAL(초)마다 저장. 빈 값이면 저장 안 함 (기본)
+# 여러 worker 프로세스가 저장하면 서로 덮어쓰므로 "{pid}"를 넣어 프로세스별 파일 사용 (예: /data/probe_stats.{pid}.json)
+PROBE_STATS_FILE = env("PROBE_STATS_FILE", "")
+PROBE_STATS_SAVE_INTERVAL = env.int("PROBE_STATS_SAVE_INTERVAL", 300)
+# 주소 하나의 검색 제한 시간(ms)과 최대 후보 조회 수. 넘으면 DEADLINE_EXCEEDED 오류로 끝냄. 0이면 제한 없음
+SEARCH_DEADLINE_MS = env.int("SEARCH_DEADLINE_MS", 0)
+SEARCH_MAX_PROBES = env.int("SEARCH_MAX_PROBES", 0)
+# API 요청의 deadline_ms 최대값. 0이면 제한 없음 (deadline_ms=0 요청도 이 값으로 제한)
+SEARCH_DEADLINE_MAX_MS = env.int("SEARCH_DEADLINE_MAX_MS", 0)
+# 건물명 유사도 계산 방식: indel(기본), levenshtein, jamo_jaccard, sequence(기존 SequenceMatcher)
+BLD_NAME_SCORER = env("BLD_NAME_SCORER", "indel")
+# 행정구역명, 도로명 사전으로 붙여 쓴 주소 분리 (Tokenizer). 사전 automaton은 GAZETTEER_CACHE에 저장
+USE_GAZETTEER = env.bool("USE_GAZETTEER", False)
+GAZETTEER_CACHE = env("GAZETTEER_CACHE", f"{CODE_DATA_DIR}/gazetteer.pickle")
+# 광역시도 또는 전국에서 유일한 도로명이면 시군구명 누락, 오타를 도로명 색인(TN_SPRD_RDNM.txt)으로 교정. 색인은 ROAD_NAME_INDEX_CACHE에 저장
+USE_ROAD_NAME_INDEX = env.bool("USE_ROAD_NAME_INDEX", True)
+ROAD_NAME_INDEX_CACHE = env(
+    "ROAD_NAME_INDEX_CACHE", f"{CODE_DATA_DIR}/road_name_index.pickle"
+)
+# HSimplifier(h23Hash, h4Hash), BldSimplifier 결과 memo 항목 수 (넘으면 비움)
+SIMPLIFIER_MEMO_SIZE = env.int("SIMPLIFIER_MEMO_SIZE", 65536)
+
+# RocksDB 옵션 프로파일
+# 블록 캐시는 geocode, reverse, hd_history, bigcache DB가 함께 사용하는 공유 LRU 캐시 (bytes)
+ROCKSDB_BLOCK_CACHE_SIZE = env.int("ROCKSDB_BLOCK_CACHE_SIZE", 2 * 1024 * 1024 * 1024)
+ROCKSDB_BLOCK_SIZE = env.int("ROCKSDB_BLOCK_SIZE", 16 * 1024)
+# 0이면 bloom filter 사용 안 함. SST 파일이 새로 만들어질 때(빌드, 컴팩션) 적용됨
+ROCKSDB_BLOOM_BITS_PER_KEY = env.int("ROCKSDB_BLOOM_BITS_PER_KEY", 10)
+ROCKSDB_PIN_L0_FILTER_AND_INDEX = env.bool("ROCKSDB_PIN_L0_FILTER_AND_INDEX", True)
+ROCKSDB_MAX_OPEN_FILES = env.int("ROCKSDB_MAX_OPEN_FILES", -1)
+# 전체 순회(iterator) 시 read-ahead 크기 (bytes)
+ROCKSDB_READAHEAD_SIZE = env.int("ROCKSDB_READAHEAD_SIZE", 2 * 1024 * 1024)
+# DB 역할별 프로파일: serving | write | none
+ROCKSDB_GEOCODE_PROFILE = env("ROCKSDB_GEOCODE_PROFILE", "serving")
+ROCKSDB_REVERSE_PROFILE = env("ROCKSDB_REVERSE_PROFILE", "serving")
+ROCKSDB_HD_HISTORY_PROFILE = env("ROCKSDB_HD_HISTORY_PROFILE", "serving")
+ROCKSDB_BIGCACHE_PROFILE = env("ROCKSDB_BIGCACHE_PROFILE", "write")
+ROCKSDB_DEFAULT_PROFILE = env("ROCKSDB_DEFAULT_PROFILE", "write")
 
 DATABASE_NAME = env("DATABASE_NAME", "geocode")
 DATABASE_USER = env("DATABASE_USER")
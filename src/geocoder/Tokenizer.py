@@ -4,6 +4,8 @@ import sys
 from src import config
 from .tokens import *
 from .util.HSimplifier import HSimplifier
+from .util.gazetteer import get_gazetteer
+from .util.prefix_trie import PrefixTrie
 
 
 class Tokenizer:
@@ -35,7 +37,9 @@ class Tokenizer:
         re_층 (re.Pattern): 층 정보를 추출하기 위한 정규 표현식.
         re_건물호 (re.Pattern): 건물 호수를 추출하기 위한 정규 표현식.
         h1Prefix (list): H1 접두사를 정렬한 리스트.
+        h1PrefixTrie (PrefixTrie): h1Prefix의 trie. 가장 긴 접두사를 한 번에 찾음.
         h23Prefix (list): H2와 H3 접두사를 정렬한 리스트.
+        re_h23Prefix (re.Pattern): h23Prefix를 순서대로 합친 정규 표현식.
         __h3 (dict): H3 정보를 담고 있는 딕셔너리.
         re_dong_읍면동 (re.Pattern): 읍, 면, 동 정보를 추출하기 위한 정규 표현식.
         re_dong_1동 (re.Pattern): '1동' 정보를 추출하기 위한 정규 표현식.
@@ -48,6 +52,7 @@ class Tokenizer:
         re_dong_6자동 (re.Pattern): '6자동' 정보를 추출하기 위한 정규 표현식.
         re_dong_종로1234가동 (re.Pattern): '종로1234가동' 정보를 추출하기 위한 정규 표현식.
         h4Prefix (list): H4 접두사를 정렬한 리스트.
+        re_h4Prefix (re.Pattern): h4Prefix를 순서대로 합친 정규 표현식.
         re_n동 (re.Pattern): 'n동' 정보를 추출하기 위한 정규 표현식.
         hd2ch (set): 동 정보를 담고 있는 집합.
         re_road_이름1길 (re.Pattern): 도로명 정보를 추출하기 위한 정규 표현식.
@@ -63,8 +68,12 @@ class Tokenizer:
         re_address_in_quote (re.Pattern): 주소 문자열을 따옴표로 둘러싼 경우를 처리하기 위한 정규 표현식.
 
         roadPrefix (list): 도로명 접두사를 정렬한 리스트.
+        re_roadPrefix (re.Pattern): roadPrefix를 순서대로 합친 정규 표현식.
+        re_bunjihead (re.Pattern): 지번 헤드 정규 표현식(re_bunjihead_*)을 순서대로 합친 정규 표현식.
         numRoadPatterns (set): 숫자로 시작하는 도로명 패턴을 담고 있는 리스트.
+        numRoadTrie (PrefixTrie): numRoadPatterns의 trie.
         road_like_h4 (set): 도로명처럼 보이지만 행정동 또는 법정동명 리스트.
+        gazetteer (Gazetteer): 붙여 쓴 행정구역명, 도로명 분리. USE_GAZETTEER=False이면 None.
 
 
     Methods:
@@ -116,6 +125,17 @@ class Tokenizer:
         self.re_bunjihead_n_n_호 = re.compile(r"^산?\d+-\d+호")  # 1013-6호
         self.re_bunjihead_n_호 = re.compile(r"^산?\d+호")  # 6호
         self.re_bunjihead_n_번지 = re.compile(r"^산?\d+번지")  # 1번지
+        self.re_bunjihead = combine_prefix_patterns(
+            [
+                self.re_bunjihead_n_n_bng,  # 1-2(번지)
+                self.re_bunjihead_n_의_n,  # 1의2(번지)
+                self.re_bunjihead_번지_호,  # 1번지2(호)
+                self.re_bunjihead_n_n_호,  # 1013-6호
+                self.re_bunjihead_n_호,  # 6호
+                self.re_bunjihead_n_번지,  # 1번지
+            ]
+        )
+        self.re_num_str = re.compile(r"^(\d+)(\S+)$")
 
         # 붙은 지하
         self.re_지하건번 = re.compile(r"^(지하)\d")  # 지하130
@@ -128,6 +148,8 @@ class Tokenizer:
         self.re_건물호 = re.compile(r"^(B-?)?\d{1,4}호$")  # B-1111호
 
         self.h1Prefix = self.hSimplifier.getSortedH1Prefic()
+        # h1Prefix는 길이 내림차순이므로 가장 긴 접두사를 찾으면 같은 결과
+        self.h1PrefixTrie = PrefixTrie(self.h1Prefix)
         # self.h1Prefix = sorted(list(self.__h1Dic.keys()), key=len, reverse=True)
 
         self.h23Prefix = [
@@ -139,6 +161,7 @@ class Tokenizer:
             re.compile(r"^고양시?\s?일산\s?(동|서)구"),
             re.compile(r"^창원시?\s?마산\s?(회원|합포)구"),
         ]
+        self.re_h23Prefix = combine_prefix_patterns(self.h23Prefix)
 
         self.__h3 = {
             "고양시": ("덕양구", "일산동구", "일산서구"),
@@ -196,6 +219,7 @@ class Tokenizer:
             self.re_dong_6자동,
             self.re_dong_종로1234가동,
         ]
+        self.re_h4Prefix = combine_prefix_patterns(self.h4Prefix)
 
         self.re_n동 = re.compile(r"^\d동$")
 
@@ -241,12 +265,17 @@ class Tokenizer:
             self.re_road_거리,
             self.re_road_ETC길,
         ]
+        self.re_roadPrefix = combine_prefix_patterns(self.roadPrefix)
 
         # 숫자로 시작하는 길이름
 
         self.numRoadPatterns = set(load_list("numRoadPatterns.txt"))
+        self.numRoadTrie = PrefixTrie(self.numRoadPatterns)
         self.road_like_h4 = set(load_list("road_like_h4.txt"))
 
+        # 붙여 쓴 행정구역명 분리 (선택). 모든 Tokenizer가 같은 사전을 공유
+        self.gazetteer = get_gazetteer() if config.USE_GAZETTEER else None
+
     def __mergebrackets(self, toks, sep=" "):
         """
         괄호로 묶인 토큰을 병합합니다.
@@ -582,6 +611,9 @@ class Tokenizer:
         address = address.replace("ㅡ", "-")
         # 둘러싼 따옴표 제거
         address = self.__removeQuoteAroundAddress(address)
+        # 붙여 쓴 행정구역명 띄어 쓰기. 서울영등포구신길동 -> 서울 영등포구 신길동
+        if self.gazetteer:
+            address = self.gazetteer.split_glued(address)
         toks = Tokens(self.re_tokenize_split.split(address))
         self.__removeWhiteSpaces(toks)
         self.__removeDotChar(toks)
@@ -876,11 +908,7 @@ class Tokenizer:
         Returns:
             bool: 문자열이 숫자 도로 패턴으로 시작하면 True, 그렇지 않으면 False.
         """
-        for pattern in self.numRoadPatterns:
-            if nm.startswith(pattern):
-                return True
-
-        return False
+        return self.numRoadTrie.has_prefix(nm)
 
     def __hasH3(self, toks):
         """
@@ -961,10 +989,9 @@ class Tokenizer:
             lenLimit = 4
 
         if len(tkn.val) >= lenLimit:
-            for h1pref in self.h1Prefix:
-                if tkn.val.startswith(h1pref):
-                    toks.split(0, len(h1pref), TOKEN_H1, tkn.t)
-                    break
+            h1pref = self.h1PrefixTrie.longest_prefix(tkn.val)
+            if h1pref:
+                toks.split(0, len(h1pref), TOKEN_H1, tkn.t)
 
     def __splitH2(self, toks, h2pos=None):
         """
@@ -992,11 +1019,9 @@ class Tokenizer:
             lenLimit = 4
 
         if len(tkn.val) >= lenLimit:
-            for h23re in self.h23Prefix:
-                m = h23re.match(tkn.val)
-                if m:
-                    toks.split(h2pos, m.span()[1], TOKEN_H23, tkn.t)
-                    break
+            m = self.re_h23Prefix.match(tkn.val)
+            if m:
+                toks.split(h2pos, m.span()[1], TOKEN_H23, tkn.t)
 
         return h2pos
 
@@ -1069,12 +1094,10 @@ class Tokenizer:
 
             splited = False
             if len(tkn.val) >= lenLimit:
-                for re1 in self.h4Prefix:
-                    m = re1.match(tkn.val)
-                    if m:
-                        toks.split(h4pos, m.span()[1], TOKEN_H4, tkn.t)
-                        splited = True
-                        break
+                m = self.re_h4Prefix.match(tkn.val)
+                if m:
+                    toks.split(h4pos, m.span()[1], TOKEN_H4, tkn.t)
+                    splited = True
             if (
                 splited == False
                 and len(tkn.val) > 2
@@ -1086,12 +1109,7 @@ class Tokenizer:
         return h4pos
 
     def __isRoad(self, val):
-        for re1 in self.roadPrefix:
-            m = re1.match(val)
-            if m:
-                return m
-
-        return None
+        return self.re_roadPrefix.match(val)
 
     def __splitJibun(self, toks, bldPos):
         """
@@ -1113,24 +1131,13 @@ class Tokenizer:
         """
         tkn = toks.get(bldPos)
 
-        re_bunji_list = [
-            self.re_bunjihead_n_n_bng,  # 1-2(번지)
-            self.re_bunjihead_n_의_n,  # 1의2(번지)
-            self.re_bunjihead_번지_호,  # 1번지2(호)
-            self.re_bunjihead_n_n_호,  # 1013-6호
-            self.re_bunjihead_n_호,  # 6호
-            self.re_bunjihead_n_번지,  # 1번지
-        ]
-
-        for r in re_bunji_list:
-            m = r.match(tkn.val)
-            if m:
-                toks.split(bldPos, m.span()[1], TOKEN_BNG, tkn.t)
-                return
+        m = self.re_bunjihead.match(tkn.val)
+        if m:
+            toks.split(bldPos, m.span()[1], TOKEN_BNG, tkn.t)
+            return
 
         # 숫자와 건물명 분리 (보수적으로)
-        re_num_str = re.compile(r"^(\d+)(\S+)$")
-        m = re_num_str.match(tkn.val)
+        m = self.re_num_str.match(tkn.val)
         if m:
             num = m.group(1)
             rest = m.group(2)
@@ -1180,11 +1187,9 @@ class Tokenizer:
                 lenLimit = 2
 
             if len(tkn.val) >= lenLimit:
-                for re1 in self.roadPrefix:
-                    m = re1.match(tkn.val)
-                    if m:
-                        toks.split(roadpos, m.span()[1], TOKEN_ROAD, tkn.t)
-                        break
+                m = self.re_roadPrefix.match(tkn.val)
+                if m:
+                    toks.split(roadpos, m.span()[1], TOKEN_ROAD, tkn.t)
         return roadpos
 
     def __splitUnder(self, toks, underpos):
@@ -1229,6 +1234,21 @@ class Tokenizer:
         return "\n".join(lines)
 
 
+def combine_prefix_patterns(patterns):
+    """
+    ^로 시작하는 정규 표현식 목록을 하나의 alternation으로 합칩니다.
+
+    re의 alternation은 왼쪽부터 시도하므로, 목록 순서대로 match()해서
+    처음 일치한 결과와 같은 span을 한 번의 match()로 얻습니다.
+    일치한 패턴의 순번은 m.lastgroup ("p{순번}")으로 알 수 있습니다.
+    """
+    parts = []
+    for n, p in enumerate(patterns):
+        src = p.pattern[1:] if p.pattern.startswith("^") else p.pattern
+        parts.append(f"(?P<p{n}>{src})")
+    return re.compile("^(?:" + "|".join(parts) + ")")
+
+
 def load_list(filename: str):
     """{config.CODE_DATA_DIR}/{filename} 파일에서 행정구역 코드를 읽어옵니다."""
     codes = []
@@ -0,0 +1,99 @@
+"""
+DB 키 하나의 후보 주소 리스트와 후보 필터링용 필드
+
+Geocoder.filter_candidate_addresses는 후보마다 h1_nm, x, pos_cd, h23_nm, road_cd, bm, ri_nm과
+정렬 기준(extras.updater, extras.yyyymm)만 봅니다.
+이 필드들을 후보 리스트당 한 번만 꺼내 정렬한 순서로 저장해 두고,
+요청마다 한 번의 순회로 모든 조건을 검사합니다.
+"""
+
+# 필드가 없는 레코드 표시
+MISSING = object()
+
+
+class Candidates(tuple):
+    """
+    읽기 전용 후보 주소 리스트 (freeze()한 레코드의 tuple)
+
+    DecodedValueCache에 저장되어 여러 요청이 함께 사용하므로,
+    필터링용 필드(filter_rows)도 처음 사용할 때 한 번만 만듭니다.
+    """
+
+    _rows = None
+    _presorted = False
+    _sorted = False  # DB 빌드 시 정렬해서 저장한 리스트
+
+    @classmethod
+    def presorted(cls, records):
+        """이미 정렬 순서(sort_key 내림차순)인 후보 리스트. filter_rows()에서 정렬하지 않음"""
+        candidates = cls(records)
+        candidates._sorted = True
+        return candidates
+
+    def filter_rows(self):
+        """
+        필터링용 필드
+
+        Returns:
+            tuple: (rows, presorted)
+                rows: ((레코드, h1_nm, x, "pos_cd" 유무, pos_cd, h23_nm, road_cd, bm, "ri_nm" 유무, ri_nm), ...)
+                presorted: rows가 정렬 순서(sort_key 내림차순, 같으면 원래 순서)이면 True.
+                    정렬 기준을 계산할 수 없는 레코드가 있으면 원래 순서이며 False.
+        """
+        rows = self._rows
+        if rows is None:
+            rows, self._presorted = build_filter_rows(self)
+            self._rows = rows
+        return rows, self._presorted
+
+
+def sort_key(r):
+    """
+    후보 정렬 기준. 내림차순으로 정렬합니다.
+    "roadbase_updater"는 가장 나중에, extras.yyyymm이 최근인 것을 먼저.
+    """
+    return (
+        0 if r.get("extras", {}).get("updater") == "roadbase_updater" else 1,
+        r.get("extras", {}).get("yyyymm", ""),
+    )
+
+
+def build_filter_rows(candidates):
+    """
+    후보 리스트의 필터링용 필드를 만듭니다.
+
+    sorted(reverse=True)는 같은 key의 원래 순서를 유지하므로,
+    미리 정렬한 순서대로 걸러도 거른 뒤 정렬한 결과와 같습니다.
+    DB 빌드 시 정렬해서 저장한 리스트(Candidates.presorted)는 다시 정렬하지 않습니다.
+
+    Returns:
+        tuple: (rows, presorted). Candidates.filter_rows() 참고.
+    """
+    if getattr(candidates, "_sorted", False):
+        ordered = candidates
+        presorted = True
+    else:
+        try:
+            ordered = sorted(candidates, key=sort_key, reverse=True)
+            presorted = True
+        except Exception:
+            # extras 형식이 다른 레코드. 거른 뒤 정렬 (기존과 같이 남은 후보에서만 예외 발생)
+            ordered = candidates
+            presorted = False
+
+    rows = tuple(
+        (
+            r,
+            r.get("h1_nm", MISSING),
+            r.get("x"),
+            "pos_cd" in r,
+            r.get("pos_cd"),
+            r.get("h23_nm"),
+            r.get("road_cd", ""),
+            r.get("bm"),
+            "ri_nm" in r,
+            r.get("ri_nm"),
+        )
+        for r in ordered
+    )
+    return rows, presorted
@@ -14,6 +14,8 @@ delete(k)
     Delete the key-value pair associated with the key `k`.
 put(k, v)
     Store the key-value pair (`k`, `v`) in the database.
+get_obj(k), put_obj(k, o)
+    Read or store a JSON value through the value codec (value_codec.py).
 
 Parameters
 ----------
@@ -25,8 +27,13 @@ v : Any
 # -*- coding: utf-8 -*-
 from abc import *
 
+from .value_codec import CODECS, decode
+
 
 class DbBase(metaclass=ABCMeta):
+    # 값을 저장할 때 사용하는 codec. 읽을 때는 format byte로 codec을 고름
+    codec = CODECS["json"]
+
     @abstractmethod
     def get(self, k):
         pass
@@ -38,3 +45,12 @@ class DbBase(metaclass=ABCMeta):
     @abstractmethod
     def put(self, k, v):
         pass
+
+    def get_obj(self, k):
+        """JSON 값 조회. 없으면 None"""
+        v = self.get(k)
+        return None if v is None else decode(v)
+
+    def put_obj(self, k, o):
+        """JSON 값을 codec으로 인코딩해서 저장"""
+        self.put(k, self.codec.encode(o))
@@ -8,10 +8,11 @@ librocksdb.so 라이브러리를 사용하여 데이터베이스 작업을 지
 
 import os
 import ctypes
-from ctypes import c_char_p, c_void_p, c_size_t, c_int, POINTER
-from typing import Optional, Union, Dict, Any
+from ctypes import c_char_p, c_void_p, c_size_t, c_int, c_ubyte, c_double, POINTER
+from typing import Optional, Union, Dict, Any, List
 import threading
 from .base import DbBase
+from .value_codec import decode, get_codec
 from src import config
 
 
@@ -107,6 +108,84 @@ class RocksDBLibrary:
             self.lib.rocksdb_options_set_create_if_missing.restype = None
             self.lib.rocksdb_options_set_create_if_missing.argtypes = [c_void_p, c_int]
 
+            self.lib.rocksdb_options_set_max_open_files.restype = None
+            self.lib.rocksdb_options_set_max_open_files.argtypes = [c_void_p, c_int]
+
+            self.lib.rocksdb_options_set_advise_random_on_open.restype = None
+            self.lib.rocksdb_options_set_advise_random_on_open.argtypes = [
+                c_void_p,
+                c_ubyte,
+            ]
+
+            self.lib.rocksdb_options_set_block_based_table_factory.restype = None
+            self.lib.rocksdb_options_set_block_based_table_factory.argtypes = [
+                c_void_p,
+                c_void_p,
+            ]
+
+            # BlockBasedTableOptions 관련
+            self.lib.rocksdb_block_based_options_create.restype = c_void_p
+            self.lib.rocksdb_block_based_options_create.argtypes = []
+
+            self.lib.rocksdb_block_based_options_destroy.restype = None
+            self.lib.rocksdb_block_based_options_destroy.argtypes = [c_void_p]
+
+            self.lib.rocksdb_block_based_options_set_block_size.restype = None
+            self.lib.rocksdb_block_based_options_set_block_size.argtypes = [
+                c_void_p,
+                c_size_t,
+            ]
+
+            self.lib.rocksdb_block_based_options_set_block_cache.restype = None
+            self.lib.rocksdb_block_based_options_set_block_cache.argtypes = [
+                c_void_p,
+                c_void_p,
+            ]
+
+            self.lib.rocksdb_block_based_options_set_filter_policy.restype = None
+            self.lib.rocksdb_block_based_options_set_filter_policy.argtypes = [
+                c_void_p,
+                c_void_p,
+            ]
+
+            self.lib.rocksdb_block_based_options_set_whole_key_filtering.restype = None
+            self.lib.rocksdb_block_based_options_set_whole_key_filtering.argtypes = [
+                c_void_p,
+                c_ubyte,
+            ]
+
+            self.lib.rocksdb_block_based_options_set_cache_index_and_filter_blocks.restype = (
+                None
+            )
+            self.lib.rocksdb_block_based_options_set_cache_index_and_filter_blocks.argtypes = [
+                c_void_p,
+                c_ubyte,
+            ]
+
+            self.lib.rocksdb_block_based_options_set_pin_l0_filter_and_index_blocks_in_cache.restype = (
+                None
+            )
+            self.lib.rocksdb_block_based_options_set_pin_l0_filter_and_index_blocks_in_cache.argtypes = [
+                c_void_p,
+                c_ubyte,
+            ]
+
+            # Cache / FilterPolicy 관련
+            self.lib.rocksdb_cache_create_lru.restype = c_void_p
+            self.lib.rocksdb_cache_create_lru.argtypes = [c_size_t]
+
+            self.lib.rocksdb_cache_destroy.restype = None
+            self.lib.rocksdb_cache_destroy.argtypes = [c_void_p]
+
+            self.lib.rocksdb_cache_get_usage.restype = c_size_t
+            self.lib.rocksdb_cache_get_usage.argtypes = [c_void_p]
+
+            self.lib.rocksdb_cache_get_pinned_usage.restype = c_size_t
+            self.lib.rocksdb_cache_get_pinned_usage.argtypes = [c_void_p]
+
+            self.lib.rocksdb_filterpolicy_create_bloom_full.restype = c_void_p
+            self.lib.rocksdb_filterpolicy_create_bloom_full.argtypes = [c_double]
+
             # DB 관련
             self.lib.rocksdb_open.restype = c_void_p
             self.lib.rocksdb_open.argtypes = [c_void_p, c_char_p, POINTER(c_char_p)]
@@ -131,6 +210,9 @@ class RocksDBLibrary:
             self.lib.rocksdb_close.restype = None
             self.lib.rocksdb_close.argtypes = [c_void_p]
 
+            self.lib.rocksdb_get_latest_sequence_number.restype = ctypes.c_uint64
+            self.lib.rocksdb_get_latest_sequence_number.argtypes = [c_void_p]
+
             # Get/Put/Delete 관련
             self.lib.rocksdb_get.restype = c_void_p
             # self.lib.rocksdb_get.restype = c_char_p
@@ -143,6 +225,37 @@ class RocksDBLibrary:
                 POINTER(c_char_p),
             ]
 
+            # PinnableSlice 관련
+            self.lib.rocksdb_get_pinned.restype = c_void_p
+            self.lib.rocksdb_get_pinned.argtypes = [
+                c_void_p,
+                c_void_p,
+                c_char_p,
+                c_size_t,
+                POINTER(c_char_p),
+            ]
+
+            self.lib.rocksdb_pinnableslice_value.restype = c_void_p
+            self.lib.rocksdb_pinnableslice_value.argtypes = [
+                c_void_p,
+                POINTER(c_size_t),
+            ]
+
+            self.lib.rocksdb_pinnableslice_destroy.restype = None
+            self.lib.rocksdb_pinnableslice_destroy.argtypes = [c_void_p]
+
+            self.lib.rocksdb_multi_get.restype = None
+            self.lib.rocksdb_multi_get.argtypes = [
+                c_void_p,  # rocksdb_t* db
+                c_void_p,  # const rocksdb_readoptions_t* options
+                c_size_t,  # size_t num_keys
+                POINTER(c_char_p),  # const char* const* keys_list
+                POINTER(c_size_t),  # const size_t* keys_list_sizes
+                POINTER(c_void_p),  # char** values_list
+                POINTER(c_size_t),  # size_t* values_list_sizes
+                POINTER(c_void_p),  # char** errs
+            ]
+
             self.lib.rocksdb_put.restype = None
             self.lib.rocksdb_put.argtypes = [
                 c_void_p,
@@ -170,6 +283,15 @@ class RocksDBLibrary:
             self.lib.rocksdb_readoptions_destroy.restype = None
             self.lib.rocksdb_readoptions_destroy.argtypes = [c_void_p]
 
+            self.lib.rocksdb_readoptions_set_readahead_size.restype = None
+            self.lib.rocksdb_readoptions_set_readahead_size.argtypes = [
+                c_void_p,
+                c_size_t,
+            ]
+
+            self.lib.rocksdb_readoptions_set_fill_cache.restype = None
+            self.lib.rocksdb_readoptions_set_fill_cache.argtypes = [c_void_p, c_ubyte]
+
             self.lib.rocksdb_writeoptions_create.restype = c_void_p
             self.lib.rocksdb_writeoptions_create.argtypes = []
 
@@ -195,10 +317,17 @@ class RocksDBLibrary:
             self.lib.rocksdb_iter_next.restype = None
             self.lib.rocksdb_iter_next.argtypes = [c_void_p]
 
-            self.lib.rocksdb_iter_key.restype = c_char_p
+            self.lib.rocksdb_iter_prev.restype = None
+            self.lib.rocksdb_iter_prev.argtypes = [c_void_p]
+
+            self.lib.rocksdb_iter_seek_for_prev.restype = None
+            self.lib.rocksdb_iter_seek_for_prev.argtypes = [c_void_p, c_char_p, c_size_t]
+
+            # c_char_p는 NUL에서 잘린 bytes로 변환되므로 포인터(c_void_p)로 받아 string_at으로 복사
+            self.lib.rocksdb_iter_key.restype = c_void_p
             self.lib.rocksdb_iter_key.argtypes = [c_void_p, POINTER(c_size_t)]
 
-            self.lib.rocksdb_iter_value.restype = c_char_p
+            self.lib.rocksdb_iter_value.restype = c_void_p
             self.lib.rocksdb_iter_value.argtypes = [c_void_p, POINTER(c_size_t)]
 
             # Flush 관련
@@ -219,6 +348,119 @@ class RocksDBLibrary:
             raise RocksDBError(f"RocksDB 함수 설정 실패: {e}")
 
 
+# DB 역할(role)별 프로파일 설정 이름
+ROLE_PROFILE_CONFIG = {
+    "geocode": "ROCKSDB_GEOCODE_PROFILE",
+    "reverse": "ROCKSDB_REVERSE_PROFILE",
+    "hd_history": "ROCKSDB_HD_HISTORY_PROFILE",
+    "bigcache": "ROCKSDB_BIGCACHE_PROFILE",
+    "default": "ROCKSDB_DEFAULT_PROFILE",
+}
+
+# 옵션 프로파일
+# serving: 조회 전용. index/filter 블록을 공유 캐시에 두고 L0는 고정(pin)
+# write: 빌드/업데이트용. 새로 만드는 SST에 bloom filter를 기록
+# none: RocksDB 기본값
+ROCKSDB_PROFILES = {
+    "serving": {
+        "block_cache": True,
+        "bloom_filter": True,
+        "cache_index_and_filter_blocks": True,
+        "advise_random_on_open": True,
+    },
+    "write": {
+        "block_cache": True,
+        "bloom_filter": True,
+        "cache_index_and_filter_blocks": False,
+        "advise_random_on_open": False,
+    },
+    "none": {},
+}
+
+_shared_block_cache = None
+_shared_block_cache_lock = threading.Lock()
+
+
+def get_shared_block_cache():
+    """
+    모든 DB가 함께 사용하는 LRU 블록 캐시를 반환합니다.
+    프로세스 전체에서 한 번만 생성하며 해제하지 않습니다.
+
+    Returns:
+        rocksdb_cache_t 포인터 (ROCKSDB_BLOCK_CACHE_SIZE가 0이면 None)
+    """
+    global _shared_block_cache
+
+    if config.ROCKSDB_BLOCK_CACHE_SIZE <= 0:
+        return None
+
+    if _shared_block_cache is None:
+        with _shared_block_cache_lock:
+            if _shared_block_cache is None:
+                lib = RocksDBLibrary().lib
+                _shared_block_cache = lib.rocksdb_cache_create_lru(
+                    config.ROCKSDB_BLOCK_CACHE_SIZE
+                )
+                if not _shared_block_cache:
+                    raise RocksDBError("블록 캐시 생성 실패")
+    return _shared_block_cache
+
+
+def block_cache_stats() -> Dict[str, int]:
+    """
+    공유 블록 캐시 사용량
+
+    Returns:
+        {"capacity": int, "usage": int, "pinned_usage": int}
+    """
+    if _shared_block_cache is None:
+        return {"capacity": 0, "usage": 0, "pinned_usage": 0}
+
+    lib = RocksDBLibrary().lib
+    return {
+        "capacity": config.ROCKSDB_BLOCK_CACHE_SIZE,
+        "usage": lib.rocksdb_cache_get_usage(_shared_block_cache),
+        "pinned_usage": lib.rocksdb_cache_get_pinned_usage(_shared_block_cache),
+    }
+
+
+def resolve_profile(role: str) -> Dict[str, Any]:
+    """
+    DB 역할에 해당하는 옵션 프로파일을 config에서 찾아 실제 적용할 옵션을 반환합니다.
+
+    Args:
+        role: DB 역할 (geocode, reverse, hd_history, bigcache, default)
+
+    Returns:
+        적용할 옵션 딕셔너리
+    """
+    config_name = ROLE_PROFILE_CONFIG.get(role, ROLE_PROFILE_CONFIG["default"])
+    profile_name = getattr(config, config_name)
+    if profile_name not in ROCKSDB_PROFILES:
+        raise RocksDBError(f"알 수 없는 RocksDB 프로파일: {config_name}={profile_name}")
+
+    profile = ROCKSDB_PROFILES[profile_name]
+    if not profile:
+        return {"profile": profile_name}
+
+    cache_index_and_filter_blocks = profile["cache_index_and_filter_blocks"]
+    return {
+        "profile": profile_name,
+        "block_cache_size": (
+            config.ROCKSDB_BLOCK_CACHE_SIZE if profile["block_cache"] else 0
+        ),
+        "block_size": config.ROCKSDB_BLOCK_SIZE,
+        "bloom_bits_per_key": (
+            config.ROCKSDB_BLOOM_BITS_PER_KEY if profile["bloom_filter"] else 0
+        ),
+        "cache_index_and_filter_blocks": cache_index_and_filter_blocks,
+        "pin_l0_filter_and_index": cache_index_and_filter_blocks
+        and config.ROCKSDB_PIN_L0_FILTER_AND_INDEX,
+        "max_open_files": config.ROCKSDB_MAX_OPEN_FILES,
+        "advise_random_on_open": profile["advise_random_on_open"],
+    }
+
+
 class WriteBatch:
     """RocksDB WriteBatch 래퍼 클래스"""
 
@@ -323,6 +565,75 @@ class WriteBatch:
         self.destroy()
 
 
+class PinnedValue:
+    """
+    rocksdb_get_pinned로 조회한 값의 핸들
+
+    값은 복사하지 않고 RocksDB 블록(PinnableSlice)을 가리키는 memoryview로 제공합니다.
+    release() 또는 with 블록 종료 후에는 view와 view에서 만든 슬라이스를 사용하면 안 됩니다.
+    """
+
+    def __init__(self, lib, pinned_slice):
+        self.lib = lib
+        self._slice = pinned_slice
+
+        value_len = c_size_t()
+        self._ptr = self.lib.rocksdb_pinnableslice_value(
+            pinned_slice, ctypes.byref(value_len)
+        )
+        self._len = value_len.value
+        if self._len:
+            buf = (ctypes.c_ubyte * self._len).from_address(self._ptr)
+            self._view = memoryview(buf).cast("B")
+        else:
+            self._view = memoryview(b"")
+
+    @property
+    def view(self) -> memoryview:
+        """고정(pin)된 값에 대한 memoryview"""
+        if self._slice is None:
+            raise RocksDBError("이미 해제된 PinnedValue입니다")
+        return self._view
+
+    def __len__(self):
+        return self._len
+
+    def __bytes__(self):
+        return ctypes.string_at(self._ptr, self._len) if self._len else b""
+
+    def decode(self, encoding: str = "utf-8") -> str:
+        """
+        bytes를 거치지 않고 고정된 값에서 바로 문자열로 디코딩
+
+        Args:
+            encoding: 문자 인코딩
+
+        Returns:
+            디코딩된 문자열
+        """
+        return str(self.view, encoding)
+
+    def release(self):
+        """PinnableSlice 해제"""
+        if self._slice is not None:
+            self._view.release()
+            self.lib.rocksdb_pinnableslice_destroy(self._slice)
+            self._slice = None
+            self._ptr = None
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.release()
+
+    def __del__(self):
+        """소멸자"""
+        self.release()
+
+
 class Gimi9RocksDB(DbBase):
     """RocksDB 래퍼 클래스"""
 
@@ -358,6 +669,12 @@ class Gimi9RocksDB(DbBase):
         self.lib = self.lib_instance.lib
 
         self.db = None
+        # 스레드별로 재사용하는 ReadOptions. close()에서 모두 해제
+        self._local = threading.local()
+        self._read_options_list = []
+        self._read_options_lock = threading.Lock()
+        # put_obj()로 저장할 때 사용하는 codec (기본값: VALUE_CODEC)
+        self.codec = get_codec(kwargs.pop("codec", None) or config.VALUE_CODEC)
         # self.options = None
         # self._setup_functions()
         self.open(db_name, **kwargs)
@@ -369,6 +686,7 @@ class Gimi9RocksDB(DbBase):
         read_only: bool = False,
         open_secondary: bool = False,
         secondary_path: Optional[str] = None,
+        role: str = "default",
     ) -> None:
         """
         데이터베이스 열기
@@ -376,17 +694,23 @@ class Gimi9RocksDB(DbBase):
         Args:
             db_path: 데이터베이스 경로
             create_if_missing: 데이터베이스가 없으면 생성할지 여부
+            role: DB 역할 (geocode, reverse, hd_history, bigcache, default).
+                역할별 옵션 프로파일은 config의 ROCKSDB_*_PROFILE로 지정
         """
         if self.db is not None:
             self.close()
 
         self.read_only = read_only
+        self.role = role
 
         # Options 생성
         self.options = self.lib.rocksdb_options_create()
         if not read_only and create_if_missing:
             self.lib.rocksdb_options_set_create_if_missing(self.options, 1)
 
+        self.effective_options = resolve_profile(role)
+        self._apply_profile(self.options, self.effective_options)
+
         # DB 열기
         err = c_char_p()
         if open_secondary:
@@ -415,6 +739,65 @@ class Gimi9RocksDB(DbBase):
             raise RocksDBError(f"데이터베이스 열기 실패: {error_msg}")
 
         print(f"RocksDB 데이터베이스 열기 성공: {db_path}")
+        print(f"RocksDB 옵션 ({role}): {self.effective_options}")
+
+    def _apply_profile(self, options, profile: Dict[str, Any]) -> None:
+        """
+        옵션 프로파일을 rocksdb_options_t에 적용
+
+        Args:
+            options: rocksdb_options_t 포인터
+            profile: resolve_profile()이 반환한 옵션 딕셔너리
+        """
+        if profile["profile"] == "none":
+            # none 프로파일: RocksDB 기본값 사용
+            return
+
+        self.lib.rocksdb_options_set_max_open_files(
+            options, profile["max_open_files"]
+        )
+        self.lib.rocksdb_options_set_advise_random_on_open(
+            options, 1 if profile["advise_random_on_open"] else 0
+        )
+
+        table_options = self.lib.rocksdb_block_based_options_create()
+        try:
+            self.lib.rocksdb_block_based_options_set_block_size(
+                table_options, profile["block_size"]
+            )
+
+            if profile["block_cache_size"] > 0:
+                cache = get_shared_block_cache()
+                if cache:
+                    self.lib.rocksdb_block_based_options_set_block_cache(
+                        table_options, cache
+                    )
+
+            if profile["bloom_bits_per_key"] > 0:
+                # filter policy의 소유권은 table_options로 넘어감
+                self.lib.rocksdb_block_based_options_set_filter_policy(
+                    table_options,
+                    self.lib.rocksdb_filterpolicy_create_bloom_full(
+                        float(profile["bloom_bits_per_key"])
+                    ),
+                )
+                self.lib.rocksdb_block_based_options_set_whole_key_filtering(
+                    table_options, 1
+                )
+
+            self.lib.rocksdb_block_based_options_set_cache_index_and_filter_blocks(
+                table_options, 1 if profile["cache_index_and_filter_blocks"] else 0
+            )
+            self.lib.rocksdb_block_based_options_set_pin_l0_filter_and_index_blocks_in_cache(
+                table_options, 1 if profile["pin_l0_filter_and_index"] else 0
+            )
+
+            # table factory가 설정을 복사하므로 table_options는 바로 해제
+            self.lib.rocksdb_options_set_block_based_table_factory(
+                options, table_options
+            )
+        finally:
+            self.lib.rocksdb_block_based_options_destroy(table_options)
 
     def __iter__(self):
         """
@@ -427,7 +810,12 @@ class Gimi9RocksDB(DbBase):
             raise RocksDBError("데이터베이스가 열려있지 않습니다")
 
         # ReadOptions 생성
+        # 전체 순회는 read-ahead를 사용하고, 공유 블록 캐시를 오염시키지 않음
         read_options = self.lib.rocksdb_readoptions_create()
+        self.lib.rocksdb_readoptions_set_readahead_size(
+            read_options, config.ROCKSDB_READAHEAD_SIZE
+        )
+        self.lib.rocksdb_readoptions_set_fill_cache(read_options, 0)
 
         it = None
         try:
@@ -456,6 +844,56 @@ class Gimi9RocksDB(DbBase):
             if it:
                 self.lib.rocksdb_iter_destroy(it)
 
+    def iter_keys(self):
+        """
+        데이터베이스의 모든 키를 순회 (값은 읽지 않음)
+
+        Returns:
+            이터레이터: 키(bytes)의 이터레이터
+        """
+        if self.db is None:
+            raise RocksDBError("데이터베이스가 열려있지 않습니다")
+
+        # 전체 순회는 read-ahead를 사용하고, 공유 블록 캐시를 오염시키지 않음
+        read_options = self.lib.rocksdb_readoptions_create()
+        self.lib.rocksdb_readoptions_set_readahead_size(
+            read_options, config.ROCKSDB_READAHEAD_SIZE
+        )
+        self.lib.rocksdb_readoptions_set_fill_cache(read_options, 0)
+
+        it = None
+        try:
+            it = self.lib.rocksdb_create_iterator(self.db, read_options)
+            if not it:
+                raise RocksDBError("Iterator 생성 실패")
+
+            self.lib.rocksdb_iter_seek_to_first(it)
+
+            key_len = c_size_t()
+            while self.lib.rocksdb_iter_valid(it):
+                key_ptr = self.lib.rocksdb_iter_key(it, ctypes.byref(key_len))
+                yield ctypes.string_at(key_ptr, key_len.value)
+
+                self.lib.rocksdb_iter_next(it)
+
+        finally:
+            self.lib.rocksdb_readoptions_destroy(read_options)
+            if it:
+                self.lib.rocksdb_iter_destroy(it)
+
+    def latest_sequence_number(self) -> int:
+        """
+        데이터베이스의 최신 sequence number.
+        쓰기가 있을 때마다 증가하므로 DB 버전 비교에 사용합니다.
+
+        Returns:
+            sequence number
+        """
+        if self.db is None:
+            raise RocksDBError("데이터베이스가 열려있지 않습니다")
+
+        return self.lib.rocksdb_get_latest_sequence_number(self.db)
+
     def next(self, it) -> Optional[tuple]:
         """
         이터레이터의 다음 키-값 쌍을 반환
@@ -510,6 +948,76 @@ class Gimi9RocksDB(DbBase):
                 self.lib.rocksdb_iter_destroy(it)
             raise RocksDBError(f"Iterator 생성 중 오류 발생: {e}")
 
+    def seek_keys(
+        self,
+        key: Union[str, bytes],
+        count: int = 1,
+        prefix: Union[str, bytes] = None,
+        reverse: bool = False,
+    ) -> List[bytes]:
+        """
+        정렬 순서로 key 이후(reverse이면 key 이전)의 키를 최대 count개 반환 (값은 읽지 않음)
+
+        iterator 하나로 seek 한 번과 next(prev)만 하므로 보조 인덱스의 범위 조회에 사용합니다.
+
+        Args:
+            key: 시작 키. 포함.
+            count: 최대 키 개수.
+            prefix: 있으면 prefix로 시작하는 키만. 벗어나면 멈춤.
+            reverse: True이면 key 이하의 키를 역순으로.
+
+        Returns:
+            키(bytes) 리스트
+        """
+        if self.db is None:
+            raise RocksDBError("데이터베이스가 열려있지 않습니다")
+
+        key = key.encode("utf-8") if isinstance(key, str) else key
+        if isinstance(prefix, str):
+            prefix = prefix.encode("utf-8")
+
+        keys = []
+        it = self.lib.rocksdb_create_iterator(self.db, self._read_options())
+        if not it:
+            raise RocksDBError("Iterator 생성 실패")
+        try:
+            if reverse:
+                self.lib.rocksdb_iter_seek_for_prev(it, key, len(key))
+                step = self.lib.rocksdb_iter_prev
+            else:
+                self.lib.rocksdb_iter_seek(it, key, len(key))
+                step = self.lib.rocksdb_iter_next
+
+            key_len = c_size_t()
+            while len(keys) < count and self.lib.rocksdb_iter_valid(it):
+                key_ptr = self.lib.rocksdb_iter_key(it, ctypes.byref(key_len))
+                found = ctypes.string_at(key_ptr, key_len.value)
+                if prefix is not None and not found.startswith(prefix):
+                    break
+                keys.append(found)
+                step(it)
+        finally:
+            self.lib.rocksdb_iter_destroy(it)
+
+        return keys
+
+    def _read_options(self):
+        """
+        현재 스레드의 ReadOptions 반환 (없으면 생성)
+
+        Returns:
+            rocksdb_readoptions_t 포인터
+        """
+        read_options = getattr(self._local, "read_options", None)
+        if read_options is None:
+            read_options = self.lib.rocksdb_readoptions_create()
+            if not read_options:
+                raise RocksDBError("ReadOptions 생성 실패")
+            self._local.read_options = read_options
+            with self._read_options_lock:
+                self._read_options_list.append(read_options)
+        return read_options
+
     def put(self, key: Union[str, bytes], value: Union[str, bytes]) -> None:
         """
         키-값 쌍 저장
@@ -552,15 +1060,15 @@ class Gimi9RocksDB(DbBase):
         finally:
             self.lib.rocksdb_writeoptions_destroy(write_options)
 
-    def get(self, key: Union[str, bytes]) -> Optional[bytes]:
+    def get_pinned(self, key: Union[str, bytes]) -> Optional[PinnedValue]:
         """
-        키에 해당하는 값 조회
+        키에 해당하는 값을 복사 없이 조회 (rocksdb_get_pinned)
 
         Args:
             key: 조회할 키
 
         Returns:
-            키에 해당하는 값 (없으면 None)
+            PinnedValue 핸들 (없으면 None). 사용 후 release() 또는 with 블록으로 해제
         """
         if self.db is None:
             raise RocksDBError("데이터베이스가 열려있지 않습니다")
@@ -568,37 +1076,101 @@ class Gimi9RocksDB(DbBase):
         # 문자열을 바이트로 변환
         key_bytes = key.encode("utf-8") if isinstance(key, str) else key
 
-        # ReadOptions 생성
-        read_options = self.lib.rocksdb_readoptions_create()
+        err = c_char_p()
+        pinned_slice = self.lib.rocksdb_get_pinned(
+            self.db,
+            self._read_options(),
+            key_bytes,
+            len(key_bytes),
+            ctypes.byref(err),
+        )
 
-        try:
-            value_len = c_size_t()
-            err = c_char_p()
+        if err.value:
+            error_msg = err.value.decode("utf-8")
+            self.lib.rocksdb_free(err)
+            if pinned_slice:
+                self.lib.rocksdb_pinnableslice_destroy(pinned_slice)
+            raise RocksDBError(f"데이터 조회 실패: {error_msg}")
 
-            value_ptr = self.lib.rocksdb_get(
-                self.db,
-                read_options,
-                key_bytes,
-                len(key_bytes),
-                ctypes.byref(value_len),
-                ctypes.byref(err),
-            )
+        if not pinned_slice:
+            return None
 
-            if err.value:
-                error_msg = err.value.decode("utf-8")
-                self.lib.rocksdb_free(err)
-                raise RocksDBError(f"데이터 조회 실패: {error_msg}")
+        return PinnedValue(self.lib, pinned_slice)
 
-            if value_ptr:
-                # 값을 복사하고 메모리 해제
-                value = ctypes.string_at(value_ptr, value_len.value)
-                self.lib.rocksdb_free(value_ptr)
-                return value
+    def get(self, key: Union[str, bytes]) -> Optional[bytes]:
+        """
+        키에 해당하는 값 조회
+
+        Args:
+            key: 조회할 키
+
+        Returns:
+            키에 해당하는 값 (없으면 None)
+        """
+        pinned = self.get_pinned(key)
+        if pinned is None:
+            return None
+
+        with pinned:
+            # 고정된 블록에서 한 번만 복사
+            return bytes(pinned)
+
+    def multi_get(self, keys: List[Union[str, bytes]]) -> List[Optional[bytes]]:
+        """
+        여러 키의 값을 한 번의 호출로 조회 (rocksdb_multi_get)
+
+        Args:
+            keys: 조회할 키 리스트
+
+        Returns:
+            keys와 같은 순서의 값 리스트 (없는 키는 None)
+        """
+        if self.db is None:
+            raise RocksDBError("데이터베이스가 열려있지 않습니다")
+
+        n = len(keys)
+        if n == 0:
+            return []
+
+        # 문자열을 바이트로 변환
+        key_bytes = [k.encode("utf-8") if isinstance(k, str) else k for k in keys]
+        keys_list = (c_char_p * n)(*key_bytes)
+        keys_list_sizes = (c_size_t * n)(*[len(k) for k in key_bytes])
+        # c_char_p 배열은 값을 bytes로 자동 변환하므로 포인터를 유지하기 위해 c_void_p 사용
+        values_list = (c_void_p * n)()
+        values_list_sizes = (c_size_t * n)()
+        errs = (c_void_p * n)()
+
+        self.lib.rocksdb_multi_get(
+            self.db,
+            self._read_options(),
+            n,
+            keys_list,
+            keys_list_sizes,
+            values_list,
+            values_list_sizes,
+            errs,
+        )
+
+        # 값을 복사하고 메모리 해제. 오류가 있어도 모든 포인터를 해제한 뒤 예외 발생
+        values = []
+        error_msg = None
+        for i in range(n):
+            if errs[i]:
+                if error_msg is None:
+                    error_msg = ctypes.string_at(errs[i]).decode("utf-8")
+                self.lib.rocksdb_free(errs[i])
+
+            if values_list[i]:
+                values.append(ctypes.string_at(values_list[i], values_list_sizes[i]))
+                self.lib.rocksdb_free(values_list[i])
             else:
-                return None
+                values.append(None)
 
-        finally:
-            self.lib.rocksdb_readoptions_destroy(read_options)
+        if error_msg is not None:
+            raise RocksDBError(f"데이터 일괄 조회 실패: {error_msg}")
+
+        return values
 
     def get_string(self, key: Union[str, bytes]) -> Optional[str]:
         """
@@ -610,8 +1182,39 @@ class Gimi9RocksDB(DbBase):
         Returns:
             키에 해당하는 값 (문자열, 없으면 None)
         """
-        value = self.get(key)
-        return value.decode("utf-8") if value else None
+        pinned = self.get_pinned(key)
+        if pinned is None:
+            return None
+
+        with pinned:
+            # bytes를 거치지 않고 고정된 블록에서 바로 디코딩
+            return pinned.decode("utf-8") or None
+
+    def get_obj(self, key: Union[str, bytes]):
+        """
+        JSON 값 조회. 고정(pin)된 블록에서 format byte에 맞는 codec으로 바로 디코딩
+
+        Args:
+            key: 조회할 키
+
+        Returns:
+            디코딩한 값 (없으면 None)
+        """
+        pinned = self.get_pinned(key)
+        if pinned is None:
+            return None
+
+        with pinned:
+            return decode(pinned.view)
+
+    def multi_get_obj(self, keys: List[Union[str, bytes]]) -> List[Any]:
+        """
+        여러 키의 JSON 값을 한 번의 호출로 조회
+
+        Returns:
+            keys와 같은 순서의 디코딩한 값 리스트 (없는 키는 None)
+        """
+        return [None if v is None else decode(v) for v in self.multi_get(keys)]
 
     def delete(self, key: Union[str, bytes]) -> None:
         """
@@ -654,6 +1257,16 @@ class Gimi9RocksDB(DbBase):
             self.lib.rocksdb_options_destroy(self.options)
             self.options = None
 
+        if not getattr(self, "_read_options_list", None):
+            return
+
+        with self._read_options_lock:
+            for read_options in self._read_options_list:
+                self.lib.rocksdb_readoptions_destroy(read_options)
+            self._read_options_list = []
+            # 다른 스레드의 threading.local 값은 여기서 지울 수 없으므로 새로 만든다
+            self._local = threading.local()
+
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         return self
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+key_bloom.py - GEOCODE_DB 키 집합에 대한 bloom filter
+
+possible_hashs()가 만드는 인근 지번/건물번호 hash는 대부분 DB에 없는 키입니다.
+RocksDB 조회 전에 이 필터로 확실히 없는 키를 걸러냅니다.
+
+파일 형식 (little endian)
+    header: magic(8s) version(I) num_bits(Q) num_hashes(I) num_keys(Q) db_sequence(Q)
+    body:   num_bits / 8 bytes 비트 배열
+
+파일은 mmap으로 읽으므로 여러 프로세스가 같은 페이지를 공유합니다.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Optional, Union
+
+from .gimi9_rocks import RocksDBError
+
+MAGIC = b"G9BLOOM\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIQIQQ")
+
+
+def _hash_pair(key: bytes):
+    """키에서 double hashing에 사용할 64비트 hash 두 개를 만든다."""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return h1, h2
+
+
+def optimal_params(num_keys: int, fpr: float):
+    """
+    키 개수와 목표 false positive rate로 비트 수와 hash 함수 개수를 계산
+
+    Args:
+        num_keys: 키 개수
+        fpr: 목표 false positive rate (0 < fpr < 1)
+
+    Returns:
+        (num_bits, num_hashes)
+    """
+    if not 0 < fpr < 1:
+        raise ValueError(f"fpr은 0과 1 사이여야 합니다: {fpr}")
+
+    num_keys = max(num_keys, 1)
+    num_bits = math.ceil(-num_keys * math.log(fpr) / (math.log(2) ** 2))
+    # 8의 배수로 맞춤
+    num_bits = max(8, (num_bits + 7) // 8 * 8)
+    num_hashes = max(1, round(num_bits / num_keys * math.log(2)))
+    return num_bits, num_hashes
+
+
+def build_key_bloom(
+    keys: Iterable[bytes],
+    num_keys: int,
+    path: str,
+    fpr: float = 0.01,
+    db_sequence: int = 0,
+) -> Dict[str, Union[int, float]]:
+    """
+    키 집합으로 bloom filter 파일을 만듭니다.
+    임시 파일에 쓴 뒤 교체하므로 읽고 있는 프로세스에 영향을 주지 않습니다.
+
+    Args:
+        keys: 키(bytes) 이터레이터
+        num_keys: 키 개수 (비트 수 계산에 사용)
+        path: 저장할 파일 경로
+        fpr: 목표 false positive rate
+        db_sequence: 빌드 시점의 DB sequence number
+
+    Returns:
+        빌드 통계
+    """
+    num_bits, num_hashes = optimal_params(num_keys, fpr)
+    bits = bytearray(num_bits // 8)
+
+    n = 0
+    for key in keys:
+        h1, h2 = _hash_pair(key)
+        for i in range(num_hashes):
+            pos = (h1 + i * h2) % num_bits
+            bits[pos >> 3] |= 1 << (pos & 7)
+        n += 1
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, num_bits, num_hashes, n, db_sequence))
+        f.write(bits)
+    os.replace(tmp_path, path)
+
+    return {
+        "num_keys": n,
+        "num_bits": num_bits,
+        "num_hashes": num_hashes,
+        "fpr": fpr,
+        "size": HEADER.size + len(bits),
+    }
+
+
+class KeyBloomFilter:
+    """mmap으로 읽는 bloom filter"""
+
+    def __init__(self, path: str):
+        """
+        bloom filter 파일 열기
+
+        Args:
+            path: build_key_bloom()으로 만든 파일 경로
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise RocksDBError(f"bloom filter 파일이 비어 있습니다: {path}")
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise RocksDBError(f"bloom filter 파일 형식 오류: {path}")
+
+        magic, version, num_bits, num_hashes, num_keys, db_sequence = (
+            HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise RocksDBError(f"bloom filter 파일 형식 오류: {path}")
+        if len(self._mm) != HEADER.size + num_bits // 8:
+            self.close()
+            raise RocksDBError(f"bloom filter 파일 크기 오류: {path}")
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.num_keys = num_keys
+        self.db_sequence = db_sequence
+
+        # 통계용 카운터. 조회 경로에 락을 두지 않으므로 여러 스레드에서 더하면 근사값
+        self._may_contain = 0
+        self._skipped = 0
+        self._false_positive = 0
+
+    def may_contain(self, key: Union[str, bytes]) -> bool:
+        """
+        키가 있을 수 있는지 확인. False이면 확실히 없는 키입니다.
+
+        Args:
+            key: 확인할 키
+
+        Returns:
+            bool
+        """
+        key_bytes = key.encode("utf-8") if isinstance(key, str) else key
+        h1, h2 = _hash_pair(key_bytes)
+        mm = self._mm
+        num_bits = self.num_bits
+        offset = HEADER.size
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % num_bits
+            if not mm[offset + (pos >> 3)] & (1 << (pos & 7)):
+                self._skipped += 1
+                return False
+
+        self._may_contain += 1
+        return True
+
+    def record_false_positive(self):
+        """may_contain()이 True였지만 DB에 없던 경우 호출"""
+        self._false_positive += 1
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        """
+        필터 정보와 hit/miss 카운터
+
+        Returns:
+            dict: may_contain(조회 진행), skipped(조회 생략), false_positive 등 (근사값)
+        """
+        may_contain = self._may_contain
+        skipped = self._skipped
+        false_positive = self._false_positive
+
+        negatives = skipped + false_positive
+        return {
+            "path": self.path,
+            "num_keys": self.num_keys,
+            "num_bits": self.num_bits,
+            "num_hashes": self.num_hashes,
+            "db_sequence": self.db_sequence,
+            "may_contain": may_contain,
+            "skipped": skipped,
+            "false_positive": false_positive,
+            "observed_fpr": false_positive / negatives if negatives else 0.0,
+        }
+
+    def close(self):
+        """mmap과 파일 닫기"""
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def load_key_bloom(
+    path: str, db_sequence: Optional[int] = None
+) -> Optional[KeyBloomFilter]:
+    """
+    bloom filter 파일을 읽습니다. 파일이 없거나 DB와 버전이 다르면 None을 반환합니다.
+    필터보다 새로운 키가 DB에 있으면 잘못 걸러낼 수 있으므로 오래된 필터는 사용하지 않습니다.
+
+    Args:
+        path: 파일 경로
+        db_sequence: 현재 DB의 sequence number (None이면 비교하지 않음)
+
+    Returns:
+        KeyBloomFilter 또는 None
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    key_filter = KeyBloomFilter(path)
+    if db_sequence is not None and key_filter.db_sequence != db_sequence:
+        key_filter.close()
+        return None
+
+    return key_filter
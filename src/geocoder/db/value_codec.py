@@ -0,0 +1,119 @@
+"""
+RocksDB 값 codec
+
+geocode, reverse, hd_history, bigcache DB의 JSON 값을 같은 방식으로 인코딩, 디코딩합니다.
+값의 첫 byte(format byte)로 형식을 구분하므로 VALUE_CODEC을 바꿔도 기존 값을 그대로 읽습니다.
+(기존 DB를 새 형식으로 바꾸려면 cli/reencode_values.py)
+
+format byte:
+    없음: json. 기존 형식 (json.dumps 기본값, "[" 또는 "{"로 시작)
+    0x01: compact. 공백 없는 UTF-8 JSON (ensure_ascii=False). 한글 한 글자가 6 bytes(\\uXXXX)에서 3 bytes로 줄어듦
+    0x02: GEOCODE_DB 후보 리스트 value_layout v2 (src/geocoder/value_layout.py)
+    0x03: 조각에 레코드 id를 저장한 value_layout v2 (DEDUP_RECORDS)
+    0x04: h1_nm별 조각 키로 나눠 저장한 큰 후보 리스트의 조각 목록 (SPLIT_VALUE_MIN_RECORDS)
+
+WKT 문자열 등 JSON이 아닌 값은 codec을 거치지 않고 put/get으로 저장, 조회합니다.
+"""
+
+import json
+
+COMPACT_FORMAT = 0x01
+LAYOUT_FORMAT = 0x02
+REF_LAYOUT_FORMAT = 0x03
+SPLIT_FORMAT = 0x04
+
+
+class JsonCodec:
+    """기존 형식. format byte 없음"""
+
+    name = "json"
+    format = None
+
+    def encode(self, obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def decode(self, buf):
+        """buf: format byte를 포함한 값 (bytes 또는 memoryview)"""
+        return json.loads(str(buf, "utf-8"))
+
+
+class CompactJsonCodec:
+    """format byte 0x01 + 공백 없는 UTF-8 JSON"""
+
+    name = "compact"
+    format = COMPACT_FORMAT
+
+    _prefix = bytes([COMPACT_FORMAT])
+
+    def encode(self, obj) -> bytes:
+        return self._prefix + json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def decode(self, buf):
+        # memoryview 슬라이스는 복사하지 않음
+        return json.loads(str(memoryview(buf)[1:], "utf-8"))
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), CompactJsonCodec())}
+_CODECS_BY_FORMAT = {
+    codec.format: codec for codec in CODECS.values() if codec.format is not None
+}
+_JSON = CODECS["json"]
+
+
+def get_codec(name: str):
+    """
+    이름으로 codec을 찾습니다.
+
+    Raises:
+        ValueError: 알 수 없는 codec 이름
+    """
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 VALUE_CODEC: {name} (가능한 값: {list(CODECS)})")
+
+
+def value_format(buf):
+    """
+    값의 format byte. 기존 형식(json)이면 None
+
+    Args:
+        buf: 값 (bytes, memoryview 또는 get_string()으로 읽은 str)
+    """
+    if not buf:
+        return None
+    first = buf[0]
+    if isinstance(first, str):
+        first = ord(first)
+    # JSON 텍스트는 공백(0x09, 0x0a, 0x0d, 0x20) 외의 제어 문자로 시작하지 않음
+    return first if first < 0x09 else None
+
+
+def decode(buf):
+    """
+    format byte에 맞는 codec으로 디코딩합니다.
+
+    Args:
+        buf: 값 (bytes, memoryview 또는 get_string()으로 읽은 str)
+
+    Raises:
+        ValueError: 알 수 없는 format byte (value_layout v2 포함)
+    """
+    if isinstance(buf, str):
+        fmt = value_format(buf)
+        if fmt is None:
+            return json.loads(buf)
+        if fmt == COMPACT_FORMAT:
+            return json.loads(buf[1:])
+        buf = buf.encode("utf-8")
+
+    fmt = value_format(buf)
+    if fmt is None:
+        return _JSON.decode(buf)
+
+    codec = _CODECS_BY_FORMAT.get(fmt)
+    if codec is None:
+        raise ValueError(f"알 수 없는 값 형식: 0x{fmt:02x}")
+    return codec.decode(buf)
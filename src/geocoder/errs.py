@@ -32,6 +32,8 @@ ERR_NAME_RI = 51  # "RI NAME ERROR"
 ERR_NAME_H4 = 52  # "H4 NAME ERROR"
 ERR_NAME_H23 = 53  # "H23 NAME ERROR"
 
+ERR_DEADLINE_EXCEEDED = 61  # "DEADLINE_EXCEEDED ERROR"
+
 INFO_JIBUN_ADDRESS = 101  # "JIBUN ADDRESS INFO"
 INFO_BLD_ADDRESS = 102  # "BLD ADDRESS INFO"
 INFO_ROAD_ADDRESS = 103  # "ROAD ADDRESS INFO"
@@ -82,6 +84,7 @@ ERR_STR_MAP = {
     ERR_NAME_RI: "리 이름 오류",
     ERR_NAME_H4: "동 이름 오류",
     ERR_NAME_H23: "시군구 이름 오류",
+    ERR_DEADLINE_EXCEEDED: "검색 시간 초과",
     INFO_JIBUN_ADDRESS: "지번 주소",
     INFO_BLD_ADDRESS: "건물 주소",
     INFO_ROAD_ADDRESS: "도로명 주소",
@@ -281,6 +284,7 @@ class ErrList:
             ERR_REPRESENTATIVE_ADDRESS_NOT_FOUND: "대표 주소 없음",
             ERR_BLD_NM_NOT_FOUND: "건물명 없음",
             ERR_BLD_DONG_NOT_FOUND: "건물동 없음",
+            ERR_DEADLINE_EXCEEDED: "검색 시간 초과",
         }
 
         if err_cd in human_readable_map:
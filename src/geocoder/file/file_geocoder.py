@@ -33,6 +33,7 @@ class FileGeocoder:
         geocoder: Geocoder = None,
         reverse_geocoder: ReverseGeocoder = None,
         address_hint: str = None,
+        deadline_ms: int = None,
     ):
         """
         FileGeocoder 객체를 초기화합니다.
@@ -40,10 +41,13 @@ class FileGeocoder:
         Args:
             geocoder (Geocoder, optional): 지오코딩에 사용할 Geocoder 객체입니다. 기본값은 None입니다.
             그러나 Geocoder 객체를 지정하지 않으면 FileGeocoder 객체를 사용할 수 없습니다.
+            deadline_ms (int, optional): 주소 하나의 검색 제한 시간(ms). None이면 SEARCH_DEADLINE_MS.
+            한 행이 오래 걸려도 파일 전체가 멈추지 않도록 합니다.
         """
         self.geocoder = geocoder
         self.reverse_geocoder = reverse_geocoder
         self.address_hint = address_hint
+        self.deadline_ms = deadline_ms
 
         if address_hint:
             hash, toks, addressCls, err = geocoder.addressHash(address_hint)
@@ -760,7 +764,9 @@ class FileGeocoder:
             실패하면 기본 값이 반환됩니다.
             dict["success"]는 반드시 "실패", "성공" 중 하나입니다.
         """
-        val = self.geocoder.search(addr, self.address_hint_info)
+        val = self.geocoder.search(
+            addr, self.address_hint_info, deadline_ms=self.deadline_ms
+        )
         if val:
             self.enrich_geocode_result(full_history_list, val)
         else:
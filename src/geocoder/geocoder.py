@@ -1,18 +1,33 @@
 # python 3
 # -*- coding: utf-8 -*-
 
+import atexit
 import json
 import logging
-from difflib import SequenceMatcher
+import os
+from itertools import islice
 import threading
 
 import src.config as config
 from src.geocoder.address_cls import AddressCls
 from src.geocoder.hasher import Hasher
-from src.geocoder.possible_hash import PossibleHash, possible_hashs
+from src.geocoder.possible_hash import (
+    PossibleHash,
+    get_near_jibun_hashs,
+    get_near_road_bld_hashs,
+    possible_hashs,
+)
 
 # from .db.rocksdb import RocksDbGeocode
-from .db.gimi9_rocks import Gimi9RocksDB
+from .db.gimi9_rocks import Gimi9RocksDB, PinnedValue
+from .db.key_bloom import KeyBloomFilter, load_key_bloom
+from .candidates import MISSING, Candidates, sort_key
+from .near_index import has_near_index, near_hashs
+from .probe_planner import ProbePlanner
+from .result_cache import ResultCache
+from .search_budget import SearchBudget
+from .value_cache import DecodedValueCache, freeze, thaw
+from .value_layout import PartitionedValue, SplitValue, load_value
 
 # from .db.aimrocks import AimrocksDbGeocode
 from .hash.BldAddress import BldAddress
@@ -22,6 +37,8 @@ from .Tokenizer import Tokenizer
 from .tokens import *
 from .util.hcodematcher import HCodeMatcher
 from .util.HSimplifier import HSimplifier
+from .util.road_name_index import get_road_name_index
+from .util.bld_name_scorer import get_bld_name_scorer, normalize_bld_name
 from .errs import *
 from .pos_cd import *
 
@@ -39,6 +56,26 @@ logger.setLevel(config.LOG_LEVEL)
 IMPORTANT_ERROR = True
 NOT_IMPORTANT_ERROR = False
 
+# most_similar_address()에 미리 조회한 값이 없음을 나타내는 표식
+NOT_FETCHED = object()
+
+# filter_candidate_addresses: 행정구역, 도로명까지만 있는 주소의 pos_cd 조건과 후보가 없을 때의 오류
+END_ADDRESS_POS_CD = {
+    AddressCls.RI_END_ADDRESS: ((RI_ADDR_FILTER,), ERR_RI_NOT_FOUND),
+    AddressCls.ROAD_END_ADDRESS: ((ROAD_ADDR_FILTER,), ERR_ROAD_NOT_FOUND),
+    AddressCls.H4_END_ADDRESS: ((HD_ADDR_FILTER, LD_ADDR_FILTER), ERR_DONG_NOT_FOUND),
+    AddressCls.H23_END_ADDRESS: ((H23_ADDR_FILTER,), ERR_H23_NOT_FOUND),
+    AddressCls.H1_END_ADDRESS: ((H1_ADDR_FILTER,), ERR_H1_NOT_FOUND),
+}
+# 도로명 주소에서 road_cd 없이 허용하는 pos_cd (행정구역)
+ROAD_ADMIN_POS_CD = (
+    H23_ADDR_FILTER,
+    HD_ADDR_FILTER,
+    LD_ADDR_FILTER,
+    H1_ADDR_FILTER,
+    RI_ADDR_FILTER,
+)
+
 
 class Geocoder:
     """
@@ -124,7 +161,47 @@ class Geocoder:
     # }
 
     def __init__(self):
-        self._main_db = Gimi9RocksDB(config.GEOCODE_DB, read_only=config.READONLY)
+        self._main_db = Gimi9RocksDB(
+            config.GEOCODE_DB, read_only=config.READONLY, role="geocode"
+        )
+        self._key_filter: KeyBloomFilter = None
+        self._load_key_filter()
+        # possible_hashs 후보 조회 계획 (중복 제거, 성공률 낮은 후보 종류 건너뜀)
+        self._probe_planner: ProbePlanner = None
+        if config.PROBE_PLANNER:
+            # 통계 파일은 설정한 경우에만 저장. "{pid}"는 프로세스 id로 바꿈
+            stats_file = config.PROBE_STATS_FILE.replace("{pid}", str(os.getpid()))
+            self._probe_planner = ProbePlanner(
+                stats_file or None,
+                min_hit_rate=config.PROBE_PRUNE_MIN_HIT_RATE,
+                min_attempts=config.PROBE_PRUNE_MIN_ATTEMPTS,
+                explore_interval=config.PROBE_EXPLORE_INTERVAL,
+                save_interval=config.PROBE_STATS_SAVE_INTERVAL,
+            )
+            if stats_file:
+                atexit.register(self._probe_planner.save)
+        # 유일한 도로명 색인 (시군구명 누락, 오타 교정)
+        self._road_name_index = (
+            get_road_name_index() if config.USE_ROAD_NAME_INDEX else None
+        )
+        # 인근 번호 인덱스 조회 함수 (인덱스가 없으면 None)
+        self._near_index = None
+        self._load_near_index()
+
+        # DB를 다시 열 때마다 증가. 결과 캐시 버전에 사용
+        self._db_generation = 0
+        # 입력 주소(+힌트) 기준 결과 캐시
+        self._result_cache = ResultCache(
+            "address", config.RESULT_CACHE_MAX_BYTES, config.RESULT_CACHE_TTL
+        )
+        # 정규화된 hash 기준 결과 캐시 (표기가 달라도 같은 hash면 공유)
+        self._hash_result_cache = ResultCache(
+            "hash", config.HASH_RESULT_CACHE_MAX_BYTES, config.RESULT_CACHE_TTL
+        )
+        # DB 키별 디코딩한 후보 리스트 캐시
+        self._value_cache = DecodedValueCache(config.DECODED_VALUE_CACHE_MAX_BYTES)
+        # 건물명 유사도 계산
+        self.bld_name_scorer = get_bld_name_scorer(config.BLD_NAME_SCORER)
         # self._secondary_db = []
         # for i in range(0, config.THREAD_POOL_SIZE):
         #     self._secondary_db.append(
@@ -173,6 +250,117 @@ class Geocoder:
         # # print(index)
         # return db
 
+    def _load_key_filter(self):
+        """
+        GEOCODE_DB 키 bloom filter를 읽습니다.
+        쓰기 가능 모드에서는 필터에 없는 키가 추가될 수 있으므로 사용하지 않습니다.
+        """
+        key_filter = None
+        if config.USE_KEY_BLOOM_FILTER and config.READONLY:
+            key_filter = load_key_bloom(
+                config.GEOCODE_BLOOM_FILTER, self._main_db.latest_sequence_number()
+            )
+            if key_filter:
+                logger.info(f"key bloom filter: {key_filter.stats()}")
+            else:
+                logger.info(
+                    f"key bloom filter 사용 안 함 (없거나 DB와 버전 다름): {config.GEOCODE_BLOOM_FILTER}"
+                )
+
+        # 기존 필터를 사용 중인 스레드가 있을 수 있으므로 닫지 않고 교체 (GC가 해제)
+        self._key_filter = key_filter
+
+    def reload_db(self):
+        """
+        GEOCODE_DB를 다시 열고 bloom filter도 다시 읽습니다.
+        DB 디렉토리를 교체한 뒤 호출합니다.
+        """
+        if config.READONLY:
+            # 읽기 전용은 같은 경로를 여러 번 열 수 있으므로 새로 열고 교체.
+            # 기존 DB는 사용 중인 스레드가 끝나면 해제된다.
+            self._main_db = Gimi9RocksDB(
+                config.GEOCODE_DB, read_only=True, role="geocode"
+            )
+        else:
+            # 쓰기 모드는 LOCK 때문에 닫고 다시 연다. (updater가 같은 객체를 참조)
+            self._main_db.open(config.GEOCODE_DB, read_only=False, role="geocode")
+
+        self._db_generation += 1
+        self._load_key_filter()
+        self._load_near_index()
+
+    def _load_near_index(self):
+        """인근 번호 인덱스가 있는 DB이면 possible_hashs()에서 인덱스를 사용"""
+        near_index = None
+        if config.NEAR_INDEX:
+            if has_near_index(self._main_db):
+                near_index = self.near_hashs
+                logger.info("인근 번호 인덱스 사용")
+            else:
+                logger.info("인근 번호 인덱스 사용 안 함 (없음): cli/build_near_index.py")
+        self._near_index = near_index
+
+    def near_hashs(self, hash: str, road: bool = False) -> list:
+        """
+        인근 번호 인덱스에서 가까운 지번, 건물번호의 hash를 찾습니다.
+        조회 중 오류가 나면 번호를 추정한 hash를 반환합니다.
+
+        Returns:
+            list: [(hash, 번호), ...]
+        """
+        try:
+            return near_hashs(self._get_db(), hash, road, config.NEAR_INDEX_LIMIT)
+        except Exception as e:
+            logger.warning(f"인근 번호 인덱스 조회 실패: {hash}: {e}")
+            if road:
+                return get_near_road_bld_hashs(hash)
+            return get_near_jibun_hashs(hash)
+
+    def _db_version(self):
+        """
+        결과 캐시에 사용하는 DB 버전.
+        DB를 다시 열거나 DB에 쓰기가 있으면 바뀝니다.
+        """
+        return (self._db_generation, self._main_db.latest_sequence_number())
+
+    def result_cache_stats(self):
+        """
+        결과 캐시 통계
+
+        Returns:
+            list: 입력 주소 캐시, hash 캐시 통계
+        """
+        return [self._result_cache.stats(), self._hash_result_cache.stats()]
+
+    def value_cache_stats(self):
+        """
+        디코딩한 후보 리스트 캐시 통계
+
+        Returns:
+            dict
+        """
+        return self._value_cache.stats()
+
+    def probe_stats(self):
+        """
+        possible_hashs 후보 종류별 조회 통계
+
+        Returns:
+            dict 또는 None (PROBE_PLANNER 사용 안 함)
+        """
+        planner = self._probe_planner
+        return planner.stats() if planner else None
+
+    def key_filter_stats(self):
+        """
+        bloom filter 통계
+
+        Returns:
+            dict 또는 None (필터 사용 안 함)
+        """
+        key_filter = self._key_filter
+        return key_filter.stats() if key_filter else None
+
     # def open(self, db):
     #     self.db = db
 
@@ -244,8 +432,18 @@ class Geocoder:
         return self.hasher.addressHash(addr)
 
     def _fix_h23_nm(self, toks: Tokens):
+        """
+        시군구명 오타를 교정한 주소의 hash를 계산합니다.
+
+        이름만 바꾸는 경우 다시 토큰화하지 않고 토큰을 교체해 hash만 다시 계산합니다.
+        toks는 addressHash 캐시의 토큰(수정 불가)이므로 고치지 않습니다.
+
+        Returns:
+            tuple 또는 None: (교정한 주소, addressHash()와 같은 (hash, toks, addressCls, errmsg)).
+                교정할 것이 없으면 None.
+        """
         if len(toks) < 2:
-            return False
+            return None
 
         h23_pos = toks.index(TOKEN_H23)
         h1_nm = toks.get_text(TOKEN_H1)
@@ -260,16 +458,75 @@ class Geocoder:
 
             fixed_h23_nm = self.hcodeMatcher.search_most_likely_h23_nm(h23_nm, h1_cd)
             if not fixed_h23_nm:
-                # 시군구명 삭제
+                # 시군구명 삭제. 앞뒤 토큰 유형이 달라질 수 있으므로 다시 토큰화
                 logger.debug(f"유효하지 않은 시군구명: {h23_nm}")
-                toks.delete(h23_pos)
-                return True
+                fixed = toks.copy()
+                fixed.delete(h23_pos)
+                address = fixed.to_address()
+                return address, self.hasher.addressHash(address)
             elif fixed_h23_nm and fixed_h23_nm != h23_nm:
                 logger.debug(f"h23_nm 오타 교정: {h23_nm} -> {fixed_h23_nm}")
-                toks.get(h23_pos).val = fixed_h23_nm
-                return True
+                if " " in fixed_h23_nm:
+                    # 수원시 장안구 처럼 두 단어이면 토큰화에서 합쳐지므로 다시 토큰화
+                    fixed = toks.copy()
+                    fixed.get(h23_pos).val = fixed_h23_nm
+                    address = fixed.to_address()
+                    return address, self.hasher.addressHash(address)
+                result = self.hasher.rehash(toks, {h23_pos: fixed_h23_nm})
+                return result[1].to_address(), result
+
+        return None
+
+    def _fix_h23_by_road(self, toks: Tokens):
+        """
+        도로명이 광역시도(광역시도명이 없으면 전국)에서 유일하면
+        시군구명이 없거나 오타인 주소를 도로명 색인의 시군구명으로 교정한 주소의 hash를 계산합니다.
+        오타 교정(_fix_h23_nm) 없이 색인 조회 한 번으로 교정합니다.
+
+        시군구명이 다른 시군구의 올바른 이름이면 교정하지 않습니다.
 
-        return False
+        Returns:
+            tuple 또는 None: _fix_h23_nm()과 같음. 교정할 것이 없으면 None.
+        """
+        if self._road_name_index is None:
+            return None
+
+        road_pos = toks.index(TOKEN_ROAD)
+        if road_pos < 0:
+            return None
+
+        h1_nm = self.hsimplifier.h1Hash(toks.get_text(TOKEN_H1)) or None
+        road = self.roadAddress.roadSimplifier.roadHash(toks.get(road_pos).val)
+        found = self._road_name_index.lookup(road, h1_nm)
+        if found is None:
+            return None
+        fixed_h23_nm, _ = found
+
+        h23_pos = toks.index(TOKEN_H23)
+        if h23_pos > -1:
+            h23_nm = toks.get(h23_pos).val
+            if self.hsimplifier.h23Hash(h23_nm) == self.hsimplifier.h23Hash(
+                fixed_h23_nm
+            ):
+                return None
+            h1_cd = self.hcodeMatcher.search_h1_cd(h1_nm) if h1_nm else None
+            if self.hcodeMatcher.is_h23_nm(h23_nm, h1_cd):
+                return None
+
+            logger.debug(f"도로명 {road} h23_nm 교정: {h23_nm} -> {fixed_h23_nm}")
+            if " " not in fixed_h23_nm:
+                result = self.hasher.rehash(toks, {h23_pos: fixed_h23_nm})
+                return result[1].to_address(), result
+            vals = [toks.get(i).val for i in range(len(toks))]
+            vals[h23_pos] = fixed_h23_nm
+        else:
+            # 광역시도명 뒤에 시군구명 추가
+            logger.debug(f"도로명 {road} h23_nm 추가: {fixed_h23_nm}")
+            vals = [toks.get(i).val for i in range(len(toks))]
+            vals.insert(toks.index(TOKEN_H1) + 1, fixed_h23_nm)
+
+        address = " ".join(val for val in vals if val)
+        return address, self.hasher.addressHash(address)
 
     def _apply_hint(self, address_hint_info, toks, address):
         if address_hint_info:
@@ -284,7 +541,85 @@ class Geocoder:
                 return f'{address} {address_hint_info.get("h23", "")}'.strip()
         return None
 
-    def search(self, addr, address_hint_info={}):
+    def search(self, addr, address_hint_info={}, deadline_ms: int = None):
+        """
+        주소를 검색합니다. 같은 주소(+힌트)의 결과는 캐시에서 반환합니다.
+
+        Args:
+            addr (str): 검색할 주소.
+            address_hint_info (dict): 주소 힌트 (h1, h23).
+            deadline_ms (int): 검색 제한 시간 (ms). None이면 SEARCH_DEADLINE_MS, 0이면 제한 없음.
+                제한 시간이 지나면 남은 후보를 조회하지 않고 ERR_DEADLINE_EXCEEDED 실패 결과를 반환합니다.
+
+        Returns:
+            dict 또는 None: 검색 결과. 호출자가 수정해도 되는 새 dict.
+        """
+        if not isinstance(addr, str):
+            return None
+
+        if deadline_ms is None:
+            deadline_ms = config.SEARCH_DEADLINE_MS
+        budget = SearchBudget(deadline_ms, config.SEARCH_MAX_PROBES)
+
+        if not config.USE_RESULT_CACHE:
+            return self._search(addr, address_hint_info, budget=budget)
+
+        # 성공률이 낮아 건너뛴 후보 (probe_planner)
+        pruned = []
+
+        version = self._db_version()
+        key = (
+            f"{addr}\t{json.dumps(address_hint_info, sort_keys=True, ensure_ascii=False)}"
+            if address_hint_info
+            else addr
+        )
+        val = self._result_cache.get(key, version)
+        if val is not None:
+            return val
+
+        val = self._search(
+            addr, address_hint_info, version=version, budget=budget, pruned=pruned
+        )
+        # 제한 시간을 넘은 결과는 제한이 다른 요청에서 다를 수 있으므로 캐시하지 않음
+        # 후보를 건너뛰고 실패한 결과도 건너뛴 후보에서 찾을 수 있었으므로 캐시하지 않음
+        if (
+            val is not None
+            and not budget.exceeded
+            and not (pruned and not val.get("success"))
+        ):
+            self._result_cache.put(key, val, version)
+        return val
+
+    def _hash_result_cache_key(
+        self, toks: Tokens, hash, addressCls, h1_nm, h23_nm, address_hint_info=None
+    ):
+        """
+        hash 결과 캐시 키.
+        캐시한 값은 입력 hash가 아니라 성공한 후보(possible_hashs)의 결과이므로,
+        hash 외에 후보와 pos_cd 필터를 정하는 토큰 유형 순서, 주소 힌트와
+        후보 선택에 쓰이는 h1, h23, 건물명(동)을 포함합니다.
+        """
+        bld_nm = " ".join(
+            toks.get(i).val
+            for i in range(len(toks))
+            if toks.get(i).t in (TOKEN_BLD, TOKEN_BLD_DONG)
+        )
+        types = ",".join(toks.get(i).t for i in range(len(toks)))
+        hint = (
+            json.dumps(address_hint_info, sort_keys=True, ensure_ascii=False)
+            if address_hint_info
+            else ""
+        )
+        return f"{addressCls.value}|{hash}|{h1_nm}|{h23_nm}|{bld_nm}|{types}|{hint}"
+
+    def _search(
+        self,
+        addr,
+        address_hint_info={},
+        version=None,
+        budget: SearchBudget = None,
+        pruned: list = None,
+    ):
         if not isinstance(addr, str):
             return None
 
@@ -321,21 +656,40 @@ class Geocoder:
             }
         toksString = self.tokenizer.getToksString(toks)
 
-        # h23 오타 교정
-        if self._fix_h23_nm(toks):
-            address = toks.to_address()
-            hash, toks, addressCls, err = self.hasher.addressHash(address)
+        # h23 누락, 오타 교정. 유일한 도로명이면 도로명 색인으로
+        if fixed := self._fix_h23_by_road(toks) or self._fix_h23_nm(toks):
+            address, (hash, toks, addressCls, err) = fixed
 
         h1_nm = self.hsimplifier.h1Hash(toks.get_text(TOKEN_H1)) or None
         h23_nm = self.hsimplifier.h23Hash(toks.get_text(TOKEN_H23)) or None
 
+        # 표기가 달라도 정규화 hash가 같으면 결과 공유 (성공한 결과만 저장)
+        hash_cache_key = None
+        if version is not None:
+            hash_cache_key = self._hash_result_cache_key(
+                toks, hash, addressCls, h1_nm, h23_nm, address_hint_info
+            )
+            val = self._hash_result_cache.get(hash_cache_key, version)
+            if val is not None:
+                val["address"] = address
+                val["toksString"] = self.tokenizer.getToksString(toks)
+                return val
+
+        # 세종시 주소는 most_similar_address()가 토큰 유형을 바꾸므로
+        # 캐시의 토큰(수정 불가) 대신 이 요청만 쓰는 복사본 사용
+        t0 = toks.get(0) if len(toks) else None
+        sejong = bool(t0 and t0.t == TOKEN_H23 and t0.val.startswith("세종"))
+        if sejong:
+            toks = toks.copy()
+
+        # 이미 조회하고 실패한 후보 -> 조회 후의 last_err (probe_planner)
+        # 세종시 주소는 토큰이 바뀌어 같은 후보도 결과가 다를 수 있으므로 사용 안 함
+        probed = {} if self._probe_planner and not sejong else None
+
         last_err_for_hash_condition = None
         hash_info: PossibleHash = None
-        for hash_info in possible_hashs(
-            toks,
-            hash,
-            self.hasher,
-            addressCls,
+        for hash_info, value in self._probe_hashs(
+            toks, hash, addressCls, pruned, budget
         ):
 
             logger.debug(f"검색: [ {str(hash_info)} ]")
@@ -346,6 +700,22 @@ class Geocoder:
             if hash_info.pass_condition(last_err_for_hash_condition):
                 continue
 
+            # 같은 요청에서 이미 조회하고 실패한 후보는 다시 조회하지 않고 같은 오류 처리
+            probe_key = None
+            if probed is not None:
+                probe_key = ProbePlanner.probe_key(hash_info)
+                if probe_key in probed:
+                    self._probe_planner.record_dedup()
+                    last_err_for_hash_condition = probed[probe_key]
+                    self._append_err(
+                        err_list, hash_info.get_err_failed(), hash_info.get_err_detail()
+                    )
+                    continue
+
+            # 검색 제한 시간, 최대 후보 조회 수
+            if budget and not budget.spend():
+                break
+
             val, important_error = self.most_similar_address(
                 toks,
                 hash,
@@ -354,7 +724,10 @@ class Geocoder:
                 err_list=err_list,
                 h1_nm=h1_nm,
                 h23_nm=h23_nm,
+                value=value,
             )
+            if self._probe_planner:
+                self._probe_planner.record(addressCls, hash_info, bool(val))
             err_failed = hash_info.get_err_failed()
             err_detail = hash_info.get_err_detail()
 
@@ -377,6 +750,8 @@ class Geocoder:
                     elif hash_info.get_info_success() == INFO_NEAR_ROAD_BLD_FOUND:
                         val["pos_cd"] = NEAR_ROAD_BLD
 
+                # 검색용 정규화 건물명은 결과에서 제외
+                val.pop("bmn", None)
                 val["success"] = True
                 val["errmsg"] = ""
                 if "pos_cd" not in val:
@@ -421,17 +796,26 @@ class Geocoder:
                     filter_to_pos_cd(val.get("pos_cd")) if val.get("pos_cd") else ""
                 )
 
+                if hash_cache_key:
+                    self._hash_result_cache.put(hash_cache_key, val, version)
+
                 return val
             else:
                 last_err_for_hash_condition = (
                     err_list.last_err().get("err_cd") if err_list.last_err() else None
                 )
+                if probe_key is not None:
+                    probed[probe_key] = last_err_for_hash_condition
 
                 if important_error and not h23_nm:
                     break
 
                 self._append_err(err_list, err_failed, err_detail)
 
+        if budget and budget.exceeded:
+            logger.debug(f"검색 시간 초과: {budget.detail()}")
+            self._append_err(err_list, ERR_DEADLINE_EXCEEDED, budget.detail())
+
         # self._append_err(err_list, ERR_NOT_FOUND)
         errmsg = self._err_message(err_list, addressCls.value, "")
         ac = hash_info.get_addressCls().value if hash_info else None
@@ -449,6 +833,102 @@ class Geocoder:
 
         return val
 
+    def _probe_hashs(
+        self,
+        toks: Tokens,
+        hash: str,
+        addressCls,
+        pruned: list = None,
+        budget: SearchBudget = None,
+    ):
+        """
+        possible_hashs()의 후보 hash를 순서대로 반환합니다.
+        SEARCH_PROBE_BATCH_SIZE가 1보다 크면 첫 후보는 단건 조회하고,
+        이후 후보는 N개씩 모아 multi_get으로 한 번에 조회합니다.
+        반환 순서는 possible_hashs()와 같으므로 first-match-wins는 유지됩니다.
+
+        Args:
+            toks (Tokens): 주소 토큰.
+            hash (str): 주소 hash.
+            addressCls: 주소 유형.
+            pruned (list): 성공률이 낮아 건너뛴 후보를 추가할 list (ProbePlanner.plan).
+            budget (SearchBudget): 검색 제한. 배치 조회 전에 확인하고, 남은 조회 수만큼만 조회합니다.
+                제한을 넘었는데 남은 후보가 있으면 budget.exceeded = True로 끝냅니다.
+
+        Yields:
+            tuple: (PossibleHash, 조회한 값 또는 NOT_FETCHED)
+        """
+        hash_iter = possible_hashs(
+            toks, hash, self.hasher, addressCls, near_index=self._near_index
+        )
+        batch_size = config.SEARCH_PROBE_BATCH_SIZE
+
+        # 세종시 주소는 첫 조회 성공 시 most_similar_address()가 토큰 유형을 바꾸므로
+        # 후보를 미리 만들면 순서가 달라질 수 있다. 하나씩 조회한다.
+        # 같은 hash라도 토큰이 바뀌면 결과가 다를 수 있으므로 조회 계획도 사용하지 않는다.
+        t0 = toks.get(0)
+        if batch_size <= 1 or (t0 and t0.t == TOKEN_H23 and t0.val.startswith("세종")):
+            for hash_info in hash_iter:
+                yield hash_info, NOT_FETCHED
+            return
+
+        # 성공률이 낮은 후보 종류 제외 (PROBE_PRUNE_MIN_HIT_RATE > 0일 때만)
+        if self._probe_planner:
+            hash_iter = self._probe_planner.plan(addressCls, hash_iter, pruned)
+
+        # 대부분 첫 후보에서 찾으므로 첫 후보는 단건 조회
+        for hash_info in islice(hash_iter, 1):
+            yield hash_info, NOT_FETCHED
+
+        while True:
+            size = batch_size
+            if budget:
+                remaining = budget.remaining()
+                if remaining == 0:
+                    # 남은 후보가 있을 때만 제한 초과
+                    if next(hash_iter, None) is not None:
+                        budget.exceeded = True
+                    return
+                if remaining is not None:
+                    size = min(size, remaining)
+
+            batch = list(islice(hash_iter, size))
+            if not batch:
+                return
+
+            keys = [hash_info.get_hash() or "" for hash_info in batch]
+
+            # 디코딩 캐시에 있는 키는 조회하지 않음 (NOT_FETCHED로 넘겨 캐시에서 읽음)
+            # bloom filter로 확실히 없는 키도 조회하지 않음
+            key_filter = self._key_filter
+            version = self._db_version()
+            cached_keys = {
+                key for key in keys if self._value_cache.contains(key, version)
+            }
+            # 같은 배치의 중복 키는 한 번만 조회
+            fetch_keys = [
+                key
+                for key in dict.fromkeys(keys)
+                if key not in cached_keys
+                and (not key_filter or key_filter.may_contain(key))
+            ]
+
+            try:
+                fetched = dict(zip(fetch_keys, self._get_db().multi_get(fetch_keys)))
+                values = [
+                    NOT_FETCHED if key in cached_keys else fetched.get(key)
+                    for key in keys
+                ]
+                if key_filter:
+                    for key in fetch_keys:
+                        if fetched[key] is None:
+                            key_filter.record_false_positive()
+            except Exception:
+                values = [NOT_FETCHED] * len(batch)
+
+            for hash_info, value in zip(batch, values):
+                yield hash_info, value
+
     def get_h1(self, val):
         """
         주어진 값에서 특정 키의 h1 코드인 첫 두 문자를 반환합니다.
@@ -505,6 +985,18 @@ class Geocoder:
         pos_cd_filter: set = None,
         err_list: ErrList = None,
     ):
+        """
+        후보 주소를 입력 주소의 조건으로 거르고 정렬합니다.
+
+        후보 리스트의 필터링용 필드(Candidates.filter_rows)를 한 번 순회하며 후보마다 통과한 단계를 구합니다.
+        단계: 1 h1_nm, 2 좌표, 3 주소 유형별 조건(pos_cd 등), 4 h23_nm, 5 도로명 코드(도로명 주소)
+        오류는 단계 순서대로, 각 단계까지 남은 후보로 판정합니다.
+        필터링용 필드는 정렬 순서이므로 남은 후보를 다시 정렬하지 않습니다.
+
+        Returns:
+            tuple: (후보 리스트, important_error)
+        """
+
         # "청주시 흥덕구"는 "청주시" 또는 "흥덕구"로 입력된 주소일 수 있다.
         def h23_compare(db_h23_nm, in_h23_nm):
             if " " in db_h23_nm:
@@ -517,239 +1009,207 @@ class Geocoder:
             else:
                 return self.hsimplifier.h23Hash(db_h23_nm) == in_h23_nm
 
-        # logger.debug(f"filter_candidate_addresses: {len(candidate_addresses)}")
-        if h1_nm:
-            # h1_nm 같은 것만 선택
-            candidate_addresses = [
-                r for r in candidate_addresses if r["h1_nm"] == h1_nm
-            ]
-            if not candidate_addresses:
-                return [], NOT_IMPORTANT_ERROR
+        if not isinstance(candidate_addresses, Candidates):
+            candidate_addresses = Candidates(candidate_addresses)
+        rows, presorted = candidate_addresses.filter_rows()
+
+        is_jibun = addressCls == AddressCls.JIBUN_ADDRESS
+        is_road = addressCls == AddressCls.ROAD_ADDRESS
+        is_bld = addressCls == AddressCls.BLD_ADDRESS
+        end_pos_cd, end_err = None, None
+        if not pos_cd_filter:
+            end_pos_cd, end_err = END_ADDRESS_POS_CD.get(addressCls, (None, None))
+
+        # 시군구명 비교 (지번 주소, 시군구가 있는 도로명 주소)
+        h23_filter = bool(
+            not pos_cd_filter
+            and h23_nm
+            and (is_jibun or (is_road and toks.hasTypes(TOKEN_H23)))
+        )
+
+        # 3단계: 주소 유형별 조건
+        if pos_cd_filter:
+
+            def type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                return (pos_cd if has_pos_cd else "") in pos_cd_filter
+
+        elif is_jibun:
+            # 지번 주소는 pos_cd가 없을 수 있음
+
+            def type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                return not has_pos_cd
+
+        elif is_road:
+            # 12자의 road_cd가 존재해야 함
+
+            def type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                return road_cd and len(road_cd) == 12
+
+        elif is_bld:
+
+            def type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                return bm
+
+        elif end_pos_cd:
+
+            def type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                return pos_cd in end_pos_cd
+
+        else:
+            type_ok = None
+
+        # 후보별 통과한 단계 수
+        passed = []
+        for r, h1, x, has_pos_cd, pos_cd, h23, road_cd, bm, _, _ in rows:
+            if h1_nm and h1 != h1_nm:
+                passed.append(0)
+            elif not x:
+                passed.append(1)
+            elif type_ok and not type_ok(has_pos_cd, pos_cd, road_cd, bm):
+                passed.append(2)
+            elif h23_filter and not h23_compare(h23, h23_nm):
+                passed.append(3)
+            elif is_road and not (road_cd or pos_cd in ROAD_ADMIN_POS_CD):
+                passed.append(4)
+            else:
+                passed.append(5)
+
+        def alive(stage):
+            return [row for row, p in zip(rows, passed) if p >= stage]
+
+        if h1_nm and not any(p >= 1 for p in passed):
+            return [], NOT_IMPORTANT_ERROR
 
         # 좌표 없는 것 필터링
-        candidate_addresses = [r for r in candidate_addresses if r["x"]]
-        if not candidate_addresses:
+        if not any(p >= 2 for p in passed):
             self.append_err(ERR_NOT_FOUND, "좌표 없는 주소", err_list=err_list)
             return [], NOT_IMPORTANT_ERROR
 
         if pos_cd_filter:
-            # pos_cd_filter가 있는 경우 필터링
-            candidate_addresses = [
-                r for r in candidate_addresses if r.get("pos_cd", "") in pos_cd_filter
-            ]
-            if not candidate_addresses:
+            if not any(p >= 3 for p in passed):
                 self.append_err(
                     ERR_POS_CD_NOT_FOUND, str(pos_cd_filter), err_list=err_list
                 )
                 return [], NOT_IMPORTANT_ERROR
-        else:
-            if addressCls == AddressCls.JIBUN_ADDRESS:
-                # 지번 주소는 pos_cd가 없을 수 있음
-                candidate_addresses = [
-                    r for r in candidate_addresses if "pos_cd" not in r
-                ]
-
-                # h23_nm이 일치해야 함.
-                if h23_nm:
-                    candidate_addresses = [
-                        r
-                        for r in candidate_addresses
-                        if h23_compare(r.get("h23_nm"), h23_nm)
-                    ]
-                else:  # h23_nm이 없는 경우 후보 데이터의 h23_nm이 유일해야 함
-                    h23_nm_set = {r["h23_nm"] for r in candidate_addresses}
-                    if len(h23_nm_set) > 1:
-                        self.append_err(
-                            ERR_NOT_UNIQUE_H23_NM, str(h23_nm_set), err_list=err_list
-                        )
-                        # self.important_error = True
-                        return [], IMPORTANT_ERROR
-
-            elif addressCls == AddressCls.ROAD_ADDRESS:
-                # 12자의 road_cd가 존재해야 함
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("road_cd") and len(r["road_cd"]) == 12
-                ]
+        elif is_jibun:
+            # 지번 주소는 pos_cd가 없을 수 있음. h23_nm이 있으면 일치해야 함.
+            if not h23_nm:
+                # h23_nm이 없는 경우 후보 데이터의 h23_nm이 유일해야 함
+                h23_nm_set = {row[5] for row in alive(3)}
+                if len(h23_nm_set) > 1:
+                    self.append_err(
+                        ERR_NOT_UNIQUE_H23_NM, str(h23_nm_set), err_list=err_list
+                    )
+                    return [], IMPORTANT_ERROR
+        elif is_road:
+            # 12자의 road_cd가 존재해야 함
+            # 도로명으로 시작하는 주소인 경우 h23_nm이 같아야 함.
+            # 시군구를 제거하고 시도하는 경우에 해당될 수 있음. possible_hash 방식으로 변경 후 원래 주소의 toks를 변경하지 않고 전달 함.
+            # 너무 복잡하니까 그냥 둔다.
+            if toks.get(0).t == TOKEN_ROAD:
+                h23_nm_set = {row[5] for row in alive(3)}
+                if len(h23_nm_set) > 1:
+                    self.append_err(
+                        ERR_ROAD_NOT_UNIQUE_H23_NM,
+                        str(h23_nm_set),
+                        err_list=err_list,
+                    )
+                    return [], IMPORTANT_ERROR
 
-                # 도로명으로 시작하는 주소인 경우 h23_nm이 같아야 함.
-                # 시군구를 제거하고 시도하는 경우에 해당될 수 있음. possible_hash 방식으로 변경 후 원래 주소의 toks를 변경하지 않고 전달 함.
-                # 너무 복잡하니까 그냥 둔다.
-                if toks.get(0).t == TOKEN_ROAD:
-                    h23_nm_set = {r["h23_nm"] for r in candidate_addresses}
-                    if len(h23_nm_set) > 1:
-                        self.append_err(
-                            ERR_ROAD_NOT_UNIQUE_H23_NM,
-                            str(h23_nm_set),
-                            err_list=err_list,
-                        )
-                        # self.important_error = True
-                        return [], IMPORTANT_ERROR
-
-                if addressCls == AddressCls.ROAD_ADDRESS and toks.hasTypes(TOKEN_H23):
-                    h23_nm_set = {r["h23_nm"] for r in candidate_addresses}
-                    h23_hash = self.hsimplifier.h23Hash(toks.get_text(TOKEN_H23))
-                    # 도로명 주소 후보자의 h23_nm이 모두 같아야 함
-                    if len(h23_nm_set) > 1:
-                        # self.important_error = True
-                        self.append_err(
-                            ERR_ROAD_NOT_UNIQUE_H23_NM,
-                            str(h23_nm_set),
-                            err_list=err_list,
-                        )
-                        return [], IMPORTANT_ERROR
-                    else:
-                        if h23_nm:
-                            candidate_addresses = [
-                                r
-                                for r in candidate_addresses
-                                if h23_compare(r.get("h23_nm"), h23_nm)
-                            ]
-
-                        if not candidate_addresses:
-                            self.append_err(
-                                ERR_H23_NOT_FOUND,
-                                h23_nm,
-                                err_list=err_list,
-                            )
-                            return [], NOT_IMPORTANT_ERROR
-
-                        # 경기도이며 h23_nm이 모두 같다면 입력 주소의 h23_nm과 후보자의 h23_nm이 일치해야 함
-                        # if h1_nm == "경기" and h23_hash != self.hsimplifier.h23Hash(
-                        #     next(iter(h23_nm_set))
-                        # ).replace(" ", ""):
-                        #     self.important_error = True
-                        #     return [], IMPORTANT_ERROR
-
-            elif addressCls == AddressCls.BLD_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("bm")
-                    # or "bld_reg" in r
-                    # or "bld_nm_text" in r
-                    # or "bld_nm" in r
-                ]
-            elif addressCls == AddressCls.RI_END_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("pos_cd") in [RI_ADDR_FILTER]
-                ]
-                if not candidate_addresses:
-                    self.append_err(ERR_RI_NOT_FOUND, err_list=err_list)
-                    return [], NOT_IMPORTANT_ERROR
-            elif addressCls == AddressCls.ROAD_END_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("pos_cd") in [ROAD_ADDR_FILTER]
-                ]
-                if not candidate_addresses:
-                    self.append_err(ERR_ROAD_NOT_FOUND, err_list=err_list)
-                    return [], NOT_IMPORTANT_ERROR
-            elif addressCls == AddressCls.H4_END_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("pos_cd") in [HD_ADDR_FILTER, LD_ADDR_FILTER]
-                ]
-                if not candidate_addresses:
-                    self.append_err(ERR_DONG_NOT_FOUND, err_list=err_list)
-                    return [], NOT_IMPORTANT_ERROR
-            elif addressCls == AddressCls.H23_END_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("pos_cd") in [H23_ADDR_FILTER]
-                ]
-                if not candidate_addresses:
-                    self.append_err(ERR_H23_NOT_FOUND, err_list=err_list)
-                    return [], NOT_IMPORTANT_ERROR
-            elif addressCls == AddressCls.H1_END_ADDRESS:
-                candidate_addresses = [
-                    r
-                    for r in candidate_addresses
-                    if r.get("pos_cd") in [H1_ADDR_FILTER]
-                ]
-                if not candidate_addresses:
-                    self.append_err(ERR_H1_NOT_FOUND, err_list=err_list)
+            if toks.hasTypes(TOKEN_H23):
+                h23_nm_set = {row[5] for row in alive(3)}
+                # 도로명 주소 후보자의 h23_nm이 모두 같아야 함
+                if len(h23_nm_set) > 1:
+                    self.append_err(
+                        ERR_ROAD_NOT_UNIQUE_H23_NM,
+                        str(h23_nm_set),
+                        err_list=err_list,
+                    )
+                    return [], IMPORTANT_ERROR
+                elif not any(p >= 4 for p in passed):
+                    self.append_err(ERR_H23_NOT_FOUND, h23_nm, err_list=err_list)
                     return [], NOT_IMPORTANT_ERROR
-
-        if h1_nm and candidate_addresses:
-            # h1_nm 같은 것만 선택
-            candidate_addresses = [
-                r for r in candidate_addresses if r["h1_nm"] == h1_nm
-            ]
-            if not candidate_addresses:
-                self.append_err(ERR_H1_NM_NOT_FOUND, err_list=err_list)
+        elif end_pos_cd:
+            if not any(p >= 3 for p in passed):
+                self.append_err(end_err, err_list=err_list)
                 return [], NOT_IMPORTANT_ERROR
-        else:
+
+        candidates = alive(4)
+        if not (h1_nm and candidates):
             # h1_nm 없으면 모든 h1_nm이 같아야 함. 그렇지 않으면 None 반환
-            h1_nm_set = {r["h1_nm"] for r in candidate_addresses if "h1_nm" in r}
+            h1_nm_set = {row[1] for row in candidates if row[1] is not MISSING}
             if len(h1_nm_set) > 1:
                 self.append_err(ERR_NOT_UNIQUE_H1_NM, str(h1_nm_set), err_list=err_list)
                 return [], NOT_IMPORTANT_ERROR
 
-        if addressCls == addressCls.JIBUN_ADDRESS and toks.hasTypes(TOKEN_RI):
+        if is_jibun and toks.hasTypes(TOKEN_RI):
             # ri가 있는 경우 ri_nm이 같아야 함
-            ri_nm_set = {r["ri_nm"] for r in candidate_addresses if "ri_nm" in r}
+            ri_nm_set = {row[9] for row in candidates if row[8]}
             if len(ri_nm_set) > 1:
                 self.append_err(ERR_NOT_UNIQUE_RI_NM, str(ri_nm_set), err_list=err_list)
                 return [], NOT_IMPORTANT_ERROR
 
-        if addressCls == AddressCls.ROAD_ADDRESS:
+        if is_road:
             # 도로명주소는 rm 이 있어야 함
             # 단 pos_cd_filter가 행정구역인 경우는 제외
-            candidate_addresses = [
-                r
-                for r in candidate_addresses
-                if r.get("road_cd")
-                or r.get("pos_cd")
-                in [
-                    H23_ADDR_FILTER,
-                    HD_ADDR_FILTER,
-                    LD_ADDR_FILTER,
-                    H1_ADDR_FILTER,
-                    RI_ADDR_FILTER,
-                ]
-            ]
-
-            if not candidate_addresses:
+            candidates = alive(5)
+            if not candidates:
                 self.append_err(ERR_ROAD_NM_NOT_FOUND, err_list=err_list)
                 return [], NOT_IMPORTANT_ERROR
 
             if not h1_nm:
                 # h1_nm 없으면 모든 후보의 도로명 코드가 같아야 함
-                road_cds = {r.get("road_cd", "") for r in candidate_addresses}
+                road_cds = {row[6] for row in candidates}
                 if len(road_cds) > 1:
                     self.append_err(
                         ERR_NOT_UNIQUE_ROAD_CD, str(road_cds), err_list=err_list
                     )
                     return [], NOT_IMPORTANT_ERROR
 
-        # extras.get("updater") 우선순위. "roadbase_updater"를 가장 나중에, extras.get("yyyymm") 우선순위. 가장 최근 날짜를 우선으로 함.
-        # Sort by extras.get("updater") and extras.get("yyyymm")
-        candidate_addresses = sorted(
-            candidate_addresses,
-            key=lambda x: (
-                0 if x.get("extras", {}).get("updater") == "roadbase_updater" else 1,
-                x.get("extras", {}).get("yyyymm", ""),
-            ),
-            reverse=True,
-        )
-
-        # # d["bld_mgt_no"] 역순 정렬 (경험적으로 건물번호가 있으면 더 정확한 결과)
-        # candidate_addresses = sorted(
-        #     candidate_addresses,
-        #     key=lambda x: (
-        #         x.get("bld_mgt_no", "") if x.get("bld_mgt_no") is not None else ""
-        #     ),
-        #     reverse=True,
-        # )
+        candidate_addresses = [row[0] for row in candidates]
+        if not presorted:
+            # extras.get("updater") 우선순위. "roadbase_updater"를 가장 나중에, extras.get("yyyymm") 우선순위. 가장 최근 날짜를 우선으로 함.
+            candidate_addresses = sorted(candidate_addresses, key=sort_key, reverse=True)
         return candidate_addresses, False
 
+    def _load_shards(self, split: SplitValue, h1_nm, version) -> Candidates:
+        """
+        조각 키로 나눈 값의 후보 리스트. 조각 키 값은 조각 키로 캐시합니다.
+
+        h1_nm이 있으면 h1_nm 조각 키만, 없으면 모든 조각 키를 한 번의 multi_get으로 조회합니다.
+        """
+        keys = split.shard_keys(h1_nm)
+        shards = {}
+        missing = []
+        for key in keys:
+            value = self._value_cache.get(key, version)
+            if value is None:
+                missing.append(key)
+            else:
+                shards[key] = value
+
+        if missing:
+            db = self._get_db()
+            for key, o in zip(missing, db.multi_get(missing)):
+                if o is not None:
+                    loaded, size = load_value(o, db)
+                    shards[key] = self._value_cache.put(key, loaded, size, version)
+
+        parts = []
+        for key in keys:
+            value = shards.get(key)
+            if isinstance(value, PartitionedValue):
+                value = value.select(h1_nm)
+            if value:
+                parts.append(value)
+
+        if len(parts) == 1:
+            return parts[0]
+        records = []
+        for part in parts:
+            records.extend(part)
+        return Candidates(records)
+
     def most_similar_address(
         self,
         toks: Tokens,
@@ -759,6 +1219,7 @@ class Geocoder:
         err_list: ErrList = None,
         h1_nm: str = None,
         h23_nm: str = None,
+        value=NOT_FETCHED,
     ):
         """
         주어진 토큰과 키를 사용하여 가장 유사한 주소를 반환합니다.
@@ -766,6 +1227,7 @@ class Geocoder:
         Args:
             toks (list): 주소를 나타내는 토큰 리스트.
             key (str): 데이터베이스에서 검색할 키.
+            value: multi_get으로 미리 조회한 값. NOT_FETCHED이면 DB에서 조회.
 
         Returns:
             dict or None: 가장 유사한 주소를 나타내는 딕셔너리.
@@ -775,21 +1237,56 @@ class Geocoder:
             Exception: 데이터베이스 접근 또는 JSON 파싱 중 오류가 발생할 수 있습니다.
         """
         try:
-            o = self._get_db().get(hash)
-            if o == None:
-                logger.debug(f"Not Found: {addressCls}, hash: {hash}")
-                return None, NOT_IMPORTANT_ERROR
+            # 디코딩한 후보 리스트 캐시 (읽기 전용. 선택한 val은 thaw()로 복사해서 수정)
+            version = self._db_version()
+            candidate_addresses = self._value_cache.get(hash, version)
+            if candidate_addresses is None:
+                if value is NOT_FETCHED:
+                    # bloom filter로 확실히 없는 키는 조회하지 않음
+                    key_filter = self._key_filter
+                    if key_filter and not key_filter.may_contain(hash):
+                        logger.debug(f"Not Found (bloom): {addressCls}, hash: {hash}")
+                        return None, NOT_IMPORTANT_ERROR
+
+                    # 단건 조회는 고정(pin)된 블록에서 바로 디코딩 (bytes 복사 없음)
+                    o = self._get_db().get_pinned(hash)
+                    if o is None and key_filter:
+                        key_filter.record_false_positive()
+                else:
+                    o = value
+                if o is None:
+                    logger.debug(f"Not Found: {addressCls}, hash: {hash}")
+                    return None, NOT_IMPORTANT_ERROR
+
+                # 레코드 id를 저장한 값은 레코드를 한 번의 multi_get으로 조회 (DEDUP_RECORDS)
+                if isinstance(o, PinnedValue):
+                    with o:
+                        loaded, size = load_value(o.view, self._get_db())
+                    candidate_addresses = self._value_cache.put(
+                        hash, loaded, size, version
+                    )
+                elif isinstance(o, (str, bytes, bytearray)):
+                    loaded, size = load_value(o, self._get_db())
+                    candidate_addresses = self._value_cache.put(
+                        hash, loaded, size, version
+                    )
+                else:
+                    candidate_addresses = freeze(o)
+
+            if isinstance(candidate_addresses, SplitValue):
+                # 조각 키로 나눈 큰 값은 h1_nm 조각 키만 조회
+                candidate_addresses = self._load_shards(
+                    candidate_addresses, h1_nm, version
+                )
+            elif isinstance(candidate_addresses, PartitionedValue):
+                # h1_nm별로 나눈 값은 h1_nm 조각만 디코딩
+                candidate_addresses = candidate_addresses.select(h1_nm)
 
             t0 = toks.get(0)
             if t0.t == TOKEN_H23 and t0.val.startswith("세종"):
                 # 세종시 주소는 h1 없이 h23(세종시)으로 시작한다.
                 t0.t = TOKEN_H1
 
-            if isinstance(o, bytearray) or isinstance(o, bytes):
-                candidate_addresses = json.loads(o)
-            else:
-                candidate_addresses = o
-
             # h1 다르면 배제
             # h1_pos = toks.index(TOKEN_H1)
             # if h1_pos > -1:
@@ -812,10 +1309,10 @@ class Geocoder:
                 return None, important_error
             if len(candidate_addresses) == 1:
                 # 후보가 하나면 바로 반환
-                val = candidate_addresses[0]
+                val = thaw(candidate_addresses[0])
                 return val, important_error
             elif pos_cd_filter:
-                return candidate_addresses[0], important_error
+                return thaw(candidate_addresses[0]), important_error
 
             if addressCls == AddressCls.JIBUN_ADDRESS:
                 if toks.hasTypes(TOKEN_BLD):
@@ -831,18 +1328,18 @@ class Geocoder:
                     )
                     # 유사도가 0.5 이하여도 가장 비슷한 것을 반환
                     if most_similar_val:
-                        val = most_similar_val
+                        val = thaw(most_similar_val)
                         val["pos_cd"] = (
                             JIBUN  # 지번 주소는 건물명까지 검색 안 해도 성공한 것.
                         )
                         val["similar_hash"] = hash
                         return val, important_error
                     else:
-                        val = candidate_addresses[0]
+                        val = thaw(candidate_addresses[0])
                         # val["similar_hash"] = hash
                         return val, important_error
                 else:
-                    val = candidate_addresses[0]
+                    val = thaw(candidate_addresses[0])
                     val["similar_hash"] = hash
                     return val, important_error
 
@@ -860,7 +1357,7 @@ class Geocoder:
                     )
                     # 유사도가 0.5 이하여도 가장 비슷한 것을 반환
                     if most_similar_val:
-                        val = most_similar_val
+                        val = thaw(most_similar_val)
                         val["pos_cd"] = (
                             ROAD  # 지번 주소는 건물명까지 검색 안 해도 성공한 것.
                         )
@@ -868,7 +1365,7 @@ class Geocoder:
                         return val, important_error
 
                 # 건물명이 없거나 유사한 건물명이 없는 경우
-                val = candidate_addresses[0]
+                val = thaw(candidate_addresses[0])
                 val["similar_hash"] = hash
                 return val, important_error
 
@@ -886,7 +1383,7 @@ class Geocoder:
                 )
                 if most_similar_val and max_similarity > 0.5:
                     # 유사도가 0.5 이상인 경우에만 반환
-                    val = most_similar_val
+                    val = thaw(most_similar_val)
                     val["pos_cd"] = SIMILAR_BUILDING_NAME
                     val["similar_hash"] = hash
                     self.append_err(INFO_SIMILAR_BLD_FOUND, " ".join(val["bm"]))
@@ -902,7 +1399,7 @@ class Geocoder:
                 AddressCls.H23_END_ADDRESS,
                 AddressCls.H1_END_ADDRESS,
             ):
-                val = candidate_addresses[0]
+                val = thaw(candidate_addresses[0])
                 return val, important_error
 
             # 길이름 다르면 배제: 보류
@@ -972,9 +1469,9 @@ class Geocoder:
         사용자 입력과 가장 유사한 건물명을 찾아 반환합니다.
         """
 
-        bld_name_with_dong_normalized = bld_name_with_dong.lower().replace(
-            " ", ""
-        )  # 소문자 변환 및 공백 제거
+        # 소문자 변환 및 공백 제거
+        query = self.bld_name_scorer.prepare(normalize_bld_name(bld_name_with_dong))
+        similarity = self.bld_name_scorer.similarity
 
         max_similarity = -1
         most_similar_val = None
@@ -982,19 +1479,16 @@ class Geocoder:
         for r in d:
             if "bm" not in r:
                 continue
-            name = " ".join(r["bm"])
-            name_normalized = name.lower().replace(" ", "")  # 소문자 변환 및 공백 제거
-
-            # SequenceMatcher를 사용하여 유사도 계산
-            # ratio()는 0.0 ~ 1.0 사이의 유사도 점수를 반환합니다.
-            similarity = SequenceMatcher(
-                None, bld_name_with_dong_normalized, name_normalized
-            ).ratio()
+            # DB 빌드 시 정규화해 둔 건물명. 이전 DB는 여기서 정규화
+            name_normalized = r.get("bmn")
+            if name_normalized is None:
+                name_normalized = normalize_bld_name(" ".join(r["bm"]))
 
-            # print(f"'{bld_name_with_dong}' vs '{name}' (Normalized: '{name_normalized}'): Similarity = {similarity:.4f}") # 디버깅용
+            # 0.0 ~ 1.0 사이의 유사도 점수
+            score = similarity(query, name_normalized)
 
-            if similarity > max_similarity:
-                max_similarity = similarity
+            if score > max_similarity:
+                max_similarity = score
                 most_similar_val = r  # 원본 건물명 저장
 
         return most_similar_val, max_similarity
@@ -10,19 +10,29 @@ from .tokens import *
 from .Tokenizer import Tokenizer
 
 
-def address_hash_cache(maxsize=1024):
+def address_hash_cache(maxsize=1024, shards=1):
     """
     addressHash 메서드를 위한 캐싱 데코레이터
 
+    주소 문자열의 hash로 shard를 나누고, shard마다 LRU(OrderedDict)와 락을 따로 둡니다.
+    스레드가 많아도 같은 shard에 몰릴 때만 락을 기다립니다.
+    캐시한 결과의 토큰은 freeze()한 것이므로 복사 없이 여러 요청이 함께 사용합니다.
+
     Args:
-        maxsize (int): 최대 캐시 항목 수
+        maxsize (int): 최대 캐시 항목 수 (전체 shard 합계)
+        shards (int): shard 개수
     """
     from collections import OrderedDict
     import threading
 
+    shards = max(1, shards)
+    shard_maxsize = max(1, -(-maxsize // shards))  # 올림
+
     def decorator(func):
-        cache = OrderedDict()
-        lock = threading.RLock()  # 재진입 가능한 락 사용
+        caches = [OrderedDict() for _ in range(shards)]
+        locks = [threading.Lock() for _ in range(shards)]
+        # shard별 [hits, misses]. shard 락 안에서 갱신
+        counts = [[0, 0] for _ in range(shards)]
 
         def wrapper(self, addr):
             if config.USE_HASH_CACHE is False:
@@ -33,24 +43,31 @@ def address_hash_cache(maxsize=1024):
             if not addr:
                 return func(self, addr)
 
+            n = hash(addr) % shards
+            cache = caches[n]
+            lock = locks[n]
+
             # 캐시에서 결과 반환
             with lock:
-                if addr in cache:
+                result = cache.get(addr)
+                if result is not None:
                     # LRU 동작을 위해 항목을 가장 최근 위치로 이동
                     cache.move_to_end(addr)
-                    return cache[addr]
+                    counts[n][0] += 1
+                    return result
+                counts[n][1] += 1
 
             # 새 결과 계산 (락 외부에서 실행하여 성능 향상)
             result = func(self, addr)
 
-            # 캐시 업데이트 (쓰기 락)
+            # 캐시 업데이트
             with lock:
                 # 다시 한 번 확인 (다른 스레드가 이미 추가했을 수 있음)
                 if addr not in cache:
                     cache[addr] = result
 
                     # 캐시 크기 제한 관리
-                    if len(cache) > maxsize:
+                    if len(cache) > shard_maxsize:
                         cache.popitem(last=False)  # 가장 오래된 항목 제거
                 else:
                     # 이미 다른 스레드가 추가한 경우, 최신 위치로 이동
@@ -58,6 +75,31 @@ def address_hash_cache(maxsize=1024):
 
             return result
 
+        def cache_stats():
+            hits = misses = size = 0
+            for n in range(shards):
+                with locks[n]:
+                    hits += counts[n][0]
+                    misses += counts[n][1]
+                    size += len(caches[n])
+            return {
+                "shards": shards,
+                "entries": size,
+                "max_entries": shard_maxsize * shards,
+                "hits": hits,
+                "misses": misses,
+            }
+
+        def cache_clear():
+            for n in range(shards):
+                with locks[n]:
+                    caches[n].clear()
+                    counts[n][0] = counts[n][1] = 0
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.cache_stats = cache_stats
+        wrapper.cache_clear = cache_clear
         return wrapper
 
     return decorator
@@ -90,7 +132,9 @@ class Hasher:
         self.hsimplifier = hsimplifier
         self.hcodeMatcher = hcodeMatcher
 
-    @address_hash_cache(maxsize=1024)
+    @address_hash_cache(
+        maxsize=config.HASH_CACHE_SIZE, shards=config.HASH_CACHE_SHARDS
+    )
     def addressHash(self, addr):
         """
         주어진 주소 문자열을 해시하고, 토큰화된 주소, 주소 유형, 오류 메시지를 반환합니다.
@@ -101,7 +145,7 @@ class Hasher:
         Returns:
             tuple:
                 - hash (str): 주소의 해시 값.
-                - toks (list): 토큰화된 주소 리스트.
+                - toks (Tokens): 토큰화된 주소. 수정할 수 없음(freeze). 수정하려면 copy() 사용.
                 - addressCls (int): 주소 유형을 나타내는 상수.
                 - errmsg (str): 오류 메시지.
 
@@ -113,13 +157,54 @@ class Hasher:
             - "UNRECOGNIZABLE_ADDRESS ERROR": 인식할 수 없는 주소 오류.
             - "RUNTIME ERROR": 실행 중 발생한 오류.
         """
-        hash = ""
         toks = []
+        try:
+            # 캐시한 결과를 여러 요청이 함께 쓰므로 수정할 수 없게 만듦
+            # 유형 색인이 있으므로 hash 계산도 freeze()한 토큰으로 함
+            toks = self.tokenizer.tokenize(addr).freeze()
+        except:
+            return "", toks, AddressCls.NOT_ADDRESS, ERR_RUNTIME
+
+        hash, addressCls, err_msg = self.hashTokens(toks)
+        return hash, toks, addressCls, err_msg
+
+    def rehash(self, toks: Tokens, replacements: dict):
+        """
+        토큰 값을 바꾼 주소의 hash를 다시 계산합니다.
+        주소 문자열을 만들어 다시 토큰화하지 않고, 주소 유형 분류와 hash 계산만 합니다.
+
+        토큰 유형은 그대로 두므로 유형이 바뀌지 않는 교체에만 사용합니다. ex) 시군구명 오타 교정
+        토큰 추가, 삭제나 공백이 있는 값은 토큰화 결과가 달라질 수 있으므로
+        주소 문자열로 addressHash()를 호출합니다.
+
+        Args:
+            toks (Tokens): addressHash()가 반환한 토큰.
+            replacements (dict): {토큰 위치: 새 값}
+
+        Returns:
+            tuple: addressHash()와 같음 (hash, toks, addressCls, errmsg)
+        """
+        new_toks = toks.copy()
+        for pos, val in replacements.items():
+            new_toks.get(pos).val = val
+        new_toks = new_toks.freeze()
+
+        hash, addressCls, err_msg = self.hashTokens(new_toks)
+        return hash, new_toks, addressCls, err_msg
+
+    def hashTokens(self, toks: Tokens):
+        """
+        토큰의 주소 유형을 분류하고 hash를 계산합니다.
+        freeze()한 토큰(FrozenTokens)이면 유형 조회에 색인을 사용합니다.
+
+        Returns:
+            tuple: (hash, addressCls, errmsg)
+        """
+        hash = ""
         addressCls = AddressCls.NOT_ADDRESS
         err_msg = ""
 
         try:
-            toks = self.tokenizer.tokenize(addr)
             addressCls = self.__classfy(toks)
 
             if addressCls == AddressCls.NOT_ADDRESS:
@@ -166,7 +251,7 @@ class Hasher:
             hash = ""
             err_msg = ERR_RUNTIME
 
-        return hash, toks, addressCls, err_msg
+        return hash, addressCls, err_msg
 
     def __classfy(self, toks: Tokens):
         """
@@ -0,0 +1,206 @@
+"""
+인근 번호 인덱스
+
+지번, 도로명 주소 hash(번호 앞 hash + "_" + 번호, 예: 오산_원동_123-4)마다
+번호를 0으로 채운 인덱스 키를 같은 DB에 저장합니다.
+인덱스 키는 (번호 앞 hash, 산, 주번, 부번) 순서로 정렬되므로
+같은 주번의 가까운 부번은 seek 한 번으로, 가까운 주번은 주번마다 주번 키(부번 0)로 seek해서 찾습니다.
+(인덱스 키의 값은 빈 문자열이므로 값 조회 대신 키가 있는지만 확인)
+
+possible_hashs()는 인덱스가 있으면 번호를 추정한 hash(get_near_jibun_hashs 등) 대신
+인덱스에 있는 가까운 번호의 hash를 조회합니다.
+
+인덱스 키: NEAR_INDEX_PREFIX + 번호 앞 hash + "\\x1e" + ("s": 산, "n": 산 아님) + 주번(6자리) + "-" + 부번(5자리)
+값은 빈 문자열입니다.
+
+cli/build_near_index.py가 DB 전체 키로 인덱스를 만들고 마지막에 NEAR_INDEX_MARKER 키를 저장합니다.
+Geocoder는 NEAR_INDEX_MARKER가 있는 DB에서만 인덱스를 사용하고,
+updater도 NEAR_INDEX_MARKER가 있으면 주소 키를 새로 만들 때 인덱스 키를 추가합니다.
+"""
+
+from .value_layout import INTERNAL_KEY_PREFIX
+
+NEAR_INDEX_PREFIX = INTERNAL_KEY_PREFIX + "n:"
+# 인덱스를 모두 만든 DB 표시. 값은 빌드 통계 JSON
+NEAR_INDEX_MARKER = NEAR_INDEX_PREFIX
+_SEP = "\x1e"
+_MAIN_WIDTH = 6
+_SUB_WIDTH = 5
+# 번호 문자열 길이 ("000123-00004")
+_NUMBER_LEN = _MAIN_WIDTH + 1 + _SUB_WIDTH
+
+# 인근 번호 범위. 번호를 추정한 get_near_jibun_hashs(), get_near_road_bld_hashs()와 같은 범위
+# 부번이 있으면 같은 주번의 부번 차이, 없으면 주번 차이 (부번 0인 주번만)
+_JIBUN_SUB_RANGE = 4
+_JIBUN_MAIN_RANGE = 4
+_ROAD_SUB_RANGE = 10
+_ROAD_MAIN_RANGE = 8
+# 부번이 없는 입력에서 찾는 같은 주번의 부번 (1~9)
+_MAX_SUB_OF_MAIN = 9
+
+
+def parse_number_hash(hash: str, strict: bool = False):
+    """
+    번호로 끝나는 hash를 나눕니다.
+
+    Args:
+        hash (str): 주소 hash.
+        strict (bool): True이면 인덱스에서 같은 hash를 다시 만들 수 있는 형식(123-4, 산123-0)만.
+
+    Returns:
+        tuple: (번호 앞 hash, 산("" 또는 "산"), 주번, 부번). 번호로 끝나지 않으면 None.
+    """
+    head, sep, bng = hash.rpartition("_")
+    if not sep or not head:
+        return None
+
+    main, dash, sub = bng.partition("-")
+    san = ""
+    if main.startswith("산"):
+        san = "산"
+        main = main[1:]
+    if not (main.isascii() and main.isdigit()) or len(main) > _MAIN_WIDTH:
+        return None
+    if dash and (not (sub.isascii() and sub.isdigit()) or len(sub) > _SUB_WIDTH):
+        return None
+
+    n1 = int(main)
+    n2 = int(sub) if dash else 0
+    if strict and bng != f"{san}{n1}-{n2}":
+        return None
+    return head, san, n1, n2
+
+
+def _block_prefix(head: str, san: str) -> str:
+    return NEAR_INDEX_PREFIX + head + _SEP + ("s" if san else "n")
+
+
+def _number(n1: int, n2: int) -> str:
+    return f"{n1:0{_MAIN_WIDTH}d}-{n2:0{_SUB_WIDTH}d}"
+
+
+def _is_near(n1: int, n2: int, m1: int, m2: int, road: bool) -> bool:
+    """
+    (m1, m2)가 입력 번호 (n1, n2)의 인근 번호 범위에 있으면 True
+
+    부번이 있는 입력은 같은 주번의 부번(차이 4, 도로명 10)과 주번만,
+    부번이 없는 입력은 같은 주번의 부번 1~9와 주번 차이 4(도로명은 홀짝이 같은 8) 이내의 주번만.
+    """
+    if n2:
+        if m1 != n1:
+            return False
+        sub_range = _ROAD_SUB_RANGE if road else _JIBUN_SUB_RANGE
+        return m2 == 0 or abs(m2 - n2) <= sub_range
+
+    if m1 == n1:
+        return 1 <= m2 <= _MAX_SUB_OF_MAIN
+    if m2:
+        return False
+    if road:
+        # 길 건너편 건물번호 제외
+        return (m1 - n1) % 2 == 0 and abs(m1 - n1) <= _ROAD_MAIN_RANGE
+    return abs(m1 - n1) <= _JIBUN_MAIN_RANGE
+
+
+def near_index_key(hash):
+    """
+    주소 hash의 인덱스 키
+
+    Returns:
+        str: 인덱스 키. 번호로 끝나지 않는 hash이면 None.
+    """
+    if not isinstance(hash, str):
+        hash = bytes(hash).decode("utf-8")
+    parsed = parse_number_hash(hash, strict=True)
+    if parsed is None:
+        return None
+    head, san, n1, n2 = parsed
+    return _block_prefix(head, san) + _number(n1, n2)
+
+
+def is_near_index_key(key) -> bool:
+    """인덱스 키이면 True"""
+    if isinstance(key, str):
+        return key.startswith(NEAR_INDEX_PREFIX)
+    return bytes(key).startswith(NEAR_INDEX_PREFIX.encode("utf-8"))
+
+
+def has_near_index(db) -> bool:
+    """인덱스를 모두 만든 DB(NEAR_INDEX_MARKER가 있음)이면 True"""
+    return db.get(NEAR_INDEX_MARKER) is not None
+
+
+def near_hashs(db, hash: str, road: bool = False, limit: int = 6) -> list:
+    """
+    인덱스에서 hash의 번호와 가까운 번호의 hash를 찾습니다.
+
+    같은 주번의 부번을 먼저(부번 차이 순), 그 다음 다른 주번을(주번 차이 순) 반환합니다.
+    번호를 추정한 hash와 같은 범위(_is_near)에 있는 번호만 반환하므로 멀리 떨어진 번호는 찾지 않습니다.
+    도로명 주소(road)는 길의 같은 쪽(주번 홀짝이 같은 건물번호)만 반환합니다.
+
+    Args:
+        db: seek_keys가 있는 DB (Gimi9RocksDB).
+        hash (str): 입력 주소 hash.
+        road (bool): 도로명 주소이면 True.
+        limit (int): 최대 개수.
+
+    Returns:
+        list: [(hash, 번호), ...]. get_near_jibun_hashs()와 같은 형식.
+    """
+    parsed = parse_number_hash(hash)
+    if parsed is None:
+        return []
+    head, san, n1, n2 = parsed
+
+    block = _block_prefix(head, san)
+
+    # 같은 주번의 부번. 주번 안에서만 seek하므로 다른 주번의 부번이 많아도 영향 없음
+    if n2:
+        sub_range = _ROAD_SUB_RANGE if road else _JIBUN_SUB_RANGE
+        sub_from = max(1, n2 - sub_range)
+        sub_count = n2 + sub_range - sub_from + 1
+        # 부번이 있으면 같은 주번의 주번 키(부번 0)만
+        mains = [n1]
+    else:
+        sub_from = 1
+        sub_count = _MAX_SUB_OF_MAIN
+        # 부번이 없으면 범위 안의 다른 주번 키(부번 0). 도로명은 홀짝이 같은 주번만
+        main_range = _ROAD_MAIN_RANGE if road else _JIBUN_MAIN_RANGE
+        step = 2 if road else 1
+        mains = [
+            m1
+            for d in range(step, main_range + 1, step)
+            for m1 in (n1 - d, n1 + d)
+            if m1 > 0
+        ]
+
+    main_prefix = block + f"{n1:0{_MAIN_WIDTH}d}-"
+    keys = db.seek_keys(block + _number(n1, sub_from), sub_count, prefix=main_prefix)
+
+    start = len(block.encode("utf-8"))
+    numbers = set()
+    for key in keys:
+        number = key[start:]
+        if len(number) != _NUMBER_LEN:
+            continue
+        m1 = int(number[:_MAIN_WIDTH])
+        m2 = int(number[_MAIN_WIDTH + 1 :])
+        if (m1, m2) == (n1, n2) or not _is_near(n1, n2, m1, m2, road):
+            continue
+        numbers.add((m1, m2))
+
+    for m1 in mains:
+        main_key = block + _number(m1, 0)
+        if db.seek_keys(main_key, 1, prefix=main_key):
+            numbers.add((m1, 0))
+
+    def distance(m):
+        m1, m2 = m
+        if m1 == n1:
+            return (0, abs(m2 - n2), m2)
+        return (1, abs(m1 - n1), m1, m2)
+
+    return [
+        (f"{head}_{san}{m1}-{m2}", f"{san}{m1}-{m2}")
+        for m1, m2 in sorted(numbers, key=distance)[:limit]
+    ]
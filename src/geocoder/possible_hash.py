@@ -98,6 +98,7 @@ def possible_hashs(
     hash: str,
     hasher: Hasher,
     addressCls,
+    near_index=None,
 ):
     # def possible_hashs(self, toks: Tokens, hash: str, addressCls) -> list[str]:
     """
@@ -128,6 +129,8 @@ def possible_hashs(
 
     Args:
         address (str): 주소 문자열.
+        near_index: 인근 번호 인덱스 조회 함수 (hash, road) -> [(hash, 번호), ...].
+            None이면 번호를 추정한 인근 hash를 조회합니다. (near_index.py)
 
     Returns:
         list: 가능한 해시 정보의 리스트.
@@ -314,7 +317,7 @@ def possible_hashs(
 
     # 인근 지번 주소
     if addressCls == AddressCls.JIBUN_ADDRESS:
-        hashs = get_near_jibun_hashs(hash)
+        hashs = near_jibun_hashs(hash, near_index)
         for h, bng in hashs:
             yield PossibleHash(
                 hash=h,
@@ -326,7 +329,7 @@ def possible_hashs(
             )
     # 인근 도로명 주소
     elif addressCls == AddressCls.ROAD_ADDRESS:
-        hashs = get_near_road_bld_hashs(hash)
+        hashs = near_road_bld_hashs(hash, near_index)
         for h, bld_no in hashs:
             yield PossibleHash(
                 hash=h,
@@ -387,7 +390,7 @@ def possible_hashs(
 
     # 도로명 이하 주소               오룡길 1 전라남도청 본관, 오룡길 1 전라남도청, 오룡길 1
     if toks.hasTypes(TOKEN_ROAD) and toks.hasTypes(TOKEN_BLDNO):
-        yield from yield_hashs_start_with_road(toks, hasher)
+        yield from yield_hashs_start_with_road(toks, hasher, near_index)
 
         # 도로명 이하 주소에서 지하 제거
         if toks.hasTypes(TOKEN_UNDER):
@@ -395,7 +398,9 @@ def possible_hashs(
             if road_pos > -1:
                 no_under_toks = toks.copy()
                 no_under_toks.delete(road_pos + 1)
-                yield from yield_hashs_start_with_road(no_under_toks, hasher)
+                yield from yield_hashs_start_with_road(
+                    no_under_toks, hasher, near_index
+                )
 
     # 리 이하 주소               경기도 김포시 신곡리 532번지 66호 1층 1호
     if toks.hasTypes(TOKEN_RI) and toks.hasTypes(TOKEN_BNG):
@@ -410,7 +415,7 @@ def possible_hashs(
         )
 
         # 인근 지번 주소
-        hashs = get_near_jibun_hashs(hash)
+        hashs = near_jibun_hashs(hash, near_index)
         for h, bng in hashs:
             yield PossibleHash(
                 hash=h,
@@ -501,6 +506,24 @@ def possible_hashs(
         )
 
 
+def near_jibun_hashs(hash, near_index=None):
+    """
+    인근 지번 주소 hash. 인근 번호 인덱스가 있으면 DB에 있는 가까운 번호를 조회합니다.
+    """
+    if near_index is not None:
+        return near_index(hash, road=False)
+    return get_near_jibun_hashs(hash)
+
+
+def near_road_bld_hashs(hash, near_index=None):
+    """
+    인근 도로명 주소 hash. 인근 번호 인덱스가 있으면 DB에 있는 가까운 건물번호를 조회합니다.
+    """
+    if near_index is not None:
+        return near_index(hash, road=True)
+    return get_near_road_bld_hashs(hash)
+
+
 def get_near_jibun_hashs(hash):
     """
     주어진 지번 주소 해시를 사용하여 인근 지번 주소 해시를 반환합니다.
@@ -569,7 +592,7 @@ def get_near_jibun_hashs(hash):
     return near_jibun_hashs
 
 
-def yield_hashs_start_with_road(toks, hasher):
+def yield_hashs_start_with_road(toks, hasher, near_index=None):
     hash = hasher.roadAddress.hash(toks, start_with=TOKEN_ROAD)
     yield PossibleHash(
         hash=hash,
@@ -580,7 +603,7 @@ def yield_hashs_start_with_road(toks, hasher):
         info_detail=toks.get_text_after(TOKEN_ROAD, count=2),
     )
     # 인근 도로명 주소
-    hashs = get_near_road_bld_hashs(hash)
+    hashs = near_road_bld_hashs(hash, near_index)
     for h, bld_no in hashs:
         yield PossibleHash(
             hash=h,
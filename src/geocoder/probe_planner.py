@@ -0,0 +1,222 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+class ProbePlanner:
+    """
+    possible_hashs() 후보 조회 계획
+
+    후보 종류(입력 주소 유형, 후보 주소 유형, err_failed, info_success)별로
+    조회 횟수와 성공 횟수를 기록하고, 조회할 후보를 고릅니다.
+
+    - 같은 요청에서 이미 조회한 후보(probe_key가 같음)는 다시 조회하지 않음 (Geocoder._search).
+      결과가 같으므로 검색 결과는 바뀌지 않음
+    - min_hit_rate > 0이면 조회가 min_attempts 이상이고 성공률이 min_hit_rate 미만인 후보 종류는 건너뜀.
+      성공률이 바뀌었는지 알 수 있도록 explore_interval번에 한 번은 조회.
+      건너뛴 후보에서 찾을 주소를 못 찾을 수 있으므로 plan()은 건너뛴 후보를 pruned에 알림
+    - 첫 후보(입력 주소의 hash)는 항상 조회
+
+    possible_hashs()의 순서는 우선순위(first-match-wins)이므로 순서는 바꾸지 않습니다.
+
+    통계는 path(JSON)에 저장하고 시작할 때 읽습니다. 저장은 save_interval마다 백그라운드 스레드에서 합니다.
+    조회가 max_attempts를 넘은 후보 종류는 횟수를 절반으로 줄여 최근 통계의 비중을 높입니다.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        min_hit_rate: float = 0,
+        min_attempts: int = 10000,
+        explore_interval: int = 100,
+        save_interval: int = 300,
+        max_attempts: int = 1000000,
+    ):
+        """
+        Args:
+            path (str): 통계 파일 경로. 없으면 저장하지 않음.
+            min_hit_rate (float): 이 성공률 미만인 후보 종류는 건너뜀. 0 이하이면 건너뛰지 않음.
+            min_attempts (int): 건너뛰기 전에 필요한 조회 횟수.
+            explore_interval (int): 건너뛰는 후보 종류도 이 횟수마다 한 번은 조회.
+            save_interval (int): 통계 파일 저장 간격 (초). 0 이하이면 save()를 호출할 때만 저장.
+            max_attempts (int): 조회 횟수가 이 값을 넘으면 횟수를 절반으로 줄임.
+        """
+        self.path = path
+        self.min_hit_rate = min_hit_rate
+        self.min_attempts = min_attempts
+        self.explore_interval = max(1, explore_interval)
+        self.save_interval = save_interval
+        self.max_attempts = max_attempts
+
+        # 후보 종류 -> [조회, 성공, 건너뜀]
+        self._stats = {}
+        self._lock = threading.Lock()
+        # 중복 후보 수. 통계용이므로 락 없이 더함 (근사값)
+        self._deduped = 0
+
+        if path:
+            self.load()
+            if save_interval > 0:
+                threading.Thread(
+                    target=self._save_loop, name="probe-stats-saver", daemon=True
+                ).start()
+
+    @staticmethod
+    def probe_key(hash_info) -> tuple:
+        """결과가 같은 후보이면 같은 키 (hash, 주소 유형, pos_cd 필터)"""
+        return (
+            hash_info.hash,
+            hash_info.addressCls,
+            frozenset(hash_info.pos_cd_filter or ()),
+        )
+
+    @staticmethod
+    def kind(addressCls, hash_info) -> str:
+        """후보 종류 키"""
+        return (
+            f"{getattr(addressCls, 'value', addressCls)}:"
+            f"{getattr(hash_info.addressCls, 'value', hash_info.addressCls)}:"
+            f"{hash_info.err_failed}:{hash_info.info_success}"
+        )
+
+    def _prunable(self, stats) -> bool:
+        """성공률이 낮아 건너뛸 후보 종류이면 True. 락 안에서 호출"""
+        attempts, hits, skipped = stats
+        if self.min_hit_rate <= 0 or attempts < self.min_attempts:
+            return False
+        if hits >= attempts * self.min_hit_rate:
+            return False
+        # explore_interval번에 한 번은 조회
+        stats[2] = skipped + 1
+        return stats[2] % self.explore_interval != 0
+
+    def plan(self, addressCls, hash_iter, pruned: list = None):
+        """
+        조회할 후보만 순서대로 반환합니다.
+
+        Args:
+            addressCls: 입력 주소 유형.
+            hash_iter: possible_hashs()의 후보 iterator.
+            pruned (list): 건너뛴 후보를 추가할 list. 건너뛴 후보가 있는 실패 결과는 캐시하지 않음.
+
+        Yields:
+            PossibleHash
+        """
+        if self.min_hit_rate <= 0:
+            yield from hash_iter
+            return
+
+        first = True
+        for hash_info in hash_iter:
+            if not first:
+                kind = self.kind(addressCls, hash_info)
+                with self._lock:
+                    stats = self._stats.get(kind)
+                    skip = stats is not None and self._prunable(stats)
+                if skip:
+                    if pruned is not None:
+                        pruned.append(hash_info)
+                    continue
+            first = False
+            yield hash_info
+
+    def record_dedup(self):
+        """같은 요청에서 이미 조회한 후보를 건너뜀"""
+        self._deduped += 1
+
+    def record(self, addressCls, hash_info, hit: bool):
+        """
+        후보 조회 결과를 기록합니다.
+
+        Args:
+            addressCls: 입력 주소 유형.
+            hash_info (PossibleHash): 조회한 후보.
+            hit (bool): 후보에서 주소를 찾았으면 True.
+        """
+        kind = self.kind(addressCls, hash_info)
+        with self._lock:
+            stats = self._stats.get(kind)
+            if stats is None:
+                stats = self._stats[kind] = [0, 0, 0]
+            stats[0] += 1
+            if hit:
+                stats[1] += 1
+            if stats[0] > self.max_attempts:
+                stats[0] //= 2
+                stats[1] //= 2
+
+    def stats(self) -> dict:
+        """
+        후보 종류별 통계
+
+        Returns:
+            dict: {"deduped": 중복으로 조회하지 않은 후보 수,
+                "kinds": {후보 종류: {"attempts", "hits", "hit_rate", "skipped", "pruned"}}}
+        """
+        with self._lock:
+            kinds = {}
+            for kind, (attempts, hits, skipped) in self._stats.items():
+                kinds[kind] = {
+                    "attempts": attempts,
+                    "hits": hits,
+                    "hit_rate": round(hits / attempts, 6) if attempts else 0,
+                    "skipped": skipped,
+                    "pruned": self.min_hit_rate > 0
+                    and attempts >= self.min_attempts
+                    and hits < attempts * self.min_hit_rate,
+                }
+            return {"deduped": self._deduped, "kinds": kinds}
+
+    def _save_loop(self):
+        """save_interval마다 통계 저장 (검색 스레드에서 파일을 쓰지 않도록)"""
+        while True:
+            time.sleep(self.save_interval)
+            self.save()
+
+    def save(self):
+        """통계를 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        with self._lock:
+            data = {
+                "version": FORMAT_VERSION,
+                "kinds": {kind: stats[:2] for kind, stats in self._stats.items()},
+            }
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"후보 조회 통계 저장 실패: {self.path}: {e}")
+
+    def load(self) -> int:
+        """
+        저장된 통계를 읽습니다. 파일이 없거나 형식이 다르면 빈 통계로 시작
+
+        Returns:
+            int: 읽은 후보 종류 수
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            logger.warning(f"후보 조회 통계를 읽을 수 없습니다: {self.path}: {e}")
+            return 0
+
+        if data.get("version") != FORMAT_VERSION:
+            return 0
+        with self._lock:
+            self._stats = {
+                kind: [int(attempts), int(hits), 0]
+                for kind, (attempts, hits) in data.get("kinds", {}).items()
+            }
+            return len(self._stats)
@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Geocoder.search 결과 캐시
+
+    값은 JSON bytes로 저장하고 꺼낼 때마다 새 dict로 디코딩합니다.
+    호출자가 결과 dict를 수정해도 캐시에는 영향이 없습니다.
+
+    - 저장된 bytes 합계가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 제거 (LRU)
+    - ttl(초)이 지난 항목은 사용하지 않음
+    - DB 버전이 바뀌면 전체 비움
+    """
+
+    def __init__(self, name: str, max_bytes: int, ttl: int):
+        """
+        Args:
+            name (str): 통계 표시용 이름.
+            max_bytes (int): 최대 저장 크기 (bytes). 0 이하이면 캐시 사용 안 함.
+            ttl (int): 항목 유효 시간 (초). 0 이하이면 만료 없음.
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._cache = OrderedDict()  # key -> (expire_at, data)
+        self._lock = threading.Lock()
+        self._version = None
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def _check_version(self, version):
+        """DB 버전이 바뀌었으면 전체 비움. 락 안에서 호출"""
+        if version != self._version:
+            if self._cache:
+                self._invalidations += 1
+            self._cache.clear()
+            self._bytes = 0
+            self._version = version
+
+    def get(self, key, version):
+        """
+        캐시에서 결과를 꺼냅니다.
+
+        Args:
+            key: 캐시 키.
+            version: 현재 DB 버전.
+
+        Returns:
+            dict 또는 None: 캐시된 결과의 복사본.
+        """
+        if self.max_bytes <= 0:
+            return None
+
+        with self._lock:
+            self._check_version(version)
+
+            item = self._cache.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+
+            expire_at, data = item
+            if expire_at and expire_at < time.monotonic():
+                del self._cache[key]
+                self._bytes -= len(data)
+                self._expired += 1
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+
+        # 디코딩은 락 밖에서
+        return json.loads(data)
+
+    def put(self, key, val: dict, version):
+        """
+        결과를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키.
+            val (dict): 저장할 결과.
+            version: 결과를 만든 시점의 DB 버전.
+        """
+        if self.max_bytes <= 0:
+            return
+
+        try:
+            data = json.dumps(val, ensure_ascii=False).encode("utf8")
+        except (TypeError, ValueError):
+            # JSON으로 저장할 수 없는 결과는 캐시하지 않음
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        expire_at = time.monotonic() + self.ttl if self.ttl > 0 else 0
+
+        with self._lock:
+            self._check_version(version)
+
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+
+            self._cache[key] = (expire_at, data)
+            self._bytes += len(data)
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._evictions += 1
+
+    def clear(self):
+        """전체 비움"""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, hit_rate, expired, evictions, invalidations
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "name": self.name,
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
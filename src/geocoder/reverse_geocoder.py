@@ -159,9 +159,13 @@ class ReverseGeocoder:
     HD_GEOHASH_PRECISION = 7
 
     def __init__(self):
-        self.db = Gimi9RocksDB(config.REVERSE_GEOCODE_DB, read_only=config.READONLY)
+        self.db = Gimi9RocksDB(
+            config.REVERSE_GEOCODE_DB, read_only=config.READONLY, role="reverse"
+        )
 
-        self.hd_db = Gimi9RocksDB(config.HD_HISTORY_DB, read_only=config.READONLY)
+        self.hd_db = Gimi9RocksDB(
+            config.HD_HISTORY_DB, read_only=config.READONLY, role="hd_history"
+        )
 
     # def open(self, db):
     #     self.db = db
@@ -175,10 +179,8 @@ class ReverseGeocoder:
         PRECISION: int = 6
 
         region_key = f"{type}-{yyyymm}-{region_cd}"
-        region = self.hd_db.get(region_key.encode())
-        if region:
-            val = json.loads(region)
-
+        val = self.hd_db.get_obj(region_key.encode())
+        if val:
             geom = wkt.loads(val.get("wkt", ""))
             # 2. 지오메트리 객체의 좌표 정밀도 변경
             val["wkt"] = wkt.dumps(geom, rounding_precision=PRECISION)
@@ -232,9 +234,8 @@ class ReverseGeocoder:
             # 행정동 hash 검색
             key = geohash.encode(y, x, precision=self.HD_GEOHASH_PRECISION)
 
-            o = self.hd_db.get(key.encode())
-            if o:
-                hd_list = json.loads(o)
+            hd_list = self.hd_db.get_obj(key.encode())
+            if hd_list:
                 for hd_item in hd_list:
                     if (
                         yyyymm
@@ -301,9 +302,8 @@ class ReverseGeocoder:
         result = []
         try:
             key = geohash.encode(y, x, precision=self.HD_GEOHASH_PRECISION)
-            o = self.hd_db.get(key.encode())
-            if o:
-                hd_list = json.loads(o)
+            hd_list = self.hd_db.get_obj(key.encode())
+            if hd_list:
 
                 for hd_item in hd_list:
                     if (
@@ -407,18 +407,16 @@ class ReverseGeocoder:
         key = geohash.encode(y, x, precision=self.GEOHASH_PRECISION)
         result = {}
         try:
-            o = self.db.get(key.encode())
-            if not o:
+            # 고정(pin)된 블록에서 바로 디코딩 (bytes 복사 없음)
+            addrs = self.db.get_obj(key.encode())
+            if not addrs:
                 return {"success": False, "errmsg": "NOTFOUND ERROR"}
 
-            addrs = json.loads(o)
-
             # 건물도형이 여러개인 경우 hit test로 정확한 주소를 찾음
             # 건물도형이 하나만 검색되어도 hit test로 체크
             latest_addrs = self.get_latest_addrs(addrs, "ADR_MNG_NO")
             for addr in latest_addrs:
-                g = self.db.get(addr["ADR_MNG_NO"].encode())
-                g_wkt = g.decode()
+                g_wkt = self.db.get_string(addr["ADR_MNG_NO"].encode())
                 geom = shapely.from_wkt(g_wkt)
                 # geom = shape(addr["geometry"])
                 if self.geom_contains_point(geom, x, y):
@@ -430,8 +428,7 @@ class ReverseGeocoder:
             latest_addrs = self.get_latest_addrs(addrs, "PNU")
             if len(latest_addrs) > 1:
                 for addr in latest_addrs:
-                    g = self.db.get(addr["PNU"].encode())
-                    g_wkt = g.decode()
+                    g_wkt = self.db.get_string(addr["PNU"].encode())
                     geom = shapely.from_wkt(g_wkt)
                     # geom = shape(addr["geometry"])
                     if self.geom_contains_point(geom, x, y):
@@ -441,7 +438,7 @@ class ReverseGeocoder:
             elif latest_addrs:
                 result["jibun_addr"] = self.convert_pnu(
                     latest_addrs[0],
-                    self.db.get(latest_addrs[0]["PNU"].encode()).decode(),
+                    self.db.get_string(latest_addrs[0]["PNU"].encode()),
                 )
 
             if result:
@@ -632,12 +629,10 @@ class ReverseGeocoder:
         # 있으면 추가 또는 업데이트, 없으면 생성
         key = h.encode()
 
-        d0 = self.db.get(key)
+        d0 = self.db.get_obj(key)
         if not d0:
             d0 = []
         else:
-            d0 = json.loads(d0.decode("utf8"))
-
             # yyyymm이 MST.로 시작하는 경우 yyyymm을 202404로 변경. (초기 데이터 오류 수정)
             change_yyyymm = False
             for d in d0:
@@ -653,7 +648,7 @@ class ReverseGeocoder:
                     and d0[i]["ADR_MNG_NO"] == property_dict["ADR_MNG_NO"]
                 ):
                     if change_yyyymm:
-                        self.db.put(key, json.dumps(d0).encode("utf8"))
+                        self.db.put_obj(key, d0)
                     return
 
                     # if d0[i] == property_dict:  # 중복 데이터가 있으면 저장하지 않음
@@ -670,7 +665,7 @@ class ReverseGeocoder:
         }
         d0.append(d)
 
-        self.db.put(key, json.dumps(d0).encode("utf8"))
+        self.db.put_obj(key, d0)
 
     def update_pnu_db(self, h, property_dict):
         """
@@ -683,11 +678,10 @@ class ReverseGeocoder:
 
         # 있으면 추가 또는 업데이트, 없으면 생성
         key = h.encode()
-        d0 = self.db.get(key)
+        d0 = self.db.get_obj(key)
         if not d0:
             d0 = []
         else:
-            d0 = json.loads(d0.decode("utf8"))
             # 중복 데이터 제거
             for i in range(len(d0) - 1, -1, -1):
                 if (
@@ -710,7 +704,7 @@ class ReverseGeocoder:
         d0.append(d)
 
         # print("put", h)
-        self.db.put(key, json.dumps(d0).encode("utf8"))
+        self.db.put_obj(key, d0)
 
     def geom_contains_point(self, geom, x, y):
         """
@@ -938,7 +932,7 @@ class ReverseGeocoder:
 
                 attr_dict["wkt"] = geom.wkt
                 attr_dict["yyyymm"] = yyyymm
-                db.put(key.encode(), json.dumps(attr_dict).encode())
+                db.put_obj(key.encode(), attr_dict)
 
                 # stats["total_geohashes"] += 1
                 batch_count += 1
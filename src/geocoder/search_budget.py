@@ -0,0 +1,61 @@
+import time
+
+
+class SearchBudget:
+    """
+    Geocoder.search() 한 번의 검색 제한 (요청마다 새로 만듦)
+
+    deadline_ms가 지나거나 후보 조회가 max_probes를 넘으면 더 조회하지 않고
+    ERR_DEADLINE_EXCEEDED 오류로 검색을 끝냅니다.
+    첫 후보(입력 주소의 hash)는 제한과 관계없이 항상 조회합니다.
+    """
+
+    def __init__(self, deadline_ms: int = 0, max_probes: int = 0):
+        """
+        Args:
+            deadline_ms (int): 검색 제한 시간 (ms). 0 이하이면 제한 없음.
+            max_probes (int): 최대 후보 조회 수. 0 이하이면 제한 없음.
+        """
+        self.started_at = time.monotonic()
+        self.deadline = None
+        if deadline_ms and deadline_ms > 0:
+            self.deadline = self.started_at + deadline_ms / 1000
+        self.max_probes = max_probes if max_probes and max_probes > 0 else None
+        self.probes = 0
+        self.exceeded = False
+
+    def remaining(self):
+        """
+        더 조회할 수 있는 후보 수
+
+        Returns:
+            int 또는 None: 0이면 제한을 넘음. None이면 제한 없음.
+        """
+        if not self.probes:
+            # 첫 후보는 항상 조회
+            return 1 if self.max_probes else None
+        if self.exceeded or (self.deadline and time.monotonic() >= self.deadline):
+            return 0
+        if self.max_probes:
+            return max(0, self.max_probes - self.probes)
+        return None
+
+    def spend(self) -> bool:
+        """
+        후보 하나를 조회하기 전에 호출합니다.
+
+        Returns:
+            bool: 조회해도 되면 True. 제한을 넘었으면 False (exceeded = True).
+        """
+        if self.remaining() == 0:
+            self.exceeded = True
+            return False
+        self.probes += 1
+        return True
+
+    def elapsed_ms(self) -> int:
+        return int((time.monotonic() - self.started_at) * 1000)
+
+    def detail(self) -> str:
+        """오류 상세 메시지"""
+        return f"{self.probes} 후보 조회, {self.elapsed_ms()}ms"
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from typing import List
 
 TOKEN_UNKNOWN = "UNKNOWN"
@@ -18,6 +19,32 @@ TOKEN_NUMERIC = "NUMERIC"
 TOKEN_COMMA = "COMMA"
 TOKEN_EXTRA = "EXTRA"
 
+# 토큰 유형별 bit. FrozenTokens의 유형 bitmask에 사용
+TOKEN_TYPE_BITS = {
+    t: 1 << n
+    for n, t in enumerate(
+        (
+            TOKEN_UNKNOWN,
+            TOKEN_H1,
+            TOKEN_H23,
+            TOKEN_H4,
+            TOKEN_RI,
+            TOKEN_ROAD,
+            TOKEN_UNDER,
+            TOKEN_SAN,
+            TOKEN_BNG,
+            TOKEN_BLDNO,
+            TOKEN_BLD,
+            TOKEN_BLD_DONG,
+            TOKEN_FLOOR,
+            TOKEN_BLD_HO,
+            TOKEN_NUMERIC,
+            TOKEN_COMMA,
+            TOKEN_EXTRA,
+        )
+    )
+}
+
 
 class Token:
     """
@@ -51,6 +78,24 @@ class Token:
         return f"{self.val} ({self.t})"
 
 
+class FrozenToken(Token):
+    """
+    값과 유형을 바꿀 수 없는 Token. 캐시에서 여러 스레드가 함께 읽는 토큰에 사용합니다.
+
+    바꾸려면 Tokens.copy()로 복사한 뒤 수정합니다.
+    """
+
+    def __init__(self, v, t=TOKEN_UNKNOWN):
+        object.__setattr__(self, "val", v)
+        object.__setattr__(self, "t", t)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"FrozenToken은 수정할 수 없습니다: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"FrozenToken은 수정할 수 없습니다: {name}")
+
+
 class Tokens:
     """
     Tokens 클래스는 문자열 토큰을 관리하는 여러 메서드를 제공합니다.
@@ -106,6 +151,12 @@ class Tokens:
 
         hasTypes(self, t):
             주어진 Token 타입이 리스트에 존재하는지 확인합니다.
+
+        freeze(self):
+            수정할 수 없고 유형 색인이 있는 복사본(FrozenTokens)을 반환합니다.
+
+        copy(self):
+            수정 가능한 복사본을 반환합니다.
     """
 
     toks = []  # type: List[Token]
@@ -248,10 +299,108 @@ class Tokens:
         """주소 문자열로 변환"""
         return " ".join([t.val for t in self.toks if t.val])
 
+    def is_frozen(self):
+        return False
+
+    def freeze(self):
+        """
+        수정할 수 없는 FrozenTokens를 반환합니다.
+
+        addressHash 캐시에 저장해 여러 요청이 함께 사용하는 토큰입니다.
+        merge, split, delete 등은 TypeError, 토큰 값 변경은 AttributeError가 발생합니다.
+
+        복사하지 않고 Token 객체를 그대로 FrozenToken으로 바꾸므로,
+        freeze() 후에는 원래 Tokens의 토큰도 수정할 수 없습니다.
+        tokenize() 결과처럼 더 고치지 않을 토큰에 사용하고, 고치려면 copy()를 사용합니다.
+        """
+        return FrozenTokens(self.toks)
+
     def copy(self):
         """
-        Creates a deep copy of the Tokens object.
+        수정 가능한 복사본을 반환합니다. (freeze()한 토큰도 복사본은 수정 가능)
         """
-        import copy
+        copied = Tokens([])
+        copied.toks = [Token(tkn.val, tkn.t) for tkn in self.toks]
+        return copied
 
-        return copy.deepcopy(self)
+
+class FrozenTokens(Tokens):
+    """
+    수정할 수 없는 Tokens. 토큰 유형 조회를 위해 색인을 미리 만듭니다.
+
+    속성:
+        toks (tuple): FrozenToken의 tuple.
+        vals (tuple): 토큰 값.
+        types (tuple): 토큰 유형.
+        type_mask (int): 토큰 유형 bitmask (TOKEN_TYPE_BITS).
+
+    수정할 수 없으므로 색인이 토큰과 어긋나지 않습니다.
+    hasTypes, index, lastIndex는 O(1), searchTypeSequence는 첫 유형의 위치만 검사합니다.
+    """
+
+    def __init__(self, toks):
+        vals = []
+        types = []
+        positions = {}
+        type_mask = 0
+        for pos, tkn in enumerate(toks):
+            if tkn.__class__ is not FrozenToken:
+                # 속성이 같으므로 클래스만 바꿈 (복사 없음)
+                tkn.__class__ = FrozenToken
+            t = tkn.t
+            vals.append(tkn.val)
+            types.append(t)
+            if t in positions:
+                positions[t] += (pos,)
+            else:
+                positions[t] = (pos,)
+                type_mask |= TOKEN_TYPE_BITS.get(t, 0)
+
+        self.toks = tuple(toks)
+        self.vals = tuple(vals)
+        self.types = tuple(types)
+        self._positions = positions
+        self.type_mask = type_mask
+
+    def __getitem__(self, position):
+        return self.vals[position]
+
+    def is_frozen(self):
+        return True
+
+    def freeze(self):
+        return self
+
+    def hasTypes(self, t, end: int = None):
+        if end is None:
+            bit = TOKEN_TYPE_BITS.get(t)
+            if bit is not None:
+                return bool(self.type_mask & bit)
+            return t in self._positions
+        positions = self._positions.get(t)
+        return bool(positions) and positions[0] < end
+
+    def index(self, t: str, begin=0) -> int:
+        positions = self._positions.get(t)
+        if not positions:
+            return -1
+        if begin <= positions[0]:
+            return positions[0]
+        n = bisect_left(positions, begin)
+        return positions[n] if n < len(positions) else -1
+
+    def lastIndex(self, t):
+        positions = self._positions.get(t)
+        return positions[-1] if positions else -1
+
+    def searchTypeSequence(self, fromSeq):
+        seq = tuple(fromSeq)
+        seqLen = len(seq)
+        types = self.types
+        for pos in self._positions.get(seq[0], ()):
+            if types[pos : pos + seqLen] == seq:
+                return pos, pos + seqLen
+        return -1, -1
+
+    def to_address(self):
+        return " ".join([v for v in self.vals if v])
@@ -1,8 +1,13 @@
 import re
 
+from src import config
+
 
 class BldSimplifier:
     def __init__(self):
+        # simplifyBldName 결과. SIMPLIFIER_MEMO_SIZE를 넘으면 비움
+        self._memo = {}
+
         # 정규 표현식을 사용하여 단지 번호를 찾기 위한 패턴
         self.n단지 = re.compile(r"(\d{1,2})(차|단지)")
 
@@ -138,6 +143,15 @@ class BldSimplifier:
         if not nm:
             return ""
 
+        simple = self._memo.get(nm)
+        if simple is None:
+            simple = self._simplifyBldName(nm)
+            if len(self._memo) >= config.SIMPLIFIER_MEMO_SIZE:
+                self._memo.clear()
+            self._memo[nm] = simple
+        return simple
+
+    def _simplifyBldName(self, nm):
         # 3차, 3단지
         danjiNo = ""
         m = self.n단지.search(nm)
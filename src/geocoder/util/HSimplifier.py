@@ -1,5 +1,7 @@
 import re
 
+from src import config
+
 
 class HSimplifier:
     # TAG_H2 = '@'
@@ -35,6 +37,13 @@ class HSimplifier:
         r"(^\D{2,4})(읍|면|동)$"
     )  # (가락)동, (가락본)동, (가사문학)면
 
+    # 정규식 결과 사전. 모든 인스턴스가 공유
+    # table: 코드 테이블의 이름으로 미리 만든 사전 (preload_h23)
+    # memo: 사전에 없는 이름의 결과. SIMPLIFIER_MEMO_SIZE를 넘으면 비움
+    _h23_table = {}
+    _h23_memo = {}
+    _h4_memo = {}
+
     def __init__(self):
         """
         HSimplifier 클래스의 생성자입니다.
@@ -125,24 +134,55 @@ class HSimplifier:
         else:
             return ""
 
+    @classmethod
+    def preload_h23(cls, names):
+        """
+        시군구명의 h23Hash 결과를 미리 계산해 둡니다.
+        "청주시 흥덕구"처럼 공백이 있으면 각 단어도 추가합니다. (Geocoder.filter_candidate_addresses)
+
+        :param names: 시군구명 목록
+        """
+        table = dict(cls._h23_table)
+        for name in names:
+            if not name:
+                continue
+            for h23 in [name] + name.split(" "):
+                if h23 not in table:
+                    table[h23] = cls._h23Hash(h23)
+        cls._h23_table = table
+
     def h23Hash(self, h23):
         """
         주어진 h23에 대응하는 해시를 반환합니다.
+        미리 계산한 사전, memo 순으로 찾고 없으면 정규식으로 계산합니다.
 
         :param h23: 단순화할 지역 이름
         :return: 지역 이름 해시
         """
+        hash = self._h23_table.get(h23)
+        if hash is None:
+            memo = HSimplifier._h23_memo
+            hash = memo.get(h23)
+            if hash is None:
+                hash = self._h23Hash(h23)
+                if len(memo) >= config.SIMPLIFIER_MEMO_SIZE:
+                    memo.clear()
+                memo[h23] = hash
+        return hash
+
+    @classmethod
+    def _h23Hash(cls, h23):
         # 양구군 예외
         if h23.startswith("양구"):
             return "양구"
 
         # h2h3 포항시남구 -> 포항남
-        m = self.h23re.search(h23)
+        m = cls.h23re.search(h23)
         if m:
             h23 = m.group(1) + m.group(3).strip()
 
         # 시군구 산청군 -> 산청
-        m = self.h2re.search(h23)
+        m = cls.h2re.search(h23)
         if m:
             h23 = m.group(1)
 
@@ -155,11 +195,23 @@ class HSimplifier:
     def h4Hash(self, h4, keep_dong=False):
         """
         주어진 h4에 대응하는 해시를 반환합니다.
+        같은 이름은 memo에서 찾고 없으면 정규식으로 계산합니다.
 
         :param h4: 단순화할 지역 이름
         :param keep_dong: '동'을 유지할지 여부
         :return: 지역 이름 해시
         """
+        key = (h4, keep_dong)
+        memo = HSimplifier._h4_memo
+        hash = memo.get(key)
+        if hash is None:
+            hash = self._h4Hash(h4, keep_dong)
+            if len(memo) >= config.SIMPLIFIER_MEMO_SIZE:
+                memo.clear()
+            memo[key] = hash
+        return hash
+
+    def _h4Hash(self, h4, keep_dong=False):
         end_char = ""
         if keep_dong and h4[-1] in ["읍", "면", "동", "가", "로"]:
             # if keep_dong and h4.endswith("동"):
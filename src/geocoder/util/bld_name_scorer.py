@@ -0,0 +1,185 @@
+"""
+건물명 유사도 계산
+
+Geocoder.find_most_similar_building에서 사용합니다.
+후보 건물명은 DB 빌드 시 normalize_bld_name()으로 정규화해 "bmn"에 저장하므로
+검색 시에는 입력 건물명만 한 번 정규화(prepare)하고 후보마다 similarity()를 호출합니다.
+
+유사도는 모두 0.0 ~ 1.0 사이 값이며 클수록 비슷합니다.
+
+- sequence: difflib.SequenceMatcher.ratio(). 기존 방식
+- indel: 2 * LCS / (len(a) + len(b)). LCS는 bit-parallel로 계산.
+  SequenceMatcher.ratio()와 같은 식이며, SequenceMatcher가 LCS의 근사값을 쓰므로 값이 같거나 약간 큼
+- levenshtein: 1 - 편집거리 / max(len(a), len(b)). 편집거리는 Myers bit-parallel로 계산
+- jamo_jaccard: 자모 분해 bigram 집합의 Jaccard 계수
+"""
+
+from difflib import SequenceMatcher
+
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_END = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+# 자모 인덱스가 일반 문자 코드와 겹치지 않도록 사용하는 오프셋
+_CHO_OFFSET = 0x110000
+_JUNG_OFFSET = _CHO_OFFSET + 19
+_JONG_OFFSET = _JUNG_OFFSET + _JUNG_COUNT
+_NGRAM_PAD = -1
+
+
+def normalize_bld_name(name: str) -> str:
+    """
+    건물명 비교용 정규화. 소문자 변환 및 공백 제거
+    """
+    return name.lower().replace(" ", "")
+
+
+def _peq(s: str):
+    """문자별로 s에서 나타나는 위치를 비트로 표시한 dict"""
+    peq = {}
+    bit = 1
+    for ch in s:
+        peq[ch] = peq.get(ch, 0) | bit
+        bit <<= 1
+    return peq
+
+
+def _jamo(s: str):
+    """한글 음절을 초성, 중성, 종성 정수로 분해. 한글이 아닌 문자는 문자 코드 그대로"""
+    result = []
+    for ch in s:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_END:
+            code -= _HANGUL_BASE
+            result.append(_CHO_OFFSET + code // (_JUNG_COUNT * _JONG_COUNT))
+            result.append(_JUNG_OFFSET + (code // _JONG_COUNT) % _JUNG_COUNT)
+            if code % _JONG_COUNT:
+                result.append(_JONG_OFFSET + code % _JONG_COUNT)
+        else:
+            result.append(code)
+    return result
+
+
+def _jamo_bigrams(s: str):
+    """자모 분해한 문자열의 bigram 집합 (양 끝 경계 포함)"""
+    padded = [_NGRAM_PAD, *_jamo(s), _NGRAM_PAD]
+    return {(padded[i], padded[i + 1]) for i in range(len(padded) - 1)}
+
+
+class SequenceScorer:
+    """difflib.SequenceMatcher.ratio() (기존 방식)"""
+
+    name = "sequence"
+
+    def prepare(self, query: str):
+        return query
+
+    def similarity(self, prepared, name: str) -> float:
+        return SequenceMatcher(None, prepared, name).ratio()
+
+
+class IndelScorer:
+    """
+    2 * LCS / (len(a) + len(b))
+
+    LCS 길이는 Hyyrö의 bit-parallel 알고리즘으로 후보 문자 하나당 정수 연산 몇 번으로 계산합니다.
+    """
+
+    name = "indel"
+
+    def prepare(self, query: str):
+        return (len(query), (1 << len(query)) - 1, _peq(query))
+
+    def similarity(self, prepared, name: str) -> float:
+        m, mask, peq = prepared
+        total = m + len(name)
+        if total == 0:
+            return 1.0
+
+        s = mask
+        for ch in name:
+            u = s & peq.get(ch, 0)
+            s = ((s + u) | (s - u)) & mask
+        lcs = m - s.bit_count()
+        return 2.0 * lcs / total
+
+
+class LevenshteinScorer:
+    """
+    1 - 편집거리 / max(len(a), len(b))
+
+    편집거리는 Myers(Hyyrö)의 bit-parallel 알고리즘으로 계산합니다.
+    """
+
+    name = "levenshtein"
+
+    def prepare(self, query: str):
+        m = len(query)
+        return (m, (1 << m) - 1, 1 << (m - 1) if m else 0, _peq(query))
+
+    def similarity(self, prepared, name: str) -> float:
+        m, mask, last, peq = prepared
+        n = len(name)
+        longest = max(m, n)
+        if longest == 0:
+            return 1.0
+        if m == 0:
+            return 0.0
+
+        pv = mask
+        mv = 0
+        dist = m
+        for ch in name:
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & last:
+                dist += 1
+            elif mh & last:
+                dist -= 1
+            ph = (ph << 1) | 1
+            mh <<= 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv & mask
+        return 1.0 - dist / longest
+
+
+class JamoJaccardScorer:
+    """자모 분해 bigram 집합의 Jaccard 계수"""
+
+    name = "jamo_jaccard"
+
+    def prepare(self, query: str):
+        return _jamo_bigrams(query)
+
+    def similarity(self, prepared, name: str) -> float:
+        bigrams = _jamo_bigrams(name)
+        union = len(prepared | bigrams)
+        return len(prepared & bigrams) / union if union else 1.0
+
+
+BLD_NAME_SCORERS = {
+    scorer.name: scorer
+    for scorer in (SequenceScorer, IndelScorer, LevenshteinScorer, JamoJaccardScorer)
+}
+
+
+def get_bld_name_scorer(name: str):
+    """
+    이름으로 건물명 유사도 scorer를 만듭니다.
+
+    Args:
+        name (str): sequence, indel, levenshtein, jamo_jaccard 중 하나.
+
+    Raises:
+        ValueError: 알 수 없는 이름.
+    """
+    try:
+        return BLD_NAME_SCORERS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown BLD_NAME_SCORER: {name} (choose from {', '.join(BLD_NAME_SCORERS)})"
+        )
@@ -0,0 +1,334 @@
+"""
+행정구역명, 도로명 사전(gazetteer) 기반 붙여 쓴 주소 분리
+
+HCodeMatcher(시도, 시군구), PNUMatcher(읍면동, 리), RoadMatcher(도로명)의 코드 테이블에서
+이름과 단순화한 이름을 모아 Aho-Corasick automaton을 만들고,
+"서울영등포구신길동"처럼 띄어 쓰지 않은 단어를 한 번의 선형 탐색으로
+"서울 영등포구 신길동"으로 나눕니다.
+
+automaton을 만드는 데 시간이 걸리므로 처음 만든 뒤 GAZETTEER_CACHE 파일로 저장하고,
+다음 시작 시 원본 코드 파일이 바뀌지 않았으면 파일에서 읽습니다.
+
+Tokenizer에서 USE_GAZETTEER=True일 때만 사용합니다.
+"""
+
+import os
+import pickle
+import re
+import threading
+
+from src import config
+from ..tokens import TOKEN_H1, TOKEN_H23, TOKEN_H4, TOKEN_RI, TOKEN_ROAD
+from .HSimplifier import HSimplifier
+
+FORMAT_VERSION = 1
+
+# 행정구역 단계. 붙여 쓴 단어는 단계가 커지는 순서로만 나눔
+LEVELS = {
+    TOKEN_H1: 1,
+    TOKEN_H23: 2,
+    TOKEN_H4: 3,
+    TOKEN_ROAD: 3,
+    TOKEN_RI: 4,
+}
+# 이 유형 뒤는 번지, 건물번호, 건물명이므로 더 나누지 않음
+_LAST_TYPES = (TOKEN_ROAD, TOKEN_RI)
+# 이보다 짧은 단어는 나누지 않음 (두 이름이 붙으려면 최소 4자)
+MIN_GLUED_LEN = 4
+
+_SOURCE_FILES = (
+    "h1_h2_code_match.csv",
+    "PNU.csv",
+    "TN_SPRD_RDNM.txt",
+)
+
+
+class AhoCorasick:
+    """
+    여러 단어를 한 번의 선형 탐색으로 찾는 Aho-Corasick automaton
+
+    단어마다 토큰 유형(kind) 목록을 가집니다. 같은 이름이 여러 유형일 수 있습니다. ex) 광주(H1, H23)
+    """
+
+    def __init__(self):
+        self._goto = [{}]  # 상태별 전이 {문자: 상태}
+        self._fail = [0]  # 상태별 실패 전이
+        self._word = [None]  # 상태에서 끝나는 단어 (길이, kinds)
+        self._dict_link = [0]  # 실패 전이를 따라가며 처음 만나는 단어 상태
+        self.num_words = 0
+
+    def add(self, word: str, kind):
+        if not word:
+            return
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._word.append(None)
+                self._dict_link.append(0)
+            state = nxt
+
+        if self._word[state] is None:
+            self._word[state] = (len(word), (kind,))
+            self.num_words += 1
+        elif kind not in self._word[state][1]:
+            length, kinds = self._word[state]
+            self._word[state] = (length, kinds + (kind,))
+
+    def build(self):
+        """실패 전이 계산. 단어를 모두 추가한 뒤 한 번 호출"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+            self._dict_link[state] = 0
+
+        n = 0
+        while n < len(queue):
+            state = queue[n]
+            n += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                f = self._goto[f].get(ch, 0)
+                self._fail[nxt] = f if f != nxt else 0
+                self._dict_link[nxt] = (
+                    f if self._word[f] is not None else self._dict_link[f]
+                )
+
+    def iter_matches(self, text: str):
+        """
+        text에서 찾은 모든 단어
+
+        Yields:
+            (start, length, kinds)
+        """
+        goto = self._goto
+        fail = self._fail
+        words = self._word
+        dict_link = self._dict_link
+
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            s = state if words[state] is not None else dict_link[state]
+            while s:
+                length, kinds = words[s]
+                yield end - length, length, kinds
+                s = dict_link[s]
+
+
+class Gazetteer:
+    """
+    행정구역명, 도로명 사전으로 붙여 쓴 단어를 나눕니다.
+    """
+
+    def __init__(self, automaton: AhoCorasick, signature=None):
+        self.automaton = automaton
+        self.signature = signature
+        self.re_word = re.compile(r"[^\s()\[\],?]+")
+
+    def segment(self, word: str):
+        """
+        단어 앞부분을 행정구역명, 도로명으로 나눕니다.
+
+        위치마다 가장 긴 이름을 고르며, 행정구역 단계(LEVELS)가 커지는 순서만 허용합니다.
+
+        Args:
+            word (str): 나눌 단어.
+
+        Returns:
+            tuple: ([(이름, 토큰 유형), ...], 나머지 문자열)
+        """
+        starts = {}
+        for start, length, kinds in self.automaton.iter_matches(word):
+            starts.setdefault(start, []).append((length, kinds))
+
+        segments = []
+        pos = 0
+        level = 0
+        while pos < len(word) and pos in starts:
+            chosen = None
+            for length, kinds in sorted(starts[pos], reverse=True):
+                kind = next((k for k in kinds if LEVELS[k] > level), None)
+                if kind:
+                    chosen = (length, kind)
+                    break
+            if not chosen:
+                break
+
+            length, kind = chosen
+            segments.append((word[pos : pos + length], kind))
+            pos += length
+            level = LEVELS[kind]
+            if kind in _LAST_TYPES:
+                break
+
+        return segments, word[pos:]
+
+    def split_glued(self, address: str) -> str:
+        """
+        주소에서 이름 두 개 이상이 붙어 있는 단어를 띄어 씁니다.
+
+        ex) 서울영등포구신길동 123 -> 서울 영등포구 신길동 123
+        """
+
+        def split_word(m):
+            word = m.group(0)
+            if len(word) < MIN_GLUED_LEN:
+                return word
+            segments, rest = self.segment(word)
+            if len(segments) < 2:
+                return word
+            pieces = [name for name, _ in segments]
+            if rest:
+                pieces.append(rest)
+            return " ".join(pieces)
+
+        return self.re_word.sub(split_word, address)
+
+    def save(self, path: str):
+        """automaton을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                (FORMAT_VERSION, self.signature, self.automaton),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, signature):
+        """
+        저장된 automaton을 읽습니다.
+
+        Returns:
+            Gazetteer 또는 None: 파일이 없거나 원본 코드 파일이 바뀐 경우 None.
+        """
+        try:
+            with open(path, "rb") as f:
+                version, saved_signature, automaton = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"경고: {path} 파일을 읽을 수 없습니다: {e}")
+            return None
+
+        if version != FORMAT_VERSION or saved_signature != signature:
+            return None
+        return cls(automaton, signature)
+
+
+def _source_signature():
+    """원본 코드 파일의 크기와 수정 시각. 바뀌면 automaton을 다시 만듦"""
+    signature = []
+    for filename in _SOURCE_FILES:
+        path = f"{config.CODE_DATA_DIR}/{filename}"
+        try:
+            st = os.stat(path)
+            signature.append((filename, st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            signature.append((filename, None, None))
+    return tuple(signature)
+
+
+def _add_h23_names(automaton: AhoCorasick, hSimplifier: HSimplifier):
+    from .hcodematcher import HCodeMatcher
+
+    hcodeMatcher = HCodeMatcher()
+    for row in hcodeMatcher.hcode_dict.values():
+        h23_nm = row["시군구명"]
+        names = {h23_nm.replace(" ", "")}
+        names.update(h23_nm.split(" "))
+        for name in list(names):
+            names.add(hSimplifier.h23Hash(name))
+        for name in names:
+            if len(name) >= 2:
+                automaton.add(name, TOKEN_H23)
+
+
+def _add_ld_names(automaton: AhoCorasick, hSimplifier: HSimplifier):
+    from .pnumatcher import PNUMatcher
+
+    pnuMatcher = PNUMatcher()
+    for row in pnuMatcher.ldong_dict.values():
+        for part in row["법정동명"].split(" ")[1:]:
+            if len(part) < 2:
+                continue
+            if part.endswith(("읍", "면", "동", "가")):
+                automaton.add(part, TOKEN_H4)
+                simple = hSimplifier.h4Hash(part, keep_dong=True)
+                if len(simple) >= 2:
+                    automaton.add(simple, TOKEN_H4)
+            elif part.endswith("리"):
+                automaton.add(part, TOKEN_RI)
+
+
+def _add_road_names(automaton: AhoCorasick):
+    from .roadmatcher import RoadMatcher
+
+    roadMatcher = RoadMatcher()
+    for row in roadMatcher.road_dict.values():
+        if row["도로명"]:
+            automaton.add(row["도로명"], TOKEN_ROAD)
+
+
+def build_gazetteer() -> Gazetteer:
+    """코드 테이블에서 automaton을 새로 만듭니다. 없는 코드 파일은 건너뜁니다."""
+    hSimplifier = HSimplifier()
+    automaton = AhoCorasick()
+
+    for h1_nm in hSimplifier.getSortedH1Prefic():
+        automaton.add(h1_nm, TOKEN_H1)
+
+    for add_names in (
+        lambda: _add_h23_names(automaton, hSimplifier),
+        lambda: _add_ld_names(automaton, hSimplifier),
+        lambda: _add_road_names(automaton),
+    ):
+        try:
+            add_names()
+        except FileNotFoundError as e:
+            print(f"경고: {e.filename} 파일을 찾을 수 없습니다.")
+
+    automaton.build()
+    return Gazetteer(automaton, _source_signature())
+
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """
+    프로세스에서 공유하는 Gazetteer.
+
+    GAZETTEER_CACHE 파일이 있고 원본 코드 파일이 그대로이면 파일에서 읽고,
+    아니면 새로 만들어 저장합니다.
+    """
+    global _gazetteer
+    with _gazetteer_lock:
+        if _gazetteer is None:
+            signature = _source_signature()
+            gazetteer = Gazetteer.load(config.GAZETTEER_CACHE, signature)
+            if gazetteer is None:
+                gazetteer = build_gazetteer()
+                try:
+                    gazetteer.save(config.GAZETTEER_CACHE)
+                except OSError as e:
+                    print(f"경고: {config.GAZETTEER_CACHE} 저장 실패: {e}")
+            print(
+                f"Gazetteer: {gazetteer.automaton.num_words:,} names "
+                f"({config.GAZETTEER_CACHE})"
+            )
+            _gazetteer = gazetteer
+        return _gazetteer
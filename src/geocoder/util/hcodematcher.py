@@ -1,9 +1,15 @@
 import csv
+import threading
 
 from src import config
 from difflib import SequenceMatcher
 from .HSimplifier import HSimplifier
 
+# 오타 교정 시 SequenceMatcher로 비교할 후보 수
+H23_TYPO_SHORTLIST_SIZE = 8
+# jamo n-gram 경계 표시
+_NGRAM_PAD = -1
+
 
 class HCodeMatcher:
     def __init__(self):
@@ -22,6 +28,10 @@ class HCodeMatcher:
 
                 self._add_h23_search_index(row)
 
+        # h1_cd별 오타 교정 색인. search_most_likely_h23_nm()에서 처음 사용할 때 생성
+        self._h23_partitions = {}
+        self._h23_partitions_lock = threading.Lock()
+
         self.h1_hash_dict = {}
         hSimplifier = HSimplifier()
         for data in self.hcode_dict.values():
@@ -29,6 +39,9 @@ class HCodeMatcher:
             h1_nm_hash = hSimplifier.h1Hash(h1_nm)
             self.h1_hash_dict[h1_nm_hash] = data["최신시도코드"]
 
+        # 후보 필터링(h23_compare)에서 비교하는 시군구명의 hash를 미리 계산
+        HSimplifier.preload_h23(row["시군구명"] for row in self.hcode_dict.values())
+
     def _add_h23_search_index(self, row):
         h23_nm_no_space = row["시군구명"].replace(" ", "")
         h23_nm_decomposed = self._decompose_korean(h23_nm_no_space)
@@ -240,11 +253,73 @@ class HCodeMatcher:
         """
         return self.h1_hash_dict.get(h1_nm_hash, None)
 
+    def _jamo_bigrams(self, decomposed):
+        """
+        자모 분해한 정수 배열의 bigram 집합 (양 끝 경계 포함)
+        """
+        padded = [_NGRAM_PAD, *decomposed, _NGRAM_PAD]
+        return {(padded[i], padded[i + 1]) for i in range(len(padded) - 1)}
+
+    def _h23_partition(self, h1_cd):
+        """
+        h1_cd로 시작하는 h23_search_index 항목의 오타 교정 색인을 반환합니다.
+        h1_cd별로 한 번만 만들어 재사용합니다.
+
+        Returns:
+            dict:
+                entries: h23_search_index 순서의 항목 리스트
+                exact: 검색 이름 -> 첫 번째 항목의 h23_nm
+                bigrams: jamo bigram -> 항목 번호 리스트
+        """
+        partition_key = h1_cd or ""
+        partition = self._h23_partitions.get(partition_key)
+        if partition is not None:
+            return partition
+
+        with self._h23_partitions_lock:
+            partition = self._h23_partitions.get(partition_key)
+            if partition is not None:
+                return partition
+
+            entries = []
+            exact = {}
+            bigrams = {}
+            for key, data in self.h23_search_index.items():
+                if h1_cd and not key.startswith(h1_cd):
+                    continue
+
+                n = len(entries)
+                entries.append(data)
+                # key는 "{시도코드}_{검색 이름}" 형식. 검색 이름이 자모 분해한 원본
+                exact.setdefault(key.split("_", 1)[1], data["h23_nm"])
+                for bigram in self._jamo_bigrams(data["h23_nm_decomposed"]):
+                    bigrams.setdefault(bigram, []).append(n)
+
+            partition = {"entries": entries, "exact": exact, "bigrams": bigrams}
+            self._h23_partitions[partition_key] = partition
+            return partition
+
+    def is_h23_nm(self, h23_nm, h1_cd=None):
+        """
+        오타 교정 없이 찾을 수 있는 시군구명이면 True
+
+        :param h23_nm: 시군구명
+        :param h1_cd: 시도코드. 있으면 해당 시도의 시군구만
+        """
+        if not h23_nm:
+            return False
+        if h23_nm.startswith("세종"):
+            return True
+        return h23_nm in self._h23_partition(h1_cd)["exact"]
+
     def search_most_likely_h23_nm(self, h23_nm, h1_cd):
         """
         주어진 시군구명(h23_nm)에 가장 유사한 시군구명을 반환합니다.
         h23_nm이 None이거나 빈 문자열일 경우 빈 문자열을 반환합니다.
 
+        1. 정확히 같은 이름이 있으면 바로 반환
+        2. jamo bigram이 많이 겹치는 후보 H23_TYPO_SHORTLIST_SIZE개만 SequenceMatcher로 비교
+
         :param h23_nm: 시군구명
         :return: 가장 유사한 시군구명
         """
@@ -252,15 +327,29 @@ class HCodeMatcher:
             if h23_nm.startswith("세종"):
                 return "세종"
 
+            partition = self._h23_partition(h1_cd)
+
+            # 정확히 같은 이름
+            if found_h23_nm := partition["exact"].get(h23_nm):
+                return found_h23_nm
+
             h23_nm_decomposed = self._decompose_korean(h23_nm)
 
-            # 후보군에서 가장 유사한 시군구명을 찾습니다.
-            # 여기서는 단순히 h23_nm과 같은 이름을 가진 항목을 찾습니다.
-            best_similarity = 0.0
-            for key, data in self.h23_search_index.items():
-                if h1_cd and not key.startswith(h1_cd):
-                    continue
+            # bigram이 많이 겹치는 후보만 선택
+            overlap = {}
+            for bigram in self._jamo_bigrams(h23_nm_decomposed):
+                for n in partition["bigrams"].get(bigram, ()):
+                    overlap[n] = overlap.get(n, 0) + 1
+            shortlist = sorted(overlap, key=lambda n: (-overlap[n], n))[
+                :H23_TYPO_SHORTLIST_SIZE
+            ]
 
+            # 색인 순서대로 비교 (유사도가 같으면 앞선 항목 선택)
+            best_match = ""
+            best_similarity = 0.0
+            entries = partition["entries"]
+            for n in sorted(shortlist):
+                data = entries[n]
                 similarity = self._similarity(
                     data["h23_nm_decomposed"], h23_nm_decomposed
                 )
@@ -0,0 +1,48 @@
+class PrefixTrie:
+    """
+    문자 단위 trie. 문자열이 목록의 어떤 단어로 시작하는지 한 번의 순회로 찾습니다.
+
+    접두사 목록을 순서대로 startswith()로 검사하는 대신 사용합니다.
+    """
+
+    _END = ""  # 단어 끝 표시 키. 문자 키는 길이가 1이므로 겹치지 않음
+
+    def __init__(self, words=()):
+        self._root = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if not word:
+            return
+        node = self._root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[self._END] = word
+
+    def longest_prefix(self, s: str):
+        """
+        s의 접두사 중 가장 긴 단어를 반환합니다.
+
+        Returns:
+            str 또는 None: 일치하는 단어. 없으면 None.
+        """
+        node = self._root
+        found = None
+        for ch in s:
+            node = node.get(ch)
+            if node is None:
+                break
+            found = node.get(self._END, found)
+        return found
+
+    def has_prefix(self, s: str) -> bool:
+        """s가 목록의 단어 중 하나로 시작하면 True"""
+        node = self._root
+        for ch in s:
+            node = node.get(ch)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
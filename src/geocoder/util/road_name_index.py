@@ -0,0 +1,184 @@
+"""
+유일한 도로명 색인
+
+RoadMatcher(TN_SPRD_RDNM.txt)의 도로명을 단순화한 이름(RoadSimplifier.roadHash)으로 모아
+광역시도 안에서 또는 전국에서 하나의 시군구에만 있는 도로명을 (시군구명, 도로명코드)로 찾습니다.
+
+"경상북도 양덕군 남정면 진불길 43"처럼 시군구명이 없거나 틀려도 도로명이 유일하면
+Geocoder가 시군구명을 바로 교정하므로, 시군구명 오타 교정(SequenceMatcher)과
+여러 possible_hashs 조회를 거치지 않습니다. (TODO.md 시군구 오타)
+
+색인을 만드는 데 시간이 걸리므로 처음 만든 뒤 ROAD_NAME_INDEX_CACHE 파일로 저장하고,
+다음 시작 시 TN_SPRD_RDNM.txt가 바뀌지 않았으면 파일에서 읽습니다.
+
+USE_ROAD_NAME_INDEX=True일 때만 사용합니다.
+"""
+
+import os
+import pickle
+import threading
+
+from src import config
+from .HSimplifier import HSimplifier
+from .RoadSimplifier import RoadSimplifier
+
+FORMAT_VERSION = 1
+
+_SOURCE_FILE = "TN_SPRD_RDNM.txt"
+
+
+class RoadNameIndex:
+    """
+    유일한 도로명 -> (시군구명, 도로명코드)
+
+    by_h1: {광역시도 hash: {도로명 hash: (시군구명, 도로명코드)}} 광역시도 안에서 유일한 도로명
+    national: {도로명 hash: (시군구명, 도로명코드)} 전국에서 유일한 도로명
+    같은 시군구에 같은 이름의 도로가 여럿이면 도로명코드는 빈 문자열입니다.
+    """
+
+    def __init__(self, by_h1: dict, national: dict, signature=None):
+        self.by_h1 = by_h1
+        self.national = national
+        self.signature = signature
+
+    def __len__(self):
+        return len(self.national) + sum(len(roads) for roads in self.by_h1.values())
+
+    def lookup(self, road_hash: str, h1_hash: str = None):
+        """
+        도로명이 유일한 시군구를 찾습니다.
+
+        Args:
+            road_hash (str): 단순화한 도로명 (RoadSimplifier.roadHash)
+            h1_hash (str): 단순화한 광역시도명 (HSimplifier.h1Hash). 없으면 전국에서 찾음
+
+        Returns:
+            tuple 또는 None: (시군구명, 도로명코드). 유일하지 않거나 없으면 None.
+        """
+        if h1_hash:
+            return self.by_h1.get(h1_hash, {}).get(road_hash)
+        return self.national.get(road_hash)
+
+    def save(self, path: str):
+        """색인을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                (FORMAT_VERSION, self.signature, self.by_h1, self.national),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, signature):
+        """
+        저장된 색인을 읽습니다.
+
+        Returns:
+            RoadNameIndex 또는 None: 파일이 없거나 TN_SPRD_RDNM.txt가 바뀐 경우 None.
+        """
+        try:
+            with open(path, "rb") as f:
+                version, saved_signature, by_h1, national = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"경고: {path} 파일을 읽을 수 없습니다: {e}")
+            return None
+
+        if version != FORMAT_VERSION or saved_signature != signature:
+            return None
+        return cls(by_h1, national, signature)
+
+
+def _source_signature():
+    """TN_SPRD_RDNM.txt의 크기와 수정 시각. 바뀌면 색인을 다시 만듦"""
+    path = f"{config.CODE_DATA_DIR}/{_SOURCE_FILE}"
+    try:
+        st = os.stat(path)
+        return (_SOURCE_FILE, st.st_size, st.st_mtime_ns)
+    except FileNotFoundError:
+        return (_SOURCE_FILE, None, None)
+
+
+def _unique(h23s: dict):
+    """{시군구명: {도로명코드}}에 시군구가 하나뿐이면 (시군구명, 도로명코드)"""
+    if len(h23s) != 1:
+        return None
+    h23_nm, road_cds = next(iter(h23s.items()))
+    road_cd = next(iter(road_cds)) if len(road_cds) == 1 else ""
+    return h23_nm, road_cd
+
+
+def build_road_name_index(road_dict: dict) -> RoadNameIndex:
+    """
+    RoadMatcher.road_dict로 색인을 만듭니다.
+    사용하지 않는 도로명과 시군구명이 없는 도로명(세종시)은 제외합니다.
+    """
+    hSimplifier = HSimplifier()
+    roadSimplifier = RoadSimplifier()
+
+    # {도로명 hash: {광역시도 hash: {시군구명: {도로명코드}}}}
+    roads = {}
+    for row in road_dict.values():
+        if row["사용여부"] == "1" or not row["도로명"] or not row["시군구명"]:
+            continue
+        road_hash = roadSimplifier.roadHash(row["도로명"])
+        h1_hash = hSimplifier.h1Hash(row["시도명"])
+        road_cd = f"{row['시군구코드']}{row['도로명번호']}"
+        roads.setdefault(road_hash, {}).setdefault(h1_hash, {}).setdefault(
+            row["시군구명"], set()
+        ).add(road_cd)
+
+    by_h1 = {}
+    national = {}
+    for road_hash, h1s in roads.items():
+        for h1_hash, h23s in h1s.items():
+            if found := _unique(h23s):
+                by_h1.setdefault(h1_hash, {})[road_hash] = found
+        if len(h1s) == 1:
+            if found := _unique(next(iter(h1s.values()))):
+                national[road_hash] = found
+
+    return RoadNameIndex(by_h1, national, _source_signature())
+
+
+_road_name_index = None
+_road_name_index_lock = threading.Lock()
+
+
+def get_road_name_index() -> RoadNameIndex:
+    """
+    프로세스에서 공유하는 RoadNameIndex.
+
+    ROAD_NAME_INDEX_CACHE 파일이 있고 TN_SPRD_RDNM.txt가 그대로이면 파일에서 읽고,
+    아니면 새로 만들어 저장합니다.
+
+    Returns:
+        RoadNameIndex 또는 None: TN_SPRD_RDNM.txt가 없으면 None.
+    """
+    global _road_name_index
+    with _road_name_index_lock:
+        if _road_name_index is None:
+            signature = _source_signature()
+            index = RoadNameIndex.load(config.ROAD_NAME_INDEX_CACHE, signature)
+            if index is None:
+                from .roadmatcher import RoadMatcher
+
+                try:
+                    road_dict = RoadMatcher().road_dict
+                except FileNotFoundError as e:
+                    print(f"경고: {e.filename} 파일을 찾을 수 없습니다.")
+                    return None
+                index = build_road_name_index(road_dict)
+                try:
+                    index.save(config.ROAD_NAME_INDEX_CACHE)
+                except OSError as e:
+                    print(f"경고: {config.ROAD_NAME_INDEX_CACHE} 저장 실패: {e}")
+            print(
+                f"RoadNameIndex: {len(index.national):,} national, "
+                f"{len(index):,} total ({config.ROAD_NAME_INDEX_CACHE})"
+            )
+            _road_name_index = index
+        return _road_name_index
@@ -0,0 +1,170 @@
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from .candidates import Candidates
+
+
+def freeze(o):
+    """
+    JSON 디코딩 결과를 읽기 전용 구조로 변환합니다.
+    dict는 MappingProxyType, list는 tuple이 됩니다.
+    """
+    if isinstance(o, dict):
+        return MappingProxyType({k: freeze(v) for k, v in o.items()})
+    if isinstance(o, list):
+        return tuple(freeze(v) for v in o)
+    return o
+
+
+def thaw(o):
+    """
+    freeze()로 만든 읽기 전용 구조를 수정 가능한 dict/list로 복사합니다.
+    """
+    if isinstance(o, MappingProxyType):
+        return {k: thaw(v) for k, v in o.items()}
+    if isinstance(o, tuple):
+        return [thaw(v) for v in o]
+    return o
+
+
+class DecodedValueCache:
+    """
+    DB 키별로 JSON 디코딩한 후보 주소 리스트 캐시
+
+    값은 freeze()한 읽기 전용 구조(후보 리스트는 Candidates)로 저장하고 그대로 반환합니다.
+    (여러 스레드가 같은 객체를 공유하므로 수정하려면 thaw()로 복사해야 합니다.)
+    크기는 원본 JSON 크기(bytes) 합계로 제한하며, 넘으면 LRU 순서로 제거합니다.
+    DB 버전이 바뀌면 전체 비웁니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes (int): 원본 JSON 크기 기준 최대 크기 (bytes). 0 이하이면 캐시 사용 안 함.
+        """
+        self.max_bytes = max_bytes
+
+        self._cache = OrderedDict()  # key -> (size, value)
+        self._lock = threading.Lock()
+        self._version = None
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def _check_version(self, version):
+        """DB 버전이 바뀌었으면 전체 비움. 락 안에서 호출"""
+        if version != self._version:
+            if self._cache:
+                self._invalidations += 1
+            self._cache.clear()
+            self._bytes = 0
+            self._version = version
+
+    def get(self, key, version):
+        """
+        캐시된 후보 주소 리스트를 반환합니다.
+
+        Args:
+            key: DB 키.
+            version: 현재 DB 버전.
+
+        Returns:
+            tuple 또는 None: 읽기 전용 후보 주소 리스트.
+        """
+        if self.max_bytes <= 0:
+            return None
+
+        with self._lock:
+            self._check_version(version)
+
+            item = self._cache.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return item[1]
+
+    def put(self, key, value, size: int, version):
+        """
+        디코딩한 값을 읽기 전용으로 바꿔 저장하고 반환합니다.
+
+        Args:
+            key: DB 키.
+            value: JSON 디코딩한 값.
+            size (int): 원본 JSON 크기 (bytes).
+            version: 값을 읽은 시점의 DB 버전.
+
+        Returns:
+            읽기 전용으로 변환한 값.
+        """
+        frozen = freeze(value)
+        if isinstance(frozen, tuple):
+            # 후보 리스트. 필터링용 필드도 캐시와 함께 재사용
+            frozen = Candidates(frozen)
+        if self.max_bytes <= 0 or size > self.max_bytes:
+            return frozen
+
+        with self._lock:
+            self._check_version(version)
+
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._bytes -= old[0]
+
+            self._cache[key] = (size, frozen)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (evicted_size, _) = self._cache.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+        return frozen
+
+    def contains(self, key, version) -> bool:
+        """
+        get()으로 읽을 수 있는 키이면 True. get()과 같이 DB 버전이 바뀌었으면 전체 비움.
+        hit/miss 통계에는 포함하지 않습니다.
+
+        Args:
+            key: DB 키.
+            version: 현재 DB 버전.
+        """
+        if self.max_bytes <= 0:
+            return False
+
+        with self._lock:
+            self._check_version(version)
+            return key in self._cache
+
+    def clear(self):
+        """전체 비움"""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, hit_rate, evictions, invalidations
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
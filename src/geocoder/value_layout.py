@@ -0,0 +1,497 @@
+"""
+GEOCODE_DB 값(후보 주소 리스트) 저장 형식
+
+v1: 후보 리스트. VALUE_CODEC으로 인코딩 (db/value_codec.py)
+v2: 후보를 h1_nm별로 나누고, 나눈 조각마다 정렬 순서(sort_key 내림차순)로 저장
+    LAYOUT_MARKER + 헤더 JSON + "\\n" + 조각 JSON 리스트들 (공백 없는 UTF-8 JSON)
+    헤더: [[h1_nm, 조각 길이(문자 수)], ...]
+
+읽을 때는 값 전체를 한 번 문자열로 바꾼 뒤 해당 조각만 잘라 디코딩합니다.
+첫 byte(format byte)로 형식을 구분하므로 v1 DB와 기존 JSON 값도 그대로 읽을 수 있습니다.
+
+레코드 참조 (DEDUP_RECORDS):
+    건물 하나의 레코드가 지번, 도로명, 건물명 키와 H23_END, H4_END, RI_END 키 등 수십 개 키에 반복 저장되므로,
+    레코드는 레코드 키(RECORD_KEY_PREFIX + 레코드 id)에 한 번만 저장하고 키에는 레코드 id를 저장합니다.
+    v1: 후보 대신 레코드 id 문자열의 리스트
+    v2: REF_LAYOUT_MARKER로 시작하고 조각에 레코드 id 리스트 저장
+    레코드 id는 레코드 내용의 hash이므로 같은 레코드는 같은 id가 됩니다.
+    (같은 건물이라도 키마다 병합 결과가 다를 수 있어 bld_mgt_no를 id로 쓰지 않습니다.)
+    읽을 때는 값의 레코드 id를 한 번의 multi_get으로 조회합니다.
+
+큰 값 분할 (SPLIT_VALUE_MIN_RECORDS):
+    후보가 많고 h1_nm이 여러 개인 키(시도 없는 도로명, 건물명 키 등)는 h1_nm 조각마다 조각 키(키 + SHARD_KEY_SEPARATOR + h1_nm)에
+    저장하고, 키에는 SPLIT_MARKER + 조각 목록 JSON [[h1_nm, 조각 키, 후보 수], ...]을 저장합니다.
+    조회할 때는 입력 주소의 h1_nm 조각 키만 읽습니다.
+"""
+
+import base64
+import hashlib
+import json
+from collections import OrderedDict
+
+from src import config
+from .candidates import Candidates, sort_key
+from .db.value_codec import (
+    LAYOUT_FORMAT,
+    REF_LAYOUT_FORMAT,
+    SPLIT_FORMAT,
+    decode,
+    get_codec,
+    value_format,
+)
+from .value_cache import freeze
+
+LAYOUT_VERSION = 2
+# v2 값의 첫 문자 (format byte)
+LAYOUT_MARKER = chr(LAYOUT_FORMAT)
+# 조각에 레코드 id를 저장한 v2 값의 첫 문자
+REF_LAYOUT_MARKER = chr(REF_LAYOUT_FORMAT)
+
+# 조각 목록 값의 첫 문자
+SPLIT_MARKER = chr(SPLIT_FORMAT)
+# 조각 키의 구분자. 주소 hash에 쓰이지 않는 제어 문자
+SHARD_KEY_SEPARATOR = "\x1f"
+
+# 주소 hash가 아닌 키(레코드 키, 인근 번호 인덱스 키 등)의 접두사. 주소 hash는 "@"로 시작하지 않음
+INTERNAL_KEY_PREFIX = "@"
+# 레코드 키 접두사
+RECORD_KEY_PREFIX = INTERNAL_KEY_PREFIX + "r:"
+_INTERNAL_KEY_PREFIX_BYTES = INTERNAL_KEY_PREFIX.encode("utf-8")
+_RECORD_KEY_PREFIX_BYTES = RECORD_KEY_PREFIX.encode("utf-8")
+
+_EMPTY = Candidates()
+
+
+def encode_value(records, codec=None, put_record=None) -> bytes:
+    """
+    후보 주소 리스트를 저장 형식으로 변환합니다.
+
+    PARTITIONED_VALUES=False이거나 후보가 하나이면 v1로 저장합니다.
+    정렬 기준을 계산할 수 없는 레코드가 있어도 v1로 저장합니다. (읽을 때 기존과 같이 처리)
+
+    Args:
+        records (list): 후보 주소 리스트.
+        codec: v1 값의 codec. None이면 VALUE_CODEC.
+        put_record: 레코드를 레코드 키에 저장하고 레코드 id를 반환하는 함수 (RecordWriter.put).
+            있으면 후보 대신 레코드 id를 저장합니다.
+
+    Returns:
+        bytes: DB에 저장할 값.
+    """
+    if codec is None:
+        codec = get_codec(config.VALUE_CODEC)
+    if not config.PARTITIONED_VALUES or len(records) < 2:
+        return codec.encode(_entries(records, put_record))
+
+    parts = {}
+    for r in records:
+        parts.setdefault(r.get("h1_nm"), []).append(r)
+
+    try:
+        ordered = [sorted(part, key=sort_key, reverse=True) for part in parts.values()]
+    except Exception:
+        return codec.encode(_entries(records, put_record))
+
+    bodies = [_dumps(_entries(part, put_record)) for part in ordered]
+    header = [[h1_nm, len(body)] for h1_nm, body in zip(parts, bodies)]
+    marker = LAYOUT_MARKER if put_record is None else REF_LAYOUT_MARKER
+    value = marker + _dumps(header) + "\n" + "".join(bodies)
+    return value.encode("utf-8")
+
+
+def _entries(records, put_record):
+    if put_record is None:
+        return records
+    return [put_record(r) for r in records]
+
+
+def encode_values(key, records, codec=None, put_record=None) -> list:
+    """
+    후보 주소 리스트를 저장할 키와 값 목록으로 변환합니다.
+
+    후보가 SPLIT_VALUE_MIN_RECORDS 이상이고 h1_nm이 둘 이상이면 h1_nm별 조각 키로 나눕니다.
+    나누지 않으면 [(key, encode_value(...))]입니다.
+
+    Args:
+        key (str | bytes): DB 키.
+        records (list): 후보 주소 리스트.
+        codec, put_record: encode_value 참고.
+
+    Returns:
+        list: [(키, 값), ...]. 조각 키 값 다음에 key의 조각 목록 값.
+    """
+    min_records = config.SPLIT_VALUE_MIN_RECORDS
+    if min_records <= 0 or len(records) < min_records:
+        return [(key, encode_value(records, codec, put_record))]
+
+    parts = {}
+    for r in records:
+        parts.setdefault(r.get("h1_nm"), []).append(r)
+    if len(parts) < 2:
+        return [(key, encode_value(records, codec, put_record))]
+
+    items = []
+    shards = []
+    for h1_nm, part in parts.items():
+        sub_key = shard_key(key, h1_nm)
+        items.append((sub_key, encode_value(part, codec, put_record)))
+        shards.append([h1_nm, sub_key, len(part)])
+    items.append((key, (SPLIT_MARKER + _dumps(shards)).encode("utf-8")))
+    return items
+
+
+def shard_key(key, h1_nm) -> str:
+    """key의 h1_nm 조각 키"""
+    if not isinstance(key, str):
+        key = bytes(key).decode("utf-8")
+    return key + SHARD_KEY_SEPARATOR + (h1_nm or "")
+
+
+def is_shard_key(key) -> bool:
+    """조각 키이면 True"""
+    if isinstance(key, str):
+        return SHARD_KEY_SEPARATOR in key
+    return SHARD_KEY_SEPARATOR.encode("utf-8") in bytes(key)
+
+
+def is_split(o) -> bool:
+    """조각 목록 값이면 True"""
+    return value_format(o) == SPLIT_FORMAT
+
+
+def _dumps(o) -> str:
+    return json.dumps(o, ensure_ascii=False, separators=(",", ":"))
+
+
+def record_id(record) -> str:
+    """레코드 내용의 hash (96 bits, base64 16자)"""
+    text = json.dumps(record, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=12).digest()
+    return base64.urlsafe_b64encode(digest).decode("ascii")
+
+
+def record_key(rid: str) -> str:
+    """레코드 id를 저장한 DB 키"""
+    return RECORD_KEY_PREFIX + rid
+
+
+def is_internal_key(key) -> bool:
+    """레코드 키, 인덱스 키 등 주소 hash가 아닌 키이면 True. (DB를 순회하는 updater에서 건너뜀)"""
+    if isinstance(key, str):
+        return key.startswith(INTERNAL_KEY_PREFIX)
+    return bytes(key).startswith(_INTERNAL_KEY_PREFIX_BYTES)
+
+
+def is_record_key(key) -> bool:
+    """레코드 키이면 True"""
+    if isinstance(key, str):
+        return key.startswith(RECORD_KEY_PREFIX)
+    return bytes(key).startswith(_RECORD_KEY_PREFIX_BYTES)
+
+
+def resolve_records(entries, db):
+    """
+    후보 리스트의 레코드 id를 레코드로 바꿉니다. 레코드는 한 번의 multi_get으로 조회합니다.
+
+    레코드 키가 없는 id는 건너뜁니다.
+
+    Args:
+        entries (list): 레코드 또는 레코드 id 리스트.
+        db: multi_get이 있는 DB.
+
+    Returns:
+        tuple: (레코드 리스트, 조회한 레코드 크기 합계(bytes))
+
+    Raises:
+        ValueError: 레코드 id가 있는데 db가 없음
+    """
+    ids = [e for e in entries if isinstance(e, str)]
+    if not ids:
+        return entries, 0
+
+    found, size = fetch_records(ids, db)
+    records = []
+    for e in entries:
+        if not isinstance(e, str):
+            records.append(e)
+        elif e in found:
+            records.append(found[e])
+    return records, size
+
+
+def fetch_records(ids, db):
+    """
+    레코드 id의 레코드를 한 번의 multi_get으로 조회합니다.
+
+    Returns:
+        tuple: ({레코드 id: 레코드}, 조회한 레코드 크기 합계(bytes))
+    """
+    if db is None:
+        raise ValueError("레코드 id를 저장한 값은 db가 있어야 읽을 수 있습니다.")
+
+    ids = list(dict.fromkeys(ids))
+    found = {}
+    size = 0
+    for rid, v in zip(ids, db.multi_get([record_key(rid) for rid in ids])):
+        if v is not None:
+            found[rid] = decode(v)
+            size += len(v)
+    return found, size
+
+
+class RecordWriter:
+    """
+    encode_value의 put_record. 레코드를 레코드 키에 저장하고 레코드 id를 반환합니다.
+
+    한 레코드를 여러 키에서 이어서 저장하므로 최근 저장한 id는 다시 저장하지 않습니다.
+    """
+
+    def __init__(self, db, codec=None, max_ids: int = 1000000):
+        """
+        Args:
+            db: 레코드를 저장할 DB.
+            codec: 레코드 codec. None이면 VALUE_CODEC.
+            max_ids (int): 기억할 최근 저장 id 수.
+        """
+        self.db = db
+        self.codec = codec or get_codec(config.VALUE_CODEC)
+        self.max_ids = max_ids
+        self._written = OrderedDict()
+
+        self.written = 0
+        self.written_bytes = 0
+
+    def put(self, record, batch=None) -> str:
+        """
+        Args:
+            record (dict): 레코드.
+            batch: 있으면 WriteBatch에 추가.
+
+        Returns:
+            str: 레코드 id.
+        """
+        rid = record_id(record)
+        if rid in self._written:
+            self._written.move_to_end(rid)
+            return rid
+
+        value = self.codec.encode(record)
+        (self.db if batch is None else batch).put(record_key(rid), value)
+        self.written += 1
+        self.written_bytes += len(value)
+
+        self._written[rid] = None
+        if len(self._written) > self.max_ids:
+            self._written.popitem(last=False)
+        return rid
+
+
+def is_partitioned(o) -> bool:
+    """v2 형식 값이면 True"""
+    return value_format(o) in (LAYOUT_FORMAT, REF_LAYOUT_FORMAT)
+
+
+def load_value(o, db=None):
+    """
+    Geocoder가 읽은 값을 디코딩합니다. 레코드 id는 db에서 조회합니다.
+
+    Args:
+        o: 값 (str, bytes 또는 고정(pin)된 값의 memoryview)
+        db: 레코드 키를 조회할 DB.
+
+    Returns:
+        tuple: (값, 크기)
+            값: v1이면 디코딩한 값, v2이면 PartitionedValue, 조각 목록이면 SplitValue.
+            크기: 값과 조회한 레코드의 크기 합계 (bytes). DecodedValueCache 크기 계산용
+    """
+    if is_partitioned(o):
+        value = PartitionedValue(o, db)
+        return value, len(o) + value.records_size
+    if is_split(o):
+        return SplitValue(o), len(o)
+
+    value = decode(o)
+    if isinstance(value, list):
+        value, size = resolve_records(value, db)
+        return value, len(o) + size
+    return value, len(o)
+
+
+def decode_value(o, db=None) -> list:
+    """
+    값 전체를 수정 가능한 후보 주소 리스트로 디코딩합니다. (updater 등에서 읽고 다시 저장할 때)
+
+    v2는 조각을 이어 붙인 뒤 정렬합니다.
+    레코드 id와 조각 목록의 조각 키는 db에서 조회합니다.
+    """
+    if is_split(o):
+        if db is None:
+            raise ValueError("조각 키로 나눈 값은 db가 있어야 읽을 수 있습니다.")
+        keys = SplitValue(o).shard_keys()
+        records = []
+        for v in db.multi_get(keys):
+            if v is not None:
+                records.extend(decode_value(v, db))
+        try:
+            return sorted(records, key=sort_key, reverse=True)
+        except Exception:
+            return records
+
+    if not is_partitioned(o):
+        value = decode(o)
+        if isinstance(value, list):
+            value, _ = resolve_records(value, db)
+        return value
+
+    value = PartitionedValue(o, db)
+    records = []
+    for h1_nm in value.h1_nms():
+        records.extend(value.decode_part(h1_nm))
+    return sorted(records, key=sort_key, reverse=True)
+
+
+def _layout_slices(text) -> dict:
+    """v2 값의 h1_nm별 조각 위치 {h1_nm: (시작, 끝)}"""
+    header_end = text.index("\n")
+    slices = {}
+    start = header_end + 1
+    for h1_nm, length in json.loads(text[1:header_end]):
+        slices[h1_nm] = (start, start + length)
+        start += length
+    return slices
+
+
+def record_counts(o) -> dict:
+    """
+    값의 h1_nm별 후보 수. 레코드 id와 조각 키는 조회하지 않습니다. (cli/analyze_key_sizes.py)
+
+    레코드 id만 저장한 v1 값은 h1_nm을 알 수 없으므로 None으로 셉니다.
+
+    Returns:
+        dict: {h1_nm: 후보 수}. 후보 리스트가 아니면 빈 dict.
+    """
+    if is_split(o):
+        return SplitValue(o).counts()
+
+    if is_partitioned(o):
+        text = o if isinstance(o, str) else str(o, "utf-8")
+        return {
+            h1_nm: len(json.loads(text[start:end]))
+            for h1_nm, (start, end) in _layout_slices(text).items()
+        }
+
+    value = decode(o)
+    counts = {}
+    if isinstance(value, list):
+        for r in value:
+            h1_nm = r.get("h1_nm") if isinstance(r, dict) else None
+            counts[h1_nm] = counts.get(h1_nm, 0) + 1
+    return counts
+
+
+class PartitionedValue:
+    """
+    v2 형식 값. h1_nm 조각을 처음 사용할 때 디코딩합니다.
+
+    DecodedValueCache에 저장되어 여러 요청이 함께 사용합니다.
+    디코딩한 조각은 읽기 전용 Candidates이며, 같은 조각을 두 스레드가 동시에 디코딩해도 결과는 같습니다.
+    조각에 레코드 id를 저장한 값은 만들 때 모든 조각의 레코드를 한 번의 multi_get으로 조회합니다.
+    """
+
+    def __init__(self, o, db=None):
+        if not isinstance(o, str):
+            # 헤더의 조각 길이는 문자 수. memoryview는 여기서 복사되므로 고정 해제 후에도 사용 가능
+            o = str(o, "utf-8")
+        self._text = o
+        self._slices = _layout_slices(o)  # h1_nm -> (시작, 끝)
+
+        self._parts = {}  # h1_nm -> Candidates
+        self._all = None
+
+        self._records = None  # 레코드 id -> 레코드
+        self.records_size = 0
+        if o[0] == REF_LAYOUT_MARKER:
+            ids = []
+            for h1_nm in self._slices:
+                ids.extend(self._load_part(h1_nm))
+            self._records, self.records_size = fetch_records(ids, db)
+
+    def h1_nms(self):
+        """저장된 순서의 h1_nm 목록"""
+        return list(self._slices)
+
+    def _load_part(self, h1_nm) -> list:
+        pos = self._slices.get(h1_nm)
+        if pos is None:
+            return []
+        return json.loads(self._text[pos[0] : pos[1]])
+
+    def decode_part(self, h1_nm) -> list:
+        """h1_nm 조각을 수정 가능한 리스트로 디코딩. 없으면 빈 리스트"""
+        part = self._load_part(h1_nm)
+        if self._records is None:
+            return part
+        # 레코드 키가 없는 id는 건너뜀
+        records = self._records
+        return [records[rid] for rid in part if rid in records]
+
+    def part(self, h1_nm) -> Candidates:
+        """h1_nm 조각 (정렬 순서)"""
+        part = self._parts.get(h1_nm)
+        if part is None:
+            if h1_nm not in self._slices:
+                return _EMPTY
+            part = Candidates.presorted(freeze(self.decode_part(h1_nm)))
+            self._parts[h1_nm] = part
+        return part
+
+    def select(self, h1_nm=None) -> Candidates:
+        """
+        filter_candidate_addresses에 넘길 후보 리스트
+
+        h1_nm이 있으면 h1_nm이 다른 후보는 어차피 걸러지므로 해당 조각만 반환합니다.
+        h1_nm이 없으면 모든 조각을 이어 붙여 반환합니다. (필터에서 정렬)
+        """
+        if h1_nm:
+            return self.part(h1_nm)
+
+        if self._all is None:
+            records = []
+            for name in self._slices:
+                records.extend(self.part(name))
+            self._all = Candidates(records)
+        return self._all
+
+
+class SplitValue:
+    """
+    h1_nm별 조각 키로 나눠 저장한 값의 조각 목록
+
+    DecodedValueCache에 저장되며, 조각 키의 값은 Geocoder가 조각 키로 따로 캐시합니다.
+    """
+
+    def __init__(self, o):
+        if not isinstance(o, str):
+            o = str(o, "utf-8")
+        self._shards = {}  # h1_nm -> (조각 키, 후보 수)
+        for h1_nm, sub_key, count in json.loads(o[1:]):
+            self._shards[h1_nm] = (sub_key, count)
+
+    def h1_nms(self):
+        """저장된 순서의 h1_nm 목록"""
+        return list(self._shards)
+
+    def counts(self) -> dict:
+        """h1_nm별 후보 수"""
+        return {h1_nm: count for h1_nm, (_, count) in self._shards.items()}
+
+    def shard_keys(self, h1_nm=None) -> list:
+        """
+        읽을 조각 키 목록
+
+        h1_nm이 있으면 h1_nm이 다른 후보는 어차피 걸러지므로 해당 조각 키만 반환합니다.
+        """
+        if h1_nm:
+            shard = self._shards.get(h1_nm)
+            return [shard[0]] if shard else []
+        return [sub_key for sub_key, _ in self._shards.values()]
@@ -32,24 +32,20 @@ class BigCache:
         Path(self.db_path).mkdir(parents=True, exist_ok=True)
 
         # Initialize RocksDB
-        self.db = Gimi9RocksDB(self.db_path, read_only=False)
+        self.db = Gimi9RocksDB(self.db_path, read_only=False, role="bigcache")
         self._initialized = True
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         try:
-            value = self.db.get(key.encode("utf-8"))
-            if value is None:
-                return None
-            return json.loads(value.decode("utf-8"))
+            return self.db.get_obj(key.encode("utf-8"))
         except Exception:
             return None
 
     def put(self, key: str, value: Any) -> bool:
         """Put value into cache"""
         try:
-            serialized_value = json.dumps(value).encode("utf-8")
-            self.db.put(key.encode("utf-8"), serialized_value)
+            self.db.put_obj(key.encode("utf-8"), value)
             return True
         except Exception:
             return False
@@ -9,6 +9,7 @@ from polygon_geohasher.polygon_geohasher import polygon_to_geohashes
 from shapely.geometry import box, MultiPolygon
 from tqdm import tqdm
 from src.geocoder.db.gimi9_rocks import Gimi9RocksDB
+from src.geocoder.db.value_codec import decode
 from .updater import BaseUpdater
 
 
@@ -82,7 +83,7 @@ class HdHistoryUpdater(BaseUpdater):
             # it = input_db.iterkeys()
             # it.seek_to_first()
             # key_count = sum(1 for _ in it)
-            key_count = json.loads(input_db.get(b"__metadata__").decode()).get(
+            key_count = input_db.get_obj(b"__metadata__").get(
                 "count", 0
             )
 
@@ -105,7 +106,7 @@ class HdHistoryUpdater(BaseUpdater):
                 if not value_bytes:
                     continue
 
-                new_data = json.loads(value_bytes)
+                new_data = decode(value_bytes)
                 input_yyyymm = yyyymm or input_db_path.split("/")[-4]  # 예: 202305
                 self._update_yyymm(new_data, input_yyyymm)
 
@@ -114,13 +115,13 @@ class HdHistoryUpdater(BaseUpdater):
 
                 if not base_value_bytes:
                     # 기본 DB에 해당 키가 없으면 그대로 추가
-                    base_db.put(key_bytes, json.dumps(new_data).encode())
+                    base_db.put_obj(key_bytes, new_data)
                     stats["new_keys_added"] += 1
                 else:
                     # 기존 데이터와 병합
-                    existing_data = json.loads(base_value_bytes)
+                    existing_data = decode(base_value_bytes)
                     merged_data = self._merge_data(existing_data, new_data)
-                    base_db.put(key_bytes, json.dumps(merged_data).encode())
+                    base_db.put_obj(key_bytes, merged_data)
                     stats["updated_keys"] += 1
 
                 # batch_count += 1
@@ -284,8 +285,8 @@ class HdHistoryUpdater(BaseUpdater):
             input_metadata_bytes = input_db.get(b"__metadata__")
 
             if base_metadata_bytes and input_metadata_bytes:
-                base_metadata = json.loads(base_metadata_bytes)
-                input_metadata = json.loads(input_metadata_bytes)
+                base_metadata = decode(base_metadata_bytes)
+                input_metadata = decode(input_metadata_bytes)
 
                 # 메타데이터 병합
                 merged_metadata = base_metadata.copy()
@@ -319,7 +320,7 @@ class HdHistoryUpdater(BaseUpdater):
                 #     merged_metadata["source_dbs"].append(input_path)
 
                 # 메타데이터 저장
-                base_db.put(b"__metadata__", json.dumps(merged_metadata).encode())
+                base_db.put_obj(b"__metadata__", merged_metadata)
 
             elif input_metadata_bytes:
                 # 기본 DB에 메타데이터가 없는 경우 입력 DB의 메타데이터 사용
@@ -393,14 +394,14 @@ class HdHistoryUpdater(BaseUpdater):
                     # 기존 값이 있는지 확인
                     existing_value = db.get(key.encode())
                     if existing_value:
-                        existing_data = json.loads(existing_value)
+                        existing_data = decode(existing_value)
                         if isinstance(existing_data, list):
                             existing_data.append(attr_dict)
                         else:
                             existing_data = [existing_data, attr_dict]
-                        db.put(key.encode(), json.dumps(existing_data).encode())
+                        db.put_obj(key.encode(), existing_data)
                     else:
-                        db.put(key.encode(), json.dumps(attr_dict).encode())
+                        db.put_obj(key.encode(), attr_dict)
 
                     stats["total_geohashes"] += 1
                     batch_count += 1
@@ -439,7 +440,7 @@ class HdHistoryUpdater(BaseUpdater):
                         # 기존 값이 있는지 확인
                         existing_value = db.get(key.encode())
                         if existing_value:
-                            existing_data = json.loads(existing_value)
+                            existing_data = decode(existing_value)
 
                             # 기존 값과 병합
                             equal_data = self._get_equal_data(existing_data, attr_dict)
@@ -453,9 +454,9 @@ class HdHistoryUpdater(BaseUpdater):
                             else:
                                 existing_data = [existing_data, attr_dict]
 
-                            db.put(key.encode(), json.dumps(existing_data).encode())
+                            db.put_obj(key.encode(), existing_data)
                         else:
-                            db.put(key.encode(), json.dumps([attr_dict]).encode())
+                            db.put_obj(key.encode(), [attr_dict])
 
                         stats["total_geohashes"] += 1
                         batch_count += 1
@@ -479,7 +480,7 @@ class HdHistoryUpdater(BaseUpdater):
             }
 
             # 메타데이터 저장
-            db.put(b"__metadata__", json.dumps(metadata).encode())
+            db.put_obj(b"__metadata__", metadata)
 
             self.logger.info(f"Processed {stats['processed_features']} features")
             self.logger.info(f"Generated {stats['total_geohashes']} geohashes")
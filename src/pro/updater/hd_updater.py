@@ -5,6 +5,12 @@ from shapely.geometry import Point
 import glob
 
 from src.geocoder.geocoder import Geocoder
+from src.geocoder.value_layout import (
+    decode_value,
+    encode_value,
+    is_internal_key,
+    is_split,
+)
 from .updater import BaseUpdater
 
 
@@ -202,11 +208,14 @@ class HdUpdater(BaseUpdater):
             if key.startswith("_"):
                 self.geocoder.db.delete(key)
                 continue
+            if is_internal_key(key) or is_split(item[1]):
+                # 레코드 키(주소 키를 고칠 때 새 id로 저장), 인덱스 키, 조각 목록(조각 키를 고침)은 건너뜀
+                continue
 
             try:
                 n += 1
 
-                dic = json.loads(item[1].decode("utf8"))
+                dic = decode_value(item[1], self.geocoder.db)
                 if not dic[0]["x"] or not dic[0]["y"]:
                     continue
 
@@ -225,7 +234,9 @@ class HdUpdater(BaseUpdater):
                         changed = True
 
                 if changed:
-                    self.geocoder.db.put(key, dic)
+                    self.geocoder.db.put(
+                        key, encode_value(dic, put_record=self._put_record())
+                    )
 
                 if n % 100000 == 0:
                     print(f"update {self.name} {n:,} {key}")
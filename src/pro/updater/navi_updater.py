@@ -322,6 +322,8 @@ class NaviUpdater(BaseUpdater):
         self.logger.info(
             f"건물정보 navi {self.yyyymm} {self.name}: {cnt:,} 건, 좌표있는 건물: {has_xy:,} 건. hash 추가: {add_count:,} 건"
         )
+        # 광역시도별 별칭 키 저장 공간 (ALIAS_KEYS)
+        self.log_alias_report()
 
         self.logger.info(f"완료 navi: {self.yyyymm} {self.name}")
         return True
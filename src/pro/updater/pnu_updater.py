@@ -24,6 +24,12 @@ import pyproj
 from packages.Fiona import fiona
 from src.geocoder.geocoder import Geocoder
 from src.geocoder.util.pnumatcher import PNUMatcher
+from src.geocoder.value_layout import (
+    decode_value,
+    encode_value,
+    is_internal_key,
+    is_split,
+)
 from .updater import BaseUpdater
 from .hd_updater import HdUpdater
 from .z_updater import ZUpdater
@@ -237,11 +243,14 @@ class PnuUpdater(BaseUpdater):
         for item in self.geocoder:
             # search
             key = item[0]
+            if is_internal_key(key) or is_split(item[1]):
+                # 레코드 키(주소 키를 고칠 때 새 id로 저장), 인덱스 키, 조각 목록(조각 키를 고침)은 건너뜀
+                continue
 
             try:
                 n += 1
 
-                dic = json.loads(item[1])
+                dic = decode_value(item[1], self.geocoder.db)
                 # ["extras"].get("updater") == "pnu_updater" 를 모두 삭제
                 modified = False
                 for d in list(dic):  # Iterate over a copy of the list
@@ -254,7 +263,9 @@ class PnuUpdater(BaseUpdater):
                         # If the list is empty, delete the key
                         self.geocoder.db.delete(key)
                     else:
-                        self.geocoder.db.put(key, json.dumps(dic))
+                        self.geocoder.db.put(
+                            key, encode_value(dic, put_record=self._put_record())
+                        )
 
                 if n % 100000 == 0:
                     print(f"update {self.name} {n:,} {key}")
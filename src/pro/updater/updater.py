@@ -7,7 +7,10 @@ from src.geocoder.address_cls import AddressCls
 from src.geocoder.geocoder import Geocoder
 from src.geocoder.util.HSimplifier import HSimplifier
 from src.geocoder.util.BldSimplifier import BldSimplifier
+from src.geocoder.util.bld_name_scorer import normalize_bld_name
 from src.geocoder.util.hcodematcher import HCodeMatcher
+from src.geocoder.near_index import has_near_index, near_index_key
+from src.geocoder.value_layout import RecordWriter, decode_value, encode_values
 
 from src.geocoder.pos_cd import *
 
@@ -32,6 +35,11 @@ class DbCreateContext:
         self.bld_nm_text = daddr.get("bld_nm_text", "")
         self.bld_nm = daddr.get("bld_nm", "")
 
+        # 별칭 키 종류 (ALIAS_UNDERGROUND, ALIAS_BLD_NAME). 별칭이 아니면 None
+        self.alias = None
+        # True이면 같은 키의 지하 주소 별칭을 지상 주소로 대체
+        self.replace_alias = False
+
 
 class UpdaterLogFilter(logging.Filter):
     """
@@ -48,6 +56,10 @@ class UpdaterLogFilter(logging.Filter):
 
 CACHE_SIZE = 1000
 
+# 별칭 키 종류 (ALIAS_KEYS)
+ALIAS_UNDERGROUND = "지하"
+ALIAS_BLD_NAME = "건물명"
+
 
 class BaseUpdater:
     JUSO_DATA_DIR = config.JUSO_DATA_DIR
@@ -66,6 +78,25 @@ class BaseUpdater:
 
         self.db_cache = LRUCache(maxsize=CACHE_SIZE)  # LRU 캐시 추가
 
+        # 레코드는 레코드 키에 한 번만 저장 (DEDUP_RECORDS)
+        self.record_writer = None
+        if geocoder and config.DEDUP_RECORDS:
+            self.record_writer = RecordWriter(self.ldb, self.ldb.codec)
+
+        # 광역시도별 별칭 키 저장 공간: {h1_nm: {"keys", "bytes", "records"}}
+        self.alias_stats = {}
+
+        # 새 주소 키의 인근 번호 인덱스 키를 추가 (인덱스를 만든 DB만)
+        self.near_index = bool(
+            geocoder and config.NEAR_INDEX and has_near_index(self.ldb)
+        )
+
+    def _put_record(self, batch=None):
+        """encode_value의 put_record. DEDUP_RECORDS가 아니면 None"""
+        if self.record_writer is None:
+            return None
+        return lambda record: self.record_writer.put(record, batch)
+
     # 캐시된 get 메소드 추가
     def get_cached(self, key):
         """
@@ -82,7 +113,7 @@ class BaseUpdater:
             val = None
             # 값이 있으면 캐시에 저장
             if v is not None:
-                val = json.loads(v.decode())
+                val = decode_value(v, self.ldb)
                 self.db_cache[key] = val
 
             return val
@@ -242,6 +273,9 @@ class BaseUpdater:
             "bld_x": daddr.get("bld_x"),  # /*948429.250775*/
             "bld_y": daddr.get("bld_y"),  # /*1946421.0241*/
         }
+        if bm:
+            # 건물명 유사도 비교용으로 미리 정규화한 건물명
+            val["bmn"] = normalize_bld_name(" ".join(bm))
         if extras:
             val["extras"] = extras
 
@@ -267,27 +301,6 @@ class BaseUpdater:
                 fast_giveup=fast_giveup,
             )
 
-            # 건물 주소
-            if daddr["bld_name_merged"]:
-                add_count += self._merge_bld_address_multi(
-                    [
-                        (
-                            ("h23_nm", "ri_nm", "san", "bng1", "bng2", "bm")
-                            if daddr["ri_nm"]
-                            else ()
-                        ),
-                        ("h23_nm", "ld_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
-                        ("ld_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
-                        (
-                            ("ri_nm", "san", "bng1", "bng2", "bm")
-                            if daddr["ri_nm"]
-                            else ()
-                        ),
-                    ],
-                    merge_if_exists,
-                    batch=batch,
-                )
-
         ## 행정동 번지
         if daddr["hd_nm"] and daddr["bng1"]:
             add_count += self._merge_address_multi(
@@ -306,78 +319,130 @@ class BaseUpdater:
                 fast_giveup=fast_giveup,
             )
 
-            if daddr["bld_name_merged"]:
-                add_count += self._merge_bld_address_multi(
-                    [
-                        (
-                            ("h23_nm", "ri_nm", "san", "bng1", "bng2", "bm")
-                            if daddr["ri_nm"]
-                            else ()
-                        ),
-                        ("h23_nm", "hd_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
-                        ("hd_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
-                        (
-                            ("ri_nm", "san", "bng1", "bng2", "bm")
-                            if daddr["ri_nm"]
-                            else ()
-                        ),
-                    ],
-                    merge_if_exists,
-                    batch=batch,
-                )
-
         # 도로명 주소
         # 길이름 건물번호 (집합건물 아님)
         if daddr.get("road_nm"):  # 도로명 주소
+            # 지상 주소는 같은 키에 먼저 저장된 지하 주소 별칭을 대체
+            self.ctx.replace_alias = (
+                config.ALIAS_KEYS and daddr.get("undgrnd_yn") != "1"
+            )
             add_count += self._merge_address_multi(
+                self._road_keys_list(daddr),
+                merge_if_exists,
+                batch=batch,
+                fast_giveup=fast_giveup,
+            )
+            self.ctx.replace_alias = False
+
+        # 건물명 주소
+        add_count += self._merge_bld_keys(daddr, merge_if_exists, batch=batch)
+
+        # 별칭 키
+        if config.ALIAS_KEYS:
+            add_count += self._merge_alias_keys(daddr, merge_if_exists, batch=batch)
+
+        return add_count
+
+    def _road_keys_list(self, daddr, undgrnd=True):
+        """
+        도로명 주소(길이름 건물번호) 키 목록
+
+        Args:
+            undgrnd (bool): False이면 지하 여부를 뺀 키 (지하 주소 별칭)
+        """
+        keys_list = [
+            ("h23_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2"),
+            (
+                (
+                    "h23_nm",
+                    "ld_nm",
+                    "ri_nm",
+                    "road_nm",
+                    "undgrnd_yn",
+                    "bld1",
+                    "bld2",
+                )
+                if daddr["ld_nm"]
+                else ()
+            ),
+            (
+                (
+                    "h23_nm",
+                    "hd_nm",
+                    "ri_nm",
+                    "road_nm",
+                    "undgrnd_yn",
+                    "bld1",
+                    "bld2",
+                )
+                if daddr["hd_nm"]
+                else ()
+            ),
+            (
+                ("ld_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
+                if daddr["ld_nm"]
+                else ()
+            ),
+            (
+                ("hd_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
+                if daddr["hd_nm"]
+                else ()
+            ),
+            (
+                ("ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
+                if daddr["ri_nm"]
+                else ()
+            ),
+            ("road_nm", "undgrnd_yn", "bld1", "bld2"),
+        ]
+        if undgrnd:
+            return keys_list
+        return [tuple(k for k in keys if k != "undgrnd_yn") for keys in keys_list]
+
+    def _merge_bld_keys(self, daddr, merge_if_exists=True, batch=None):
+        """daddr["bm"] 건물명으로 건물명 주소 키 추가"""
+        add_count = 0
+
+        # 법정동 번지 건물 주소
+        if daddr["ld_nm"] and daddr["bng1"] and daddr["bld_name_merged"]:
+            add_count += self._merge_bld_address_multi(
                 [
-                    ("h23_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2"),
                     (
-                        (
-                            "h23_nm",
-                            "ld_nm",
-                            "ri_nm",
-                            "road_nm",
-                            "undgrnd_yn",
-                            "bld1",
-                            "bld2",
-                        )
-                        if daddr["ld_nm"]
-                        else ()
-                    ),
-                    (
-                        (
-                            "h23_nm",
-                            "hd_nm",
-                            "ri_nm",
-                            "road_nm",
-                            "undgrnd_yn",
-                            "bld1",
-                            "bld2",
-                        )
-                        if daddr["hd_nm"]
+                        ("h23_nm", "ri_nm", "san", "bng1", "bng2", "bm")
+                        if daddr["ri_nm"]
                         else ()
                     ),
+                    ("h23_nm", "ld_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
+                    ("ld_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
                     (
-                        ("ld_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
-                        if daddr["ld_nm"]
+                        ("ri_nm", "san", "bng1", "bng2", "bm")
+                        if daddr["ri_nm"]
                         else ()
                     ),
+                ],
+                merge_if_exists,
+                batch=batch,
+            )
+
+        # 행정동 번지 건물 주소
+        if daddr["hd_nm"] and daddr["bng1"] and daddr["bld_name_merged"]:
+            add_count += self._merge_bld_address_multi(
+                [
                     (
-                        ("hd_nm", "ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
-                        if daddr["hd_nm"]
+                        ("h23_nm", "ri_nm", "san", "bng1", "bng2", "bm")
+                        if daddr["ri_nm"]
                         else ()
                     ),
+                    ("h23_nm", "hd_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
+                    ("hd_nm", "ri_nm", "san", "bng1", "bng2", "bm"),
                     (
-                        ("ri_nm", "road_nm", "undgrnd_yn", "bld1", "bld2")
+                        ("ri_nm", "san", "bng1", "bng2", "bm")
                         if daddr["ri_nm"]
                         else ()
                     ),
-                    ("road_nm", "undgrnd_yn", "bld1", "bld2"),
                 ],
                 merge_if_exists,
                 batch=batch,
-                fast_giveup=fast_giveup,
             )
 
         ## 번지 없는 지번주소 건물. 시군구 + 건물명 hash 생성.
@@ -435,6 +500,66 @@ class BaseUpdater:
 
         return add_count
 
+    def _merge_alias_keys(self, daddr, merge_if_exists=True, batch=None):
+        """
+        별칭 키 추가 (ALIAS_KEYS)
+
+        같은 레코드를 다른 키에도 저장해 possible_hashs()의 추가 조회 없이 첫 조회에서 찾게 합니다.
+        - 지하 주소: "지하"를 빼고 적은 도로명 주소. 같은 키에 지상 주소가 있으면 추가하지 않음
+        - 건물명: 여러 건물명을 합친 건물(bld_reg, bld_nm_text, bld_nm)은 건물명마다 키 추가.
+          BldAddress.hash()는 첫 건물명만 사용하므로 다른 건물명으로는 찾지 못함.
+          여러 건물에 흔한 건물명(is_general_name)은 제외
+        """
+        add_count = 0
+
+        if daddr.get("road_nm") and daddr.get("undgrnd_yn") == "1":
+            self.ctx.alias = ALIAS_UNDERGROUND
+            add_count += self._merge_address_multi(
+                self._road_keys_list(daddr, undgrnd=False), merge_if_exists, batch=batch
+            )
+
+        bld_name_merged = daddr["bld_name_merged"]
+        names = bld_name_merged.split(" ")
+        if len(names) > 1:
+            self.ctx.alias = ALIAS_BLD_NAME
+            for name in names:
+                if self.bldSimplifier.is_general_name(name):
+                    continue
+                daddr["bld_name_merged"] = daddr["bm"] = name
+                add_count += self._merge_bld_keys(daddr, merge_if_exists, batch=batch)
+            daddr["bld_name_merged"] = daddr["bm"] = bld_name_merged
+
+        self.ctx.alias = None
+        return add_count
+
+    def alias_report(self) -> dict:
+        """
+        광역시도별 별칭 키 저장 공간 (ALIAS_KEYS)
+
+        Returns:
+            dict: {h1_nm: {"keys": 별칭으로 만든 키 수, "bytes": 그 키의 크기(bytes),
+                "records": 별칭으로 추가한 레코드 수}}
+        """
+        return {h1_nm: dict(region) for h1_nm, region in self.alias_stats.items()}
+
+    def log_alias_report(self):
+        """광역시도별 별칭 키 저장 공간을 로그로 출력"""
+        report = self.alias_report()
+        if not report:
+            return
+        total = {"keys": 0, "bytes": 0, "records": 0}
+        for h1_nm, region in sorted(report.items()):
+            self.logger.info(
+                f"alias {h1_nm}: {region['keys']:,} keys, {region['bytes']:,} bytes, "
+                f"{region['records']:,} records"
+            )
+            for k in total:
+                total[k] += region[k]
+        self.logger.info(
+            f"alias total: {total['keys']:,} keys, {total['bytes']:,} bytes, "
+            f"{total['records']:,} records"
+        )
+
     def _make_address_string(self, daddr, keys):
         """컬럼값을 조합하여 주소 제작"""
 
@@ -551,7 +676,7 @@ class BaseUpdater:
         return is_xy_fix
 
     def _has_val(self, val0, newval):
-        COMPARE_IGNORE = {"x", "y", "z", "bld_x", "bld_y", "extras", "ld_cd"}
+        COMPARE_IGNORE = {"x", "y", "z", "bld_x", "bld_y", "extras", "ld_cd", "bmn"}
         # bld_mgt_no만 다른 경우가 많다. 건물명이 없는 경우에 한해서 bld_mgt_no를 동등여부 비교에서 제외한다.
         if not newval.get("bm"):
             COMPARE_IGNORE.add("bld_mgt_no")
@@ -767,10 +892,24 @@ class BaseUpdater:
                 )
                 return 0
 
+            alias = self.ctx.alias
+            if alias == ALIAS_UNDERGROUND and any(
+                r.get("undgrnd_yn") != "1" for r in val
+            ):
+                # 지상 주소가 있으면 지하 주소와 구분해야 하므로 별칭을 추가하지 않음
+                return 0
+
+            alias_dropped = False
+            if self.ctx.replace_alias:
+                # 지상 도로명 주소 키의 지하 주소는 모두 별칭
+                ground = [r for r in val if r.get("undgrnd_yn") != "1"]
+                alias_dropped = len(ground) < cur_len
+                val = ground
+
             # 좌표가 없으면 업데이트
             # if not self._has_xy(val) and self.ctx.val["x"]:
             #     do_nothing = 1
-            modified = self._fix_xy(val, self.ctx.val)
+            modified = self._fix_xy(val, self.ctx.val) or alias_dropped
 
             # 없으면 추가
             if val == [] or not self._has_val(val, self.ctx.val):
@@ -782,15 +921,44 @@ class BaseUpdater:
 
             # 캐시 업데이트
             if modified:
-                newval = json.dumps(val).encode("utf8")
-                if batch:
-                    batch.put(key, newval)
-                else:
-                    self.ldb.put(key, newval)
+                # h1_nm별로 나누고 정렬해서 저장. 큰 값은 h1_nm별 조각 키로 나눔 (value_layout)
+                size = 0
+                for put_key, newval in encode_values(
+                    key, val, self.ldb.codec, self._put_record(batch)
+                ):
+                    if batch:
+                        batch.put(put_key, newval)
+                    else:
+                        self.ldb.put(put_key, newval)
+                    size += len(put_key) + len(newval)
                 self.db_cache[key] = val
 
+                if alias:
+                    self._count_alias(cur_len, added, size)
+
+                # 새 주소 키
+                if cur_len == 0 and self.near_index:
+                    index_key = near_index_key(hash)
+                    if index_key is not None:
+                        if batch:
+                            batch.put(index_key, b"")
+                        else:
+                            self.ldb.put(index_key, b"")
+
         return added
 
+    def _count_alias(self, cur_len, added, size):
+        """별칭 키 저장 공간 집계 (alias_report)"""
+        region = self.alias_stats.setdefault(
+            self.ctx.val["h1_nm"], {"keys": 0, "bytes": 0, "records": 0}
+        )
+        if cur_len == 0:
+            # 별칭으로 만든 키. 크기는 만들 때 기준
+            region["keys"] += 1
+            region["bytes"] += size
+        if added:
+            region["records"] += 1
+
     def update_or_append_by_xy(self, val):
         """
         Updates or appends the entry in the database based on the x, y coordinates.
@@ -5,6 +5,12 @@ from shapely.geometry import Point
 import glob
 
 from src.geocoder.geocoder import Geocoder
+from src.geocoder.value_layout import (
+    decode_value,
+    encode_value,
+    is_internal_key,
+    is_split,
+)
 from .updater import BaseUpdater
 
 
@@ -137,8 +143,11 @@ class ZUpdater(BaseUpdater):
         for item in self.geocoder:
             # search
             key = item[0].decode("utf8")
+            if is_internal_key(key) or is_split(item[1]):
+                # 레코드 키(주소 키를 고칠 때 새 id로 저장), 인덱스 키, 조각 목록(조각 키를 고침)은 건너뜀
+                continue
             try:
-                dic = json.loads(item[1].decode("utf8"))
+                dic = decode_value(item[1], self.geocoder.db)
                 if not dic[0]["x"] or not dic[0]["y"]:
                     continue
 
@@ -152,7 +161,9 @@ class ZUpdater(BaseUpdater):
                         changed = True
 
                 if changed:
-                    self.geocoder.db.put(key, dic)
+                    self.geocoder.db.put(
+                        key, encode_value(dic, put_record=self._put_record())
+                    )
 
                 n += 1
                 if n % 100000 == 0:
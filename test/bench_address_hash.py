@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Hasher.addressHash 벤치마크
+
+test/testfiles의 주소로 주소당 addressHash 소요 시간(캐시 사용 안 함)을 측정하고,
+토큰 유형 조회와 hash 계산 단계를 선형 탐색 토큰(Tokens)과 유형 색인 토큰(FrozenTokens)으로 비교합니다.
+
+python -m test.bench_address_hash [주소 파일 ...]
+"""
+
+import sys
+
+import src.config as config
+from src.geocoder.hash.BldAddress import BldAddress
+from src.geocoder.hash.JibunAddress import JibunAddress
+from src.geocoder.hash.RoadAddress import RoadAddress
+from src.geocoder.hasher import Hasher
+from src.geocoder.Tokenizer import Tokenizer
+from src.geocoder.tokens import TOKEN_TYPE_BITS
+from src.geocoder.util.hcodematcher import HCodeMatcher
+from src.geocoder.util.HSimplifier import HSimplifier
+from test.bench_util import address_files, bench, load_addresses
+
+
+def main():
+    filenames = address_files()
+
+    # 토큰화부터 매번 측정
+    config.USE_HASH_CACHE = False
+
+    tokenizer = Tokenizer()
+    hasher = Hasher(
+        tokenizer,
+        JibunAddress(),
+        BldAddress(),
+        RoadAddress(),
+        HSimplifier(),
+        HCodeMatcher(),
+    )
+    addresses = load_addresses(filenames)
+    if not addresses:
+        print("주소가 없습니다.")
+        return 1
+
+    n = len(addresses)
+    print(f"addresses: {n:,} ({', '.join(filenames)})")
+
+    elapsed = bench(hasher.addressHash, addresses)
+    print(f"addressHash: {elapsed / n * 1e6:8.2f} us/address")
+
+    toks_list = [tokenizer.tokenize(address) for address in addresses]
+    frozen_list = [toks.freeze() for toks in toks_list]
+
+    mismatch = sum(
+        hasher.hashTokens(toks) != hasher.hashTokens(frozen)
+        for toks, frozen in zip(toks_list, frozen_list)
+    )
+
+    t_freeze = bench(lambda toks: toks.freeze(), toks_list)
+    t_linear = bench(hasher.hashTokens, toks_list)
+    t_indexed = bench(hasher.hashTokens, frozen_list)
+    print(f"     freeze: {t_freeze / n * 1e6:8.2f} us/address")
+    print(
+        f" hashTokens: {t_linear / n * 1e6:8.2f} -> {t_indexed / n * 1e6:8.2f} us/address "
+        f"({t_linear / t_indexed:.1f}x, 결과 불일치 {mismatch:,})"
+    )
+
+    def type_queries(toks):
+        for t in TOKEN_TYPE_BITS:
+            toks.hasTypes(t)
+            toks.index(t)
+
+    t_linear = bench(type_queries, toks_list)
+    t_indexed = bench(type_queries, frozen_list)
+    print(
+        f"hasTypes+index (유형 {len(TOKEN_TYPE_BITS)}개): "
+        f"{t_linear / n * 1e6:8.2f} -> {t_indexed / n * 1e6:8.2f} us/address "
+        f"({t_linear / t_indexed:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
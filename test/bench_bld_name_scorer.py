@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+건물명 유사도 scorer 벤치마크 및 기존 방식(SequenceMatcher)과의 순위 비교
+
+test/testfiles의 주소에서 Geocoder.most_similar_address와 같은 방법으로 건물명(+동)을 뽑고,
+각 건물명을 나머지 건물명 전체(자기 자신 제외) 중에서 가장 비슷한 것을 찾아
+scorer별 소요 시간과 1순위 일치율, 임계값(0.5) 판정 일치율을 출력합니다.
+
+python -m test.bench_bld_name_scorer [주소 파일 ...]
+"""
+
+import sys
+import time
+
+from src.geocoder.tokens import TOKEN_BLD, TOKEN_BLD_DONG
+from src.geocoder.Tokenizer import Tokenizer
+from src.geocoder.util.bld_name_scorer import (
+    BLD_NAME_SCORERS,
+    get_bld_name_scorer,
+    normalize_bld_name,
+)
+from test.bench_util import address_files, iter_lines
+
+# 쿼리 수 제한 (SequenceMatcher는 후보 수 x 쿼리 수만큼 비교하므로)
+MAX_QUERIES = 500
+# Geocoder.most_similar_address에서 건물주소로 인정하는 유사도
+THRESHOLD = 0.5
+
+
+def load_bld_names(filenames, tokenizer: Tokenizer):
+    names = []
+    seen = set()
+    for line in iter_lines(filenames):
+        toks = tokenizer.tokenize(line)
+        if not toks.hasTypes(TOKEN_BLD):
+            continue
+        begin, end = toks.searchTypeSequence([TOKEN_BLD, TOKEN_BLD_DONG])
+        if begin < 0:
+            begin, end = toks.searchTypeSequence([TOKEN_BLD])
+        name = " ".join(toks.get(n).val for n in range(begin, end))
+        if name and name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def rank(scorer, query, candidates):
+    """Geocoder.find_most_similar_building과 같은 순서 규칙으로 1순위 찾기"""
+    prepared = scorer.prepare(normalize_bld_name(query))
+    best = None
+    best_score = -1
+    for n, name in enumerate(candidates):
+        score = scorer.similarity(prepared, name)
+        if score > best_score:
+            best = n
+            best_score = score
+    return best, best_score
+
+
+def run(scorer, queries, candidates):
+    results = []
+    start = time.perf_counter()
+    for q, exclude in queries:
+        # 자기 자신은 후보에서 제외 (오타 입력 상황 흉내)
+        pool = candidates[:exclude] + candidates[exclude + 1 :]
+        best, score = rank(scorer, q, pool)
+        if best is not None and best >= exclude:
+            best += 1
+        results.append((best, score))
+    return time.perf_counter() - start, results
+
+
+def main():
+    filenames = address_files()
+
+    names = load_bld_names(filenames, Tokenizer())
+    if len(names) < 2:
+        print("건물명이 있는 주소가 없습니다.")
+        return 1
+
+    # 후보 건물명은 DB 빌드 시와 같이 미리 정규화
+    candidates = [normalize_bld_name(name) for name in names]
+    queries = [(name, n) for n, name in enumerate(names[:MAX_QUERIES])]
+
+    print(f"queries: {len(queries):,}, candidates: {len(candidates):,}")
+
+    base_elapsed, base = run(get_bld_name_scorer("sequence"), queries, candidates)
+    per_query = base_elapsed / len(queries) * 1e3
+    print(f"{'sequence':>12}: {per_query:8.3f} ms/query")
+
+    for name in BLD_NAME_SCORERS:
+        if name == "sequence":
+            continue
+        elapsed, results = run(get_bld_name_scorer(name), queries, candidates)
+        same_top = sum(r[0] == b[0] for r, b in zip(results, base))
+        same_pass = sum(
+            (r[1] > THRESHOLD) == (b[1] > THRESHOLD) for r, b in zip(results, base)
+        )
+        n = len(queries)
+        print(
+            f"{name:>12}: {elapsed / n * 1e3:8.3f} ms/query ({base_elapsed / elapsed:.1f}x)"
+            f"  same top-1: {same_top:,}/{n:,}"
+            f"  same >{THRESHOLD}: {same_pass:,}/{n:,}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+HCodeMatcher.search_most_likely_h23_nm 벤치마크
+
+test/testfiles의 주소에서 Geocoder._fix_h23_nm과 같은 방법으로 (h23_nm, h1_cd)를 뽑아
+기존 방식(전체 항목 SequenceMatcher)과 색인 방식의 주소당 소요 시간을 비교합니다.
+
+python -m test.bench_h23_typo [주소 파일 ...]
+"""
+
+import sys
+
+from src.geocoder.tokens import TOKEN_H1, TOKEN_H23
+from src.geocoder.Tokenizer import Tokenizer
+from src.geocoder.util.hcodematcher import HCodeMatcher
+from src.geocoder.util.HSimplifier import HSimplifier
+from test.bench_util import address_files, bench, iter_lines
+
+
+def search_most_likely_h23_nm_linear(matcher: HCodeMatcher, h23_nm, h1_cd):
+    """색인 도입 전의 전체 순회 방식"""
+    if h23_nm:
+        if h23_nm.startswith("세종"):
+            return "세종"
+
+        h23_nm_decomposed = matcher._decompose_korean(h23_nm)
+
+        best_match = ""
+        best_similarity = 0.0
+        for key, data in matcher.h23_search_index.items():
+            if h1_cd and not key.startswith(h1_cd):
+                continue
+
+            similarity = matcher._similarity(
+                data["h23_nm_decomposed"], h23_nm_decomposed
+            )
+            found_h23_nm = data["h23_nm"]
+            if similarity == 1.0:
+                return found_h23_nm
+            if similarity > best_similarity:
+                best_match = found_h23_nm
+                best_similarity = similarity
+
+        return best_match if best_similarity > 0.8 else ""
+    return ""
+
+
+def load_queries(filenames, tokenizer: Tokenizer, hsimplifier: HSimplifier, matcher):
+    queries = []
+    for line in iter_lines(filenames):
+        toks = tokenizer.tokenize(line)
+        h23_pos = toks.index(TOKEN_H23)
+        if h23_pos < 0:
+            continue
+
+        h1_cd = None
+        if h1_nm := toks.get_text(TOKEN_H1):
+            h1_cd = matcher.search_h1_cd(hsimplifier.h1Hash(h1_nm))
+        queries.append((toks.get(h23_pos).val, h1_cd))
+    return queries
+
+
+def main():
+    filenames = address_files()
+
+    matcher = HCodeMatcher()
+    queries = load_queries(filenames, Tokenizer(), HSimplifier(), matcher)
+    if not queries:
+        print("시군구명이 있는 주소가 없습니다.")
+        return 1
+
+    # 색인 생성 시간은 제외
+    for h23_nm, h1_cd in queries:
+        matcher.search_most_likely_h23_nm(h23_nm, h1_cd)
+
+    same = sum(
+        search_most_likely_h23_nm_linear(matcher, h23_nm, h1_cd)
+        == matcher.search_most_likely_h23_nm(h23_nm, h1_cd)
+        for h23_nm, h1_cd in queries
+    )
+
+    linear = bench(
+        lambda h23_nm, h1_cd: search_most_likely_h23_nm_linear(
+            matcher, h23_nm, h1_cd
+        ),
+        queries,
+        unpack=True,
+    )
+    indexed = bench(matcher.search_most_likely_h23_nm, queries, unpack=True)
+
+    n = len(queries)
+    print(f"queries: {n:,} ({', '.join(filenames)})")
+    print(f"linear : {linear / n * 1e6:8.2f} us/address")
+    print(f"indexed: {indexed / n * 1e6:8.2f} us/address ({linear / indexed:.1f}x)")
+    print(f"same result: {same:,}/{n:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
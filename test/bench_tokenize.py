@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tokenizer.tokenize 벤치마크
+
+test/testfiles의 주소로 주소당 tokenize 소요 시간을 측정하고,
+토큰 분류에 쓰는 접두사 검사를 기존 방식(목록 순회)과 합친 방식(trie, 합친 정규식)으로 비교합니다.
+
+python -m test.bench_tokenize [주소 파일 ...]
+"""
+
+import sys
+
+from src.geocoder.Tokenizer import Tokenizer
+from test.bench_util import address_files, bench, load_addresses
+
+
+def first_match(patterns):
+    """기존 방식: 정규식 목록을 순서대로 match"""
+
+    def match(val):
+        for p in patterns:
+            m = p.match(val)
+            if m:
+                return m
+        return None
+
+    return match
+
+
+def main():
+    filenames = address_files()
+
+    tokenizer = Tokenizer()
+    addresses = load_addresses(filenames)
+    if not addresses:
+        print("주소가 없습니다.")
+        return 1
+
+    n = len(addresses)
+    elapsed = bench(tokenizer.tokenize, addresses)
+    print(f"addresses: {n:,} ({', '.join(filenames)})")
+    print(f"tokenize: {elapsed / n * 1e6:8.2f} us/address")
+
+    # 토큰 분류 접두사 검사 비교. 공백으로 나눈 단어와 붙여 쓴 두 단어를 대상으로
+    words = set()
+    for address in addresses:
+        w = address.split()
+        words.update(w)
+        words.update(w[i] + w[i + 1] for i in range(len(w) - 1))
+    words = list(words)
+
+    print(f"\nwords: {len(words):,}")
+    cases = [
+        (
+            "numRoad",
+            lambda v: any(v.startswith(p) for p in tokenizer.numRoadPatterns),
+            tokenizer.numRoadTrie.has_prefix,
+        ),
+        (
+            "h1Prefix",
+            lambda v: next((p for p in tokenizer.h1Prefix if v.startswith(p)), None),
+            tokenizer.h1PrefixTrie.longest_prefix,
+        ),
+        ("h23Prefix", first_match(tokenizer.h23Prefix), tokenizer.re_h23Prefix.match),
+        ("h4Prefix", first_match(tokenizer.h4Prefix), tokenizer.re_h4Prefix.match),
+        (
+            "roadPrefix",
+            first_match(tokenizer.roadPrefix),
+            tokenizer.re_roadPrefix.match,
+        ),
+    ]
+    for name, linear, combined in cases:
+        t_linear = bench(linear, words)
+        t_combined = bench(combined, words)
+        print(
+            f"{name:>10}: {t_linear / len(words) * 1e6:6.2f} -> "
+            f"{t_combined / len(words) * 1e6:6.2f} us/word "
+            f"({t_linear / t_combined:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
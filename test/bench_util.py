@@ -0,0 +1,46 @@
+"""
+벤치마크 스크립트 공통 함수 (test/bench_*.py)
+"""
+
+import glob
+import sys
+import time
+
+
+def address_files():
+    """명령행의 주소 파일. 없으면 test/testfiles/*.txt"""
+    return sys.argv[1:] or sorted(glob.glob("test/testfiles/*.txt"))
+
+
+def iter_lines(filenames):
+    """주소 파일의 빈 줄이 아닌 줄 (앞뒤 공백 제거)"""
+    for filename in filenames:
+        with open(filename, "r", encoding="utf8", errors="ignore") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+
+def load_addresses(filenames):
+    return list(iter_lines(filenames))
+
+
+def bench(func, items, repeat=3, unpack=False):
+    """
+    items 전체에 func를 repeat번 실행한 시간 중 가장 짧은 시간 (초)
+
+    unpack이면 item(tuple)을 인자로 풀어서 호출합니다.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if unpack:
+            for item in items:
+                func(*item)
+        else:
+            for item in items:
+                func(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
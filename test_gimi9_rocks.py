@@ -3,10 +3,35 @@
 gimi9_rocks Cython 확장 테스트
 """
 
+import json
 import os
 import tempfile
 import shutil
-from src.geocoder.db.gimi9_rocks import Gimi9RocksDB, RocksDBError, create_db
+from src.geocoder.db.gimi9_rocks import (
+    Gimi9RocksDB,
+    RocksDBError,
+    block_cache_stats,
+    create_db,
+)
+from src.geocoder.db.key_bloom import build_key_bloom, load_key_bloom
+from src.geocoder.db.value_codec import get_codec
+from src import config
+from src.geocoder.near_index import NEAR_INDEX_MARKER, near_hashs, near_index_key
+from src.geocoder.value_layout import (
+    PartitionedValue,
+    RecordWriter,
+    SplitValue,
+    decode_value,
+    encode_value,
+    encode_values,
+    is_record_key,
+    is_shard_key,
+    load_value,
+    record_counts,
+    record_id,
+    record_key,
+    shard_key,
+)
 
 
 def test_basic_operations():
@@ -66,6 +91,357 @@ def test_create_db_function():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def test_multi_get():
+    """multi_get 테스트"""
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db3")) as db:
+            db.put("key1", "value1")
+            db.put("key2", "한글 값")
+            db.put(b"binary_key", b"binary\x00value")
+
+            values = db.multi_get(["key1", "nonexistent", b"binary_key", "key2"])
+            assert values == [
+                b"value1",
+                None,
+                b"binary\x00value",
+                "한글 값".encode("utf-8"),
+            ]
+            assert db.multi_get([]) == []
+            print("✓ multi_get 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ multi_get 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_get_pinned():
+    """get_pinned 테스트"""
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db4")) as db:
+            db.put("key1", '[{"h1_nm": "서울"}]')
+
+            with db.get_pinned("key1") as pinned:
+                assert len(pinned) == len('[{"h1_nm": "서울"}]'.encode("utf-8"))
+                assert bytes(pinned.view) == bytes(pinned)
+                assert json.loads(pinned.decode()) == [{"h1_nm": "서울"}]
+
+            # 해제 후 view 사용 불가
+            try:
+                pinned.view
+                assert False, "예외가 발생해야 함"
+            except RocksDBError:
+                pass
+
+            assert db.get_pinned("nonexistent") is None
+            print("✓ get_pinned 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ get_pinned 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_key_bloom():
+    """키 bloom filter 테스트"""
+    temp_dir = tempfile.mkdtemp()
+    bloom_path = os.path.join(temp_dir, "test_db5.bloom")
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db5")) as db:
+            for i in range(1000):
+                db.put(f"key{i}", "value")
+
+            keys = list(db.iter_keys())
+            assert len(keys) == 1000
+            build_key_bloom(
+                db.iter_keys(),
+                len(keys),
+                bloom_path,
+                fpr=0.01,
+                db_sequence=db.latest_sequence_number(),
+            )
+
+            key_filter = load_key_bloom(bloom_path, db.latest_sequence_number())
+            assert all(key_filter.may_contain(key) for key in keys)
+            assert sum(key_filter.may_contain(f"none{i}") for i in range(1000)) < 50
+
+            # DB가 바뀌면 필터를 사용하지 않음
+            db.put("new_key", "value")
+            assert load_key_bloom(bloom_path, db.latest_sequence_number()) is None
+            key_filter.close()
+            print("✓ 키 bloom filter 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 키 bloom filter 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_value_codec():
+    """값 codec (format byte로 기존 JSON 값과 함께 읽기) 테스트"""
+    temp_dir = tempfile.mkdtemp()
+    value = [{"h1_nm": "서울", "x": 948430, "bm": ["신길동삼성래미안"]}]
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db8"), codec="compact") as db:
+            db.put("legacy", json.dumps(value))
+            db.put_obj("compact", value)
+
+            assert db.get(b"compact")[0] == 0x01
+            assert len(db.get(b"compact")) < len(db.get(b"legacy"))
+            assert db.get_obj("legacy") == value
+            assert db.get_obj("compact") == value
+            assert db.get_obj("nonexistent") is None
+            assert db.multi_get_obj(["legacy", "nonexistent", "compact"]) == [
+                value,
+                None,
+                value,
+            ]
+
+            db.codec = get_codec("json")
+            db.put_obj("json", value)
+            assert db.get(b"json") == json.dumps(value).encode()
+            print("✓ 값 codec 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 값 codec 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_value_layout():
+    """h1_nm별로 나누고 정렬한 값(value_layout v2) 저장, 조회 테스트"""
+    temp_dir = tempfile.mkdtemp()
+    records = [
+        {"h1_nm": "서울", "x": 1, "extras": {"yyyymm": "202301"}},
+        {"h1_nm": "경기", "x": 2, "extras": {"yyyymm": "202405"}},
+        {"h1_nm": "서울", "x": 3, "extras": {"yyyymm": "202405"}},
+        {"h1_nm": "서울", "x": 4, "extras": {"updater": "roadbase_updater"}},
+    ]
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db7")) as db:
+            db.put("v1", json.dumps(records))
+            db.put("v2", encode_value(records))
+
+            # 기존 형식도 그대로 읽음
+            assert load_value(db.get_string("v1"))[0] == records
+
+            for o in (db.get_string("v2"), db.multi_get(["v2"])[0]):
+                value, _ = load_value(o)
+                assert isinstance(value, PartitionedValue)
+                assert [r["x"] for r in value.select("서울")] == [3, 1, 4]
+                assert [r["x"] for r in value.select("경기")] == [2]
+                assert value.select("부산") == ()
+                assert len(value.select()) == 4
+                assert [r["x"] for r in decode_value(o)] == [3, 2, 1, 4]
+            print("✓ value_layout 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ value_layout 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_record_dedup():
+    """레코드를 레코드 키에 한 번만 저장하고 레코드 id로 참조하는 값 테스트"""
+    temp_dir = tempfile.mkdtemp()
+    records = [
+        {"h1_nm": "서울", "x": 1, "extras": {"yyyymm": "202301"}},
+        {"h1_nm": "경기", "x": 2, "extras": {"yyyymm": "202405"}},
+        {"h1_nm": "서울", "x": 3, "extras": {"yyyymm": "202405"}},
+    ]
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db8")) as db:
+            writer = RecordWriter(db)
+            db.put("a", encode_value(records, put_record=writer.put))
+            db.put("b", encode_value(records[:1], put_record=writer.put))
+
+            # 두 키가 같은 레코드를 참조하므로 레코드는 3개만 저장
+            assert writer.written == 3
+            assert db.get_obj(record_key(record_id(records[0]))) == records[0]
+            assert is_record_key(record_key(record_id(records[0]))) is True
+            assert is_record_key(b"a") is False
+
+            assert load_value(db.get("b"), db)[0] == records[:1]
+            value, size = load_value(db.get("a"), db)
+            assert size > len(db.get("a"))
+            assert [r["x"] for r in value.select("서울")] == [3, 1]
+            assert [r["x"] for r in decode_value(db.get("a"), db)] == [3, 2, 1]
+
+            # 레코드 id를 저장한 값은 db 없이 읽을 수 없음
+            try:
+                decode_value(db.get("b"))
+                assert False, "ValueError가 발생해야 합니다"
+            except ValueError:
+                pass
+            print("✓ 레코드 참조 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 레코드 참조 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_split_value():
+    """후보가 많은 값을 h1_nm별 조각 키로 나눠 저장, 조회 테스트"""
+    temp_dir = tempfile.mkdtemp()
+    records = [
+        {"h1_nm": "서울" if i % 3 else "경기", "x": i, "extras": {}}
+        for i in range(max(config.SPLIT_VALUE_MIN_RECORDS, 2))
+    ]
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db9")) as db:
+            items = encode_values("big", records)
+            for key, value in items:
+                db.put(key, value)
+
+            if config.SPLIT_VALUE_MIN_RECORDS > 0:
+                # 조각 키 2개 + 조각 목록
+                assert len(items) == 3
+                assert is_shard_key(items[0][0]) and not is_shard_key("big")
+
+                value, _ = load_value(db.get("big"))
+                assert isinstance(value, SplitValue)
+                assert value.shard_keys("서울") == [shard_key("big", "서울")]
+                assert value.shard_keys("부산") == []
+                assert record_counts(db.get("big")) == {
+                    "경기": len([r for r in records if r["h1_nm"] == "경기"]),
+                    "서울": len([r for r in records if r["h1_nm"] == "서울"]),
+                }
+
+            assert sorted(r["x"] for r in decode_value(db.get("big"), db)) == list(
+                range(len(records))
+            )
+            print("✓ 조각 키 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 조각 키 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_near_index():
+    """인근 번호 인덱스 seek 테스트"""
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        with Gimi9RocksDB(os.path.join(temp_dir, "test_db10")) as db:
+            for hash in [
+                "원동_8-0",
+                "원동_10-0",
+                "원동_10-2",
+                "원동_10-9",
+                "원동_13-0",
+                "원동_900-0",
+                "원동_산10-0",
+            ]:
+                db.put(near_index_key(hash), b"")
+            db.put(NEAR_INDEX_MARKER, "{}")
+
+            assert near_index_key("원동_10") is None
+            assert near_index_key("원동_10-0") < near_index_key("원동_13-0")
+
+            keys = db.seek_keys(near_index_key("원동_11-0"), 2)
+            assert keys[0] == near_index_key("원동_13-0").encode("utf-8")
+            keys = db.seek_keys(near_index_key("원동_11-0"), 1, reverse=True)
+            assert keys == [near_index_key("원동_10-2").encode("utf-8")]
+
+            # 부번이 있으면 같은 주번만 (부번 차이 4 이내). 산 번지는 제외
+            assert [h for h, _ in near_hashs(db, "원동_10-1")] == [
+                "원동_10-0",
+                "원동_10-2",
+            ]
+            # 부번이 없으면 같은 주번의 부번, 그 다음 주번 차이 순. 멀리 떨어진 번호는 제외
+            assert [h for h, _ in near_hashs(db, "원동_11")] == [
+                "원동_10-0",
+                "원동_13-0",
+                "원동_8-0",
+            ]
+            assert [h for h, _ in near_hashs(db, "원동_10")] == [
+                "원동_10-2",
+                "원동_10-9",
+                "원동_8-0",
+                "원동_13-0",
+            ]
+            assert near_hashs(db, "원동_500") == []
+            # 도로명은 홀짝이 같은 주번만. 부번 차이는 10 이내
+            assert [h for h, _ in near_hashs(db, "원동_12", road=True)] == [
+                "원동_10-0",
+                "원동_8-0",
+            ]
+            assert [h for h, _ in near_hashs(db, "원동_10-1", road=True)] == [
+                "원동_10-0",
+                "원동_10-2",
+                "원동_10-9",
+            ]
+
+            # 이웃 주번에 부번이 많아도 가까운 주번을 찾음
+            mains = ["신동_120-0", "신동_121-0", "신동_122-0", "신동_124-0", "신동_125-0"]
+            for hash in mains:
+                db.put(near_index_key(hash), b"")
+            for n in range(1, 31):
+                db.put(near_index_key(f"신동_122-{n}"), b"")
+                db.put(near_index_key(f"신동_124-{n}"), b"")
+            assert sorted(h for h, _ in near_hashs(db, "신동_123", limit=10)) == mains
+            assert [h for h, _ in near_hashs(db, "신동_123", road=True)] == [
+                "신동_121-0",
+                "신동_125-0",
+            ]
+            print("✓ 인근 번호 인덱스 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 인근 번호 인덱스 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_open_profile():
+    """역할별 옵션 프로파일 테스트"""
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        db1 = Gimi9RocksDB(os.path.join(temp_dir, "geocode"), role="geocode")
+        db2 = Gimi9RocksDB(os.path.join(temp_dir, "bigcache"), role="bigcache")
+
+        assert db1.effective_options["profile"] == "serving"
+        assert db1.effective_options["cache_index_and_filter_blocks"]
+        assert db2.effective_options["profile"] == "write"
+
+        db1.put("key", "value")
+        db2.put("key", "value")
+        assert db1.get_string("key") == "value"
+        assert db2.get_string("key") == "value"
+
+        # 두 DB가 하나의 블록 캐시를 공유
+        assert block_cache_stats()["capacity"] > 0
+
+        db1.close()
+        db2.close()
+        print("✓ 옵션 프로파일 테스트 통과")
+
+    except Exception as e:
+        print(f"✗ 옵션 프로파일 테스트 실패: {e}")
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def test_error_handling():
     """오류 처리 테스트"""
     try:
@@ -90,6 +466,15 @@ if __name__ == "__main__":
     try:
         test_basic_operations()
         test_create_db_function()
+        test_multi_get()
+        test_get_pinned()
+        test_key_bloom()
+        test_value_codec()
+        test_value_layout()
+        test_record_dedup()
+        test_split_value()
+        test_near_index()
+        test_open_profile()
         test_error_handling()
         print("\n🎉 모든 테스트 통과!")
 